@@ -3,46 +3,125 @@ Flask HTML URL Analyzer - 깔끔한 HTML 인터페이스
 기존 main.py의 URLAnalyzer를 Flask로 서빙
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
 from flask_cors import CORS
 import json
+import os
+import tempfile
 from datetime import datetime
 import threading
 import time
 
 # main.py에서 URLAnalyzer import
 from main import URLAnalyzer
+from result_cache import ResultCache
+from politeness import HostScheduler
+from origin_cache import OriginCache
+from result_store import ResultStore
+from browser_pool import BrowserPool
+from page_weight import AssetCache
+from job_queue import JobQueue, QueueFullError, FINISHED_STATUSES, DONE, FAILED
 
 app = Flask(__name__)
 CORS(app)
 
+# 결과 캐시 설정
+CACHE_TTL = 600            # 결과 유효 시간(초)
+CACHE_MAX_ENTRIES = 1000   # 메모리에 보관할 최대 결과 수
+CACHE_DB_PATH = None       # 예: 'analysis_cache.db' - 지정하면 재시작 후에도 캐시 유지
+REVALIDATION_TTL = 7 * 24 * 3600  # ETag/Last-Modified 재검증 정보 보관 시간(초)
+
+# 페이지 본문 읽기 예산 - 초과하면 받은 부분까지만 분석 (basic_info.truncated로 표시)
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+MAX_PAGE_SECONDS = 20
+
+# 호스트별 요청 속도 제한 - 한 분석이 같은 호스트에 보내는 요청(페이지, robots.txt, 성능 측정 등)은 버스트로 허용
+POLITENESS_RATE = 2.0          # 호스트당 초당 요청 수
+POLITENESS_BURST = 10          # 호스트당 한 번에 보낼 수 있는 요청 수
+MAX_CONCURRENT_REQUESTS = 64   # 모든 호스트를 합친 동시 요청 수
+POLITENESS_MAX_HOSTS = 10000   # 상태를 보관할 최대 호스트 수 (넘으면 대기할 것이 없는 오래된 호스트부터 제거)
+
+# 출처(사이트) 단위 정보 캐시 - 같은 사이트의 페이지들이 robots.txt/sitemap/DNS/TLS 결과를 공유
+ORIGIN_CACHE_TTLS = {'robots': 3600, 'sitemap': 3600, 'dns': 300, 'tls': 3600}
+ORIGIN_CACHE_MAX_ORIGINS = 1000
+
+# 분석 이력 저장소 - 예: 'analysis_history' 디렉터리를 지정하면 결과를 날짜별 파일에 쌓고 /api/history로 조회
+RESULT_STORE_DIR = None
+
+# 렌더 모드 - 헤드리스 브라우저로 스크립트 실행 후의 DOM을 분석하고 실제 탐색 시간(FCP, load)을 측정
+RENDER_BROWSERS = 0            # 미리 띄워 둘 브라우저 수 (0이면 렌더 모드 사용 안 함, selenium과 브라우저 필요)
+RENDER_MAX_PAGES = 50          # 브라우저 하나가 처리한 뒤 새로 띄울 페이지 수
+RENDER_DRIVER_PATH = None      # 예: '/usr/bin/chromedriver' - 지정하지 않으면 PATH에서 찾음
+
+# 페이지 무게 분석 - 스크립트/스타일시트/이미지를 HEAD로 확인하고 결과를 자원 URL별로 캐시해 같은 사이트의 페이지들이 공유
+ASSET_CACHE_TTL = 3600         # 자원 확인 결과 유효 시간(초)
+ASSET_CACHE_MAX_ENTRIES = 20000
+ASSET_PROBE_WORKERS = 8        # 페이지 하나에서 동시에 확인할 자원 수
+MAX_ASSET_PROBES = 100         # 페이지당 확인할 최대 자원 수
+ASSET_PROBE_BUDGET = 20        # 자원 확인 전체 시간 예산(초) - 분석 단계 시간 제한보다 짧게
+
 # 전역 analyzer 인스턴스
-analyzer = URLAnalyzer()
+analyzer = URLAnalyzer(
+    cache=ResultCache(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, db_path=CACHE_DB_PATH),
+    revalidation_cache=ResultCache(ttl=REVALIDATION_TTL, max_entries=CACHE_MAX_ENTRIES, db_path=CACHE_DB_PATH),
+    max_page_bytes=MAX_PAGE_BYTES,
+    max_page_seconds=MAX_PAGE_SECONDS,
+    scheduler=HostScheduler(rate=POLITENESS_RATE, burst=POLITENESS_BURST, max_concurrency=MAX_CONCURRENT_REQUESTS,
+                            max_hosts=POLITENESS_MAX_HOSTS),
+    origin_cache=OriginCache(ttls=ORIGIN_CACHE_TTLS, max_origins=ORIGIN_CACHE_MAX_ORIGINS),
+    result_store=ResultStore(RESULT_STORE_DIR) if RESULT_STORE_DIR else None,
+    browser_pool=BrowserPool(size=RENDER_BROWSERS, max_pages=RENDER_MAX_PAGES,
+                             driver_path=RENDER_DRIVER_PATH) if RENDER_BROWSERS else None,
+    asset_cache=AssetCache(ttl=ASSET_CACHE_TTL, max_entries=ASSET_CACHE_MAX_ENTRIES),
+    asset_workers=ASSET_PROBE_WORKERS,
+    max_assets=MAX_ASSET_PROBES,
+    asset_budget=ASSET_PROBE_BUDGET
+)
+
+# 배치 분석 동시성 상한
+BATCH_MAX_WORKERS = 16
+BATCH_MAX_PER_HOST = 4
+
+# 사이트 크롤링 한도 - 크롤링은 작업 큐에서 실행하고 /api/jobs/<id>로 결과 조회
+CRAWL_MAX_DEPTH = 5
+CRAWL_MAX_PAGES = 500
+CRAWL_MAX_WORKERS = 8
+
+# 작업 큐 설정 - 분석은 백그라운드 작업자에서 실행하고 대기열이 가득 차면 429 응답
+JOB_MAX_WORKERS = 4        # 동시에 실행할 분석 수
+JOB_MAX_PENDING = 32       # 실행을 기다릴 수 있는 분석 수
+JOB_RESULT_TTL = 600       # 끝난 작업 결과 보관 시간(초)
+JOB_MAX_WAIT = 30          # 롱 폴링 최대 대기 시간(초)
+jobs = JobQueue(max_workers=JOB_MAX_WORKERS, max_pending=JOB_MAX_PENDING, result_ttl=JOB_RESULT_TTL)
+
+# 운영 서버(waitress) 설정 - 작업 큐가 프로세스 안에 있으므로 한 프로세스의 스레드로 동시 요청 처리
+# (여러 프로세스로 늘리면 프로세스마다 큐가 생겨 JOB_MAX_WORKERS 한도가 전체에 적용되지 않음 - 분석 동시성은 큐에서 조절)
+SERVER_HOST = '0.0.0.0'
+SERVER_PORT = 5000
+SERVER_THREADS = 16
 
 @app.route('/')
 def index():
     """메인 페이지"""
     return render_template('index.html')
 
-@app.route('/api/analyze', methods=['POST'])
-def analyze_url():
-    """URL 분석 API"""
-    try:
-        data = request.get_json()
-        url = data.get('url', '').strip()
-        analysis_type = data.get('analysis_type', '전체 분석')
-        
-        if not url or not url.startswith(('http://', 'https://')):
-            return jsonify({
-                'success': False,
-                'error': '올바른 URL을 입력해주세요 (http:// 또는 https://로 시작)'
-            })
-        
-        # 분석 실행
-        if analysis_type == '빠른 분석':
-            # 기본 정보와 성능만 분석
-            basic_info = analyzer.get_basic_info(url)
+def validate_url(url):
+    """분석할 수 있는 URL이면 None, 아니면 오류 메시지"""
+    if not url or not url.startswith(('http://', 'https://')):
+        return '올바른 URL을 입력해주세요 (http:// 또는 https://로 시작)'
+    return None
+
+def iter_analysis(url, analysis_type='전체 분석', force_refresh=False):
+    """분석 섹션을 준비되는 대로 (섹션 이름, 결과)로 반환하고,
+    마지막에 ('complete', API 응답 본문(results, dashboard_data, summary))을 반환"""
+    if analysis_type == '빠른 분석':
+        # 기본 정보와 성능만 분석
+        results = None if force_refresh else analyzer.cache.get(url, 'quick')
+        if results is None:
+            basic_info = analyzer.get_basic_info(url, force_refresh=force_refresh)
+            yield 'basic_info', basic_info
             performance = analyzer.measure_performance(url)
+            yield 'performance', performance
             
             results = {
                 'url': url,
@@ -50,34 +129,335 @@ def analyze_url():
                 'performance': performance,
                 'timestamp': datetime.now().isoformat()
             }
+            if 'error' not in basic_info and 'error' not in performance:
+                analyzer.cache.set(url, 'quick', results)
         else:
-            # 전체 분석
-            results = analyzer.analyze_url(url)
-        
-        # 대시보드용 데이터 생성
-        dashboard_data = analyzer.create_dashboard_data(results)
-        
-        return jsonify({
-            'success': True,
-            'results': results,
-            'dashboard_data': dashboard_data,
-            'summary': generate_summary_data(results)
-        })
-        
-    except Exception as e:
+            yield 'basic_info', results['basic_info']
+            yield 'performance', results['performance']
+    else:
+        # 전체 분석 - 단계가 끝나는 순서대로 전달
+        for section, result in analyzer.analyze_url_iter(url, force_refresh=force_refresh):
+            if section == 'results':
+                results = result
+            else:
+                yield section, result
+    
+    # 대시보드용 데이터 생성
+    dashboard_data = analyzer.create_dashboard_data(results)
+    
+    yield 'complete', {
+        'success': True,
+        'results': results,
+        'dashboard_data': dashboard_data,
+        'summary': generate_summary_data(results)
+    }
+
+def queue_full_response(e):
+    """작업 대기열이 가득 찼을 때의 429 응답 (Retry-After: 대기열이 비워지기까지 예상 시간)"""
+    response = jsonify({'success': False, 'error': str(e), 'retry_after': e.retry_after})
+    response.status_code = 429
+    response.headers['Retry-After'] = str(e.retry_after)
+    return response
+
+def accepted_job_response(job_id):
+    """작업 등록 응답 (202, Location: 작업 상태 조회 주소)"""
+    status_url = f'/api/jobs/{job_id}'
+    response = jsonify({
+        'success': True,
+        'job_id': job_id,
+        'status_url': status_url,
+        'events_url': f'{status_url}/events'
+    })
+    response.status_code = 202
+    response.headers['Location'] = status_url
+    return response
+
+def submit_analysis_job():
+    """요청 본문의 URL 분석 작업을 큐에 등록하고 202 응답 (잘못된 URL은 400, 대기열이 가득 차면 429)"""
+    data = request.get_json(silent=True) or {}
+    url = data.get('url', '').strip()
+    error = validate_url(url)
+    if error:
+        return jsonify({'success': False, 'error': error}), 400
+    
+    try:
+        job_id = jobs.submit_stream(iter_analysis, url, data.get('analysis_type', '전체 분석'),
+                                    bool(data.get('force_refresh', False)))
+    except QueueFullError as e:
+        return queue_full_response(e)
+    
+    return accepted_job_response(job_id)
+
+@app.route('/api/analyze', methods=['POST'])
+def analyze_url():
+    """URL 분석 API - 작업 id를 바로 반환하고 결과는 /api/jobs/<id>로 조회 (/api/jobs와 같음)"""
+    return submit_analysis_job()
+
+@app.route('/api/jobs', methods=['POST'])
+def submit_job():
+    """분석 작업 등록 API - 작업 id를 바로 반환 (대기열이 가득 차면 429)"""
+    return submit_analysis_job()
+
+@app.route('/api/jobs/<job_id>')
+def get_job(job_id):
+    """작업 상태/결과 조회 API (?wait=초 - 작업이 끝날 때까지 최대 그 시간만큼 대기)"""
+    try:
+        wait = min(max(float(request.args.get('wait', 0)), 0), JOB_MAX_WAIT)
+    except ValueError:
+        wait = 0
+    
+    job = jobs.get(job_id, wait=wait)
+    if job is None:
+        return jsonify({'success': False, 'error': '작업을 찾을 수 없습니다 (만료되었거나 잘못된 id)'}), 404
+    
+    body = {
+        'success': job['status'] != FAILED,
+        'job_id': job_id,
+        'status': job['status'],
+        'position': job['position'],
+        'finished': job['status'] in FINISHED_STATUSES
+    }
+    if job['status'] == DONE:
+        body.update(job['result'])
+    elif job['error']:
+        body['error'] = f"분석 중 오류 발생: {job['error']}"
+    return jsonify(body)
+
+@app.route('/api/jobs/<job_id>/events')
+def job_events(job_id):
+    """작업 진행 상황 스트림 API (Server-Sent Events)
+    
+    section: 분석 섹션 하나가 끝날 때마다 {section, result, summary(지금까지의 요약)}
+    complete: 모든 분석이 끝나면 /api/analyze와 같은 응답 본문
+    failed: 작업이 실패하면 {error}
+    Last-Event-ID 헤더로 재연결하면 놓친 이벤트부터 다시 전송
+    """
+    if jobs.get(job_id) is None:
+        return jsonify({'success': False, 'error': '작업을 찾을 수 없습니다 (만료되었거나 잘못된 id)'}), 404
+    try:
+        sent = int(request.headers.get('Last-Event-ID', 0))
+    except ValueError:
+        sent = 0
+    
+    def sse(event, data, event_id=None):
+        lines = [f'event: {event}']
+        if event_id is not None:
+            lines.append(f'id: {event_id}')
+        lines.append('data: ' + json.dumps(data, ensure_ascii=False, default=str))
+        return '\n'.join(lines) + '\n\n'
+    
+    def generate():
+        index = sent
+        sections = {}
+        while True:
+            update = jobs.events(job_id, after=index, wait=JOB_MAX_WAIT)
+            if update is None:
+                yield sse('failed', {'error': '작업이 만료되었습니다'})
+                return
+            events, status = update
+            if not events and status not in FINISHED_STATUSES:
+                # 연결 유지용 주석
+                yield ': keep-alive\n\n'
+                continue
+            for event, data in events:
+                index += 1
+                if event == 'complete':
+                    yield sse('complete', data, index)
+                else:
+                    sections[event] = data
+                    yield sse('section', {'section': event, 'result': data,
+                                          'summary': generate_summary_data(sections)}, index)
+            # 이벤트는 작업이 끝나기 전에 모두 기록되므로 끝난 상태면 더 받을 이벤트가 없음
+            if status in FINISHED_STATUSES:
+                if status == FAILED:
+                    job = jobs.get(job_id) or {}
+                    yield sse('failed', {'error': f"분석 중 오류 발생: {job.get('error')}"})
+                return
+    
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+@app.route('/api/jobs/stats')
+def job_stats():
+    """작업 큐 상태 API"""
+    return jsonify({'success': True, 'stats': jobs.stats()})
+
+@app.route('/api/pool/stats')
+def pool_stats():
+    """HTTP 연결 풀, 호스트별 속도 제한, 출처 캐시, 자원 캐시 상태 API"""
+    return jsonify({'success': True, 'stats': analyzer.pool_stats(), 'politeness': analyzer.scheduler.stats(),
+                    'origin_cache': analyzer.origin_cache.stats(), 'asset_cache': analyzer.asset_cache.stats()})
+
+@app.route('/api/analyze/batch', methods=['POST'])
+def analyze_batch():
+    """여러 URL 일괄 분석 API - 끝나는 순서대로 NDJSON 한 줄씩 스트리밍"""
+    data = request.get_json(silent=True) or {}
+    
+    # JSON의 urls 목록 또는 업로드된 파일(한 줄에 URL 하나)
+    upload = request.files.get('file')
+    options = request.form if upload else data
+    
+    if not upload:
+        urls = data.get('urls')
+        # urls는 문자열 목록만 허용 (문자열 하나는 서버에서 파일 경로로 해석될 수 있으므로 거부)
+        if not isinstance(urls, list) or not urls:
+            return jsonify({
+                'success': False,
+                'error': '분석할 URL 목록(urls) 또는 파일(file)을 전달해주세요'
+            }), 400
+        for url in urls:
+            error = validate_url(url.strip()) if isinstance(url, str) else '각 URL은 문자열이어야 합니다'
+            if error:
+                return jsonify({'success': False, 'url': url, 'error': error}), 400
+    
+    try:
+        max_workers = min(int(options.get('max_workers', 8)), BATCH_MAX_WORKERS)
+        per_host_limit = min(int(options.get('per_host_limit', 2)), BATCH_MAX_PER_HOST)
+        force_refresh = str(options.get('force_refresh', '')).lower() in ('1', 'true', 'yes')
+    except (TypeError, ValueError):
         return jsonify({
             'success': False,
-            'error': f'분석 중 오류 발생: {str(e)}'
-        })
+            'error': 'max_workers와 per_host_limit는 정수여야 합니다'
+        }), 400
+    
+    # 업로드 스트림은 응답 전에 닫히므로 임시 파일에 저장한 뒤 한 줄씩 읽는다
+    urls_file = None
+    if upload:
+        fd, urls_file = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(fd, 'wb') as f:
+            upload.save(f)
+        urls = None
+    
+    # 일괄 분석 하나를 작업 하나로 큐에 등록 (대기열이 가득 차면 429)
+    try:
+        job_id = jobs.submit_stream(iter_batch, urls, urls_file, max_workers, per_host_limit, force_refresh)
+    except QueueFullError as e:
+        if urls_file:
+            os.remove(urls_file)
+        return queue_full_response(e)
+    
+    def generate():
+        index = 0
+        while True:
+            update = jobs.events(job_id, after=index, wait=JOB_MAX_WAIT)
+            if update is None:
+                yield json.dumps({'success': False, 'error': '일괄 분석 작업이 만료되었습니다'}, ensure_ascii=False) + '\n'
+                return
+            events, status = update
+            for event, line in events:
+                index += 1
+                yield json.dumps(line, ensure_ascii=False, default=str) + '\n'
+            if status in FINISHED_STATUSES:
+                if status == FAILED:
+                    job = jobs.get(job_id) or {}
+                    yield json.dumps({'success': False, 'error': f"분석 중 오류 발생: {job.get('error')}"},
+                                     ensure_ascii=False) + '\n'
+                return
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+def iter_batch(urls, urls_file, max_workers, per_host_limit, force_refresh):
+    """일괄 분석 작업 - URL 분석이 끝날 때마다 ('result', NDJSON 한 줄의 데이터)"""
+    try:
+        for results in analyzer.analyze_many(urls, max_workers=max_workers, per_host_limit=per_host_limit,
+                                              force_refresh=force_refresh, urls_file=urls_file):
+            if 'error' in results:
+                line = {'success': False, 'url': results['url'], 'error': results['error']}
+            else:
+                line = {'success': True, 'results': results, 'summary': generate_summary_data(results)}
+            yield 'result', line
+    finally:
+        if urls_file:
+            os.remove(urls_file)
+
+def run_crawl(url, max_depth, max_pages, max_workers, use_sitemap, force_refresh):
+    """사이트를 크롤링해 사이트 리포트와 페이지별 요약 반환 (전체 결과는 크기가 커서 제외)"""
+    crawl = analyzer.crawl(url, max_depth=max_depth, max_pages=max_pages, max_workers=max_workers,
+                           use_sitemap=use_sitemap, force_refresh=force_refresh)
+    pages = []
+    for page in crawl['pages']:
+        results = page['results']
+        if 'error' in results:
+            pages.append({'url': page['url'], 'depth': page['depth'], 'error': results['error']})
+        else:
+            pages.append(dict(generate_summary_data(results), url=page['url'], depth=page['depth']))
+    return {'success': True, 'report': crawl['report'], 'pages': pages}
+
+@app.route('/api/crawl', methods=['POST'])
+def submit_crawl():
+    """사이트 크롤링 작업 등록 API - 작업 id를 바로 반환하고 결과는 /api/jobs/<id>로 조회"""
+    data = request.get_json(silent=True) or {}
+    url = data.get('url', '').strip()
+    error = validate_url(url)
+    if error:
+        return jsonify({'success': False, 'error': error}), 400
+    
+    try:
+        max_depth = min(int(data.get('max_depth', 3)), CRAWL_MAX_DEPTH)
+        max_pages = min(int(data.get('max_pages', 100)), CRAWL_MAX_PAGES)
+        max_workers = min(int(data.get('max_workers', 4)), CRAWL_MAX_WORKERS)
+    except (TypeError, ValueError):
+        return jsonify({'success': False, 'error': 'max_depth, max_pages, max_workers는 정수여야 합니다'}), 400
+    
+    try:
+        job_id = jobs.submit(run_crawl, url, max_depth, max_pages, max_workers,
+                             bool(data.get('use_sitemap', True)), bool(data.get('force_refresh', False)))
+    except QueueFullError as e:
+        return queue_full_response(e)
+    
+    return jsonify({'success': True, 'job_id': job_id, 'status_url': f'/api/jobs/{job_id}'}), 202
+
+def history_query(query):
+    """이력 조회 API 공통 처리 - 저장소가 꺼져 있거나 인자가 잘못되면 오류 응답"""
+    if analyzer.result_store is None:
+        return jsonify({'success': False, 'error': '분석 이력 저장소가 설정되지 않았습니다 (RESULT_STORE_DIR)'}), 404
+    try:
+        days = int(request.args['days']) if 'days' in request.args else None
+        hosts = [host for host in request.args.get('hosts', '').split(',') if host] or None
+        return jsonify({'success': True, 'result': query(days=days, hosts=hosts,
+                                                         since=request.args.get('since'),
+                                                         until=request.args.get('until'))})
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+@app.route('/api/history/summary')
+def history_summary():
+    """지표의 그룹별 개수/평균/최소/최대 API (?metric=&by=host|date|url&days=&hosts=a,b)"""
+    def query(**window):
+        return analyzer.result_store.summarize(request.args.get('metric', 'performance_score'),
+                                               by=request.args.get('by', 'host'), **window)
+    return history_query(query)
+
+@app.route('/api/history/percentiles')
+def history_percentiles():
+    """지표의 그룹별 백분위수 API (?metric=avg_response_time&by=host&points=50,95&days=30)"""
+    def query(**window):
+        points = tuple(int(point) for point in request.args.get('points', '50,95').split(','))
+        return analyzer.result_store.percentiles(request.args.get('metric', 'avg_response_time'),
+                                                 by=request.args.get('by', 'host'), points=points, **window)
+    return history_query(query)
+
+@app.route('/api/history/drops')
+def history_drops():
+    """지표가 떨어진 페이지 API (?metric=performance_score&min_drop=5&baseline=previous|first&days=30)"""
+    def query(**window):
+        return analyzer.result_store.score_drops(request.args.get('metric', 'performance_score'),
+                                                 min_drop=float(request.args.get('min_drop', 0)),
+                                                 baseline=request.args.get('baseline', 'previous'),
+                                                 limit=int(request.args.get('limit', 100)), **window)
+    return history_query(query)
 
 @app.route('/api/quick-test/<path:test_url>')
 def quick_test(test_url):
-    """빠른 테스트 API"""
+    """빠른 테스트 API (?force_refresh=1이면 캐시 무시)"""
     try:
         if not test_url.startswith(('http://', 'https://')):
             test_url = 'https://' + test_url
+        force_refresh = request.args.get('force_refresh', '').lower() in ('1', 'true', 'yes')
             
-        basic_info = analyzer.get_basic_info(test_url)
+        basic_info = analyzer.get_basic_info(test_url, force_refresh=force_refresh)
         
         return jsonify({
             'success': True,
@@ -96,6 +476,7 @@ def generate_summary_data(results):
     """요약 데이터 생성"""
     basic = results.get('basic_info', {})
     performance = results.get('performance', {})
+    page_weight = results.get('page_weight', {})
     seo = results.get('seo_analysis', {})
     content = results.get('content_analysis', {})
     security = results.get('security_analysis', {})
@@ -110,6 +491,9 @@ def generate_summary_data(results):
         'server': basic.get('server', 'N/A'),
         'performance_score': round(performance.get('performance_score', 0), 1),
         'avg_response_time': round(performance.get('avg_response_time', 0), 2),
+        'page_weight': page_weight.get('total_bytes', 0),
+        'asset_count': page_weight.get('asset_count', 0),
+        'critical_path_time': page_weight.get('critical_path', {}).get('estimated_time', 0),
         'internal_links': seo.get('links', {}).get('internal_count', 0),
         'external_links': seo.get('links', {}).get('external_count', 0),
         'total_images': seo.get('images', {}).get('total_images', 0),
@@ -120,10 +504,22 @@ def generate_summary_data(results):
         'https_enabled': security.get('https', False),
         'security_headers': len([h for h in security.get('security_headers', {}).values() if h]),
         'mobile_friendly': mobile.get('mobile_friendly_score', 0) if mobile else 0,
-        'viewport_meta': mobile.get('viewport_meta', False) if mobile else False
+        'viewport_meta': mobile.get('viewport_meta', False) if mobile else False,
+        'revalidated': results.get('revalidation', {}).get('revalidated', False)
     }
 
 if __name__ == '__main__':
+    import sys
     print("🚀 Flask URL Analyzer 시작...")
-    print("📱 http://localhost:5000 에서 확인하세요!")
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    print(f"📱 http://localhost:{SERVER_PORT} 에서 확인하세요!")
+    if '--dev' in sys.argv:
+        # 개발 모드 - 자동 재시작과 디버거 사용
+        app.run(debug=True, host=SERVER_HOST, port=SERVER_PORT)
+    else:
+        try:
+            from waitress import serve
+        except ImportError:
+            print("waitress가 설치되지 않아 Flask 내장 서버로 실행합니다 (pip install waitress)")
+            app.run(host=SERVER_HOST, port=SERVER_PORT, threaded=True)
+        else:
+            serve(app, host=SERVER_HOST, port=SERVER_PORT, threads=SERVER_THREADS)
\ No newline at end of file
@@ -0,0 +1,731 @@
+"""
+비동기 URL 분석 엔진 - 하나의 이벤트 루프에서 수많은 분석을 동시에 처리
+pip install aiohttp (선택: aiodns)
+
+URLAnalyzer와 같은 분석 메서드와 결과 구조를 제공하며, HTML 파싱/분석 로직은 그대로 공유하고
+네트워크 작업(HTTP 요청, DNS 조회, TLS 인증서 확인)만 논블로킹으로 수행한다.
+"""
+
+import asyncio
+import socket
+import sys
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from urllib.parse import urljoin, urlparse
+
+from requests.utils import get_encoding_from_headers
+
+from main import (URLAnalyzer, PageContext, RobotsRules, Sitemap, SITEMAP_MAX_FILES, BodyBudget, TIMING_PHASES, REDIRECT_STATUSES,
+                  PAGE_STAGES, READ_CHUNK_SIZE, ROBOTS_MAX_BYTES, SITEMAP_MAX_BYTES, PROBE_MAX_SECONDS)
+from page_weight import (page_assets, probe_details, response_size, summarize_page_weight, ASSET_ACCEPT_ENCODING,
+                         RANGE_PROBE_HEADER, MAX_COUNTED_BYTES, head_is_final, unprobed_details)
+from crawler import CrawlFrontier, build_site_report
+from origin_cache import origin_of
+from fixture_server import FixtureServer, diff_results
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    print("aiohttp가 설치되지 않아 비동기 분석기를 사용할 수 없습니다.")
+
+# aiodns가 있으면 DNS 조회도 스레드 없이 비동기로 처리
+try:
+    import aiodns  # noqa: F401
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+
+class AsyncResponse:
+    """PageContext와 분석기가 사용하는 requests.Response 호환 속성만 갖춘 응답"""
+
+    def __init__(self, url, status_code, headers, content, elapsed):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.elapsed = timedelta(seconds=elapsed)
+        # requests와 같은 규칙으로 인코딩 결정
+        self.encoding = get_encoding_from_headers(headers) or 'utf-8'
+
+    @property
+    def text(self):
+        try:
+            return self.content.decode(self.encoding, errors='replace')
+        except LookupError:
+            return self.content.decode('utf-8', errors='replace')
+
+
+class AsyncURLAnalyzer(URLAnalyzer):
+    """aiohttp 기반 비동기 분석기 - 모든 분석 메서드가 코루틴
+
+    사용 예:
+        async with AsyncURLAnalyzer() as analyzer:
+            results = await analyzer.analyze_url(url)
+    """
+
+    def __init__(self, max_connections=1000, limit_per_host=0, **options):
+        """options는 URLAnalyzer와 같은 설정 (stage_timeout, performance_samples, cache 등)"""
+        if not AIOHTTP_AVAILABLE:
+            raise RuntimeError("AsyncURLAnalyzer를 사용하려면 aiohttp를 설치해주세요 (pip install aiohttp)")
+        super().__init__(**options)
+        self.max_connections = max_connections  # 전체 동시 연결 수 (0이면 무제한)
+        self.limit_per_host = limit_per_host    # 호스트별 동시 연결 수 (0이면 무제한)
+        self._http = None
+        self._resolver = None
+        # 진행 중인 출처 정보/자원 확인 - 같은 키를 동시에 요청하면 하나만 보내고 결과를 나눠 씀
+        self._loading = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        """aiohttp 세션과 함께 상속받은 연결 풀/자원 확인 스레드도 정리"""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+        super().close()
+
+    async def _get_http(self):
+        """이벤트 루프 안에서 HTTP 세션을 지연 생성"""
+        if self._http is None or self._http.closed:
+            self._resolver = aiohttp.AsyncResolver() if AIODNS_AVAILABLE else aiohttp.ThreadedResolver()
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.limit_per_host,
+                resolver=self._resolver,
+                force_close=not self.keep_alive,
+                ssl=self._ssl_context() if self.ca_bundle else True
+            )
+            self._http = aiohttp.ClientSession(
+                connector=connector,
+                headers={'User-Agent': self.session.headers['User-Agent']}
+            )
+        return self._http
+
+    def _client_timeout(self, read_timeout=None):
+        """연결과 읽기에 따로 적용하는 aiohttp 시간 제한"""
+        return aiohttp.ClientTimeout(sock_connect=self.connect_timeout, sock_read=read_timeout or self.read_timeout)
+
+    async def _polite_wait(self, url):
+        """스케줄러가 있으면 호스트 속도 제한만큼 대기 (동시 연결 수는 커넥터가 제한)"""
+        if self.scheduler is not None:
+            delay = self.scheduler.reserve(urlparse(url).netloc.lower())
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    def _note_response(self, url, status, headers):
+        if self.scheduler is not None:
+            self.scheduler.note_response(urlparse(url).netloc.lower(), status, headers)
+
+    async def _request(self, url, read_timeout=None, headers=None, max_bytes=None):
+        """robots.txt/sitemap 요청 - 본문은 max_bytes와 PROBE_MAX_SECONDS 안에서만 읽음"""
+        http = await self._get_http()
+        await self._polite_wait(url)
+        start_time = time.time()
+        async with http.get(url, timeout=self._client_timeout(read_timeout), headers=headers) as resp:
+            self._note_response(url, resp.status, resp.headers)
+            budget = await self._read_body(resp, BodyBudget(max_bytes, PROBE_MAX_SECONDS))
+            return AsyncResponse(str(resp.url), resp.status, resp.headers, budget.body(), time.time() - start_time)
+
+    async def fetch_page(self, url, validators=None):
+        """페이지를 한 번 요청하여 공유 컨텍스트 생성 (validators가 있으면 조건부 요청)"""
+        http = await self._get_http()
+        await self._polite_wait(url)
+        start_time = time.time()
+        async with http.get(url, timeout=self._client_timeout(),
+                            headers=self._conditional_headers(validators)) as resp:
+            self._note_response(url, resp.status, resp.headers)
+            budget = await self._read_body(resp)
+            response = AsyncResponse(str(resp.url), resp.status, resp.headers, budget.body(), time.time() - start_time)
+        page = PageContext(url, response, parser=self.parser, truncated=budget.truncated)
+        if self.browser_pool is not None:
+            # 브라우저 조작은 블로킹이므로 스레드에서 실행
+            await asyncio.to_thread(self._render_page, page)
+        return page
+
+    async def _read_body(self, resp, budget=None):
+        """본문을 청크 단위로 읽어 예산 안에서만 보관 (남은 본문은 연결과 함께 버림)"""
+        budget = budget or self._body_budget()
+        async for chunk in resp.content.iter_chunked(READ_CHUNK_SIZE):
+            if not budget.add(chunk):
+                resp.close()
+                break
+        return budget
+
+    async def _ensure_page(self, url, page):
+        """컨텍스트가 없으면 요청하고, 실패는 컨텍스트에 담아 각 분석기가 오류로 보고하게 함"""
+        if page is not None:
+            return page
+        try:
+            return await self.fetch_page(url)
+        except Exception as e:
+            return PageContext(url, error=e)
+
+    async def analyze_url(self, url, force_refresh=False, page=None):
+        """메인 분석 함수 - 모든 분석 결과를 반환 (force_refresh=True면 캐시 무시, page는 이미 받은 PageContext)"""
+        if not force_refresh:
+            cached = self._cache_get('full', url)
+            if cached is not None:
+                return cached
+
+        print(f"🔍 분석 시작: {url}")
+        started = time.time()
+        timings = {}
+
+        stored = self._revalidation_get(url) if page is None else None
+        fetch_start = time.time()
+        try:
+            if page is None:
+                page = await self.fetch_page(url, validators=stored)
+            if not page.not_modified:
+                # 파싱은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+                await asyncio.to_thread(lambda: page.soup)
+        except Exception as e:
+            page = PageContext(url, error=e)
+        timings['fetch'] = time.time() - fetch_start
+        revalidated = stored is not None and page.not_modified
+
+        stages = {
+            'robots_txt': self._robots_summary(url),
+            'sitemap': self._sitemap_summary(url),
+            # 재검증됐으면 측정 요청도 조건부로 보내 본문을 다시 받지 않음
+            'performance': self.measure_performance(url, page=page, validators=stored if revalidated else None)
+        }
+        if revalidated:
+            # 본문이 바뀌지 않았으므로 저장된 결과를 쓰고, 인증서만 새로 확인
+            for name in PAGE_STAGES:
+                stages[name] = self._reused_stage(stored, page, name)
+            stages['security_analysis'] = self._refresh_security(
+                url, self._reuse_stage(stored, page, 'security_analysis'))
+            stages['page_weight'] = self._refresh_page_weight(self._reuse_stage(stored, page, 'page_weight'))
+        else:
+            stages.update({
+                'basic_info': self.get_basic_info(url, page=page),
+                'seo_analysis': self.analyze_seo(url, page=page, include_probes=False),
+                'content_analysis': self.analyze_content(url, page=page),
+                'technical_analysis': self.analyze_technical(url, page=page),
+                'page_weight': self.analyze_page_weight(url, page=page),
+                'security_analysis': self.analyze_security(url, page=page),
+                'keyword_analysis': self.analyze_keywords(url, page=page),
+                'social_media': self.analyze_social_media(url, page=page),
+                'mobile_analysis': self.analyze_mobile_compatibility(url, page=page)
+            })
+        stage_results = await self._run_stages(stages, timings)
+
+        results = self._assemble_results(url, stage_results, timings, started)
+        results['revalidation'] = self._revalidation_report(stored, revalidated, stage_results['performance'])
+        if not revalidated:
+            self._revalidation_put(url, page, stage_results)
+        self._cache_put('full', url, results)
+        self._store_put(results)
+        return results
+
+    async def _reused_stage(self, stored, page, name):
+        return self._reuse_stage(stored, page, name)
+
+    async def _refresh_security(self, url, security):
+        if security.get('https'):
+            security['ssl_certificate'] = await self._get_ssl_info(url)
+        return security
+
+    async def _refresh_page_weight(self, weight):
+        if 'assets' not in weight:
+            return weight
+        assets = [{key: asset[key] for key in ('url', 'kind', 'render_blocking')} for asset in weight['assets']]
+        return await self._page_weight(weight['page_url'], weight['document_bytes'], assets, weight['assets_found'])
+
+    async def _run_stages(self, stages, timings):
+        """분석 단계 코루틴들을 동시에 실행하고 단계별 소요 시간을 기록"""
+        async def timed(name, coro):
+            stage_start = time.time()
+            try:
+                result = await asyncio.wait_for(coro, self.stage_timeout)
+            except asyncio.TimeoutError:
+                result = self._stage_timeout_error(name)
+            except Exception as e:
+                result = {'error': str(e)}
+            return result, time.time() - stage_start
+
+        names = list(stages)
+        outcomes = await asyncio.gather(*(timed(name, stages[name]) for name in names))
+
+        stage_results = {}
+        for name, (result, elapsed) in zip(names, outcomes):
+            stage_results[name] = result
+            timings[name] = elapsed
+        return stage_results
+
+    async def analyze_many(self, urls=None, max_concurrency=100, per_host_limit=4, force_refresh=False, urls_file=None):
+        """여러 URL을 제한된 동시성으로 분석하고, 끝나는 순서대로 결과를 반환하는 비동기 제너레이터"""
+        # 진행 중인 URL이 있는 호스트만 [세마포어, 사용 중인 URL 수]를 보관 (끝난 호스트는 제거)
+        host_limits = {}
+        in_flight = set()
+
+        async def run(url):
+            host = urlparse(url).netloc
+            limit = host_limits.setdefault(host, [asyncio.Semaphore(per_host_limit), 0])
+            limit[1] += 1
+            try:
+                async with limit[0]:
+                    return await self._analyze_safely(url, force_refresh)
+            finally:
+                limit[1] -= 1
+                if not limit[1]:
+                    del host_limits[host]
+
+        for url in self._iter_urls(urls, urls_file):
+            if len(in_flight) >= max_concurrency:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+            in_flight.add(asyncio.ensure_future(run(url)))
+
+        while in_flight:
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+
+    async def _analyze_safely(self, url, force_refresh=False):
+        try:
+            return await self.analyze_url(url, force_refresh=force_refresh)
+        except Exception as e:
+            return {'url': url, 'timestamp': datetime.now().isoformat(), 'error': str(e)}
+
+    async def crawl(self, seed_url, max_depth=3, max_pages=100, max_workers=4, use_sitemap=True,
+                    respect_robots=True, force_refresh=False):
+        """시작 URL에서 내부 링크를 너비 우선으로 따라가며 사이트 전체를 분석 (URLAnalyzer.crawl과 같은 결과)"""
+        pages = []
+        async for event, data in self.crawl_iter(seed_url, max_depth, max_pages, max_workers, use_sitemap,
+                                                 respect_robots, force_refresh):
+            if event == 'page':
+                pages.append(data)
+        return {'seed_url': data['seed_url'], 'pages': pages, 'report': data}
+
+    async def crawl_iter(self, seed_url, max_depth=3, max_pages=100, max_workers=4, use_sitemap=True,
+                         respect_robots=True, force_refresh=False):
+        """크롤링 비동기 제너레이터 - ('page', 페이지)를 끝나는 순서대로, 마지막에 ('report', 사이트 리포트)"""
+        started = time.time()
+        frontier = CrawlFrontier(seed_url, max_depth=max_depth, max_pages=max_pages,
+                                 user_agent=self.session.headers['User-Agent'])
+        seed_url = frontier.seed_url
+        robots = await self.get_robots(seed_url)
+        if respect_robots:
+            frontier.robots = robots
+        frontier.add(seed_url, 0)
+        if use_sitemap:
+            for sitemap_url in await self._sitemap_pages(seed_url, robots, max_pages):
+                frontier.add(sitemap_url, 1)
+
+        pages = []
+        in_flight = {}
+        while frontier or in_flight:
+            while frontier and len(in_flight) < max_workers:
+                url, depth = frontier.pop()
+                in_flight[asyncio.ensure_future(self._crawl_page(url, force_refresh))] = (url, depth)
+
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                url, depth = in_flight.pop(task)
+                results, base_url, hrefs = task.result()
+                if depth == 0:
+                    # 시작 페이지가 리다이렉트되면(example.com -> www.example.com 등) 최종 호스트도 같은 사이트
+                    frontier.add_site(base_url)
+                page = {
+                    'url': url,
+                    'depth': depth,
+                    'results': results,
+                    'links': frontier.add_links(base_url, hrefs, depth + 1)
+                }
+                pages.append(page)
+                yield 'page', page
+
+        yield 'report', build_site_report(seed_url, pages, frontier.skipped, time.time() - started)
+
+    async def _crawl_page(self, url, force_refresh=False):
+        try:
+            page = await self.fetch_page(url)
+        except Exception as e:
+            return {'url': url, 'timestamp': datetime.now().isoformat(), 'error': str(e)}, url, []
+
+        hrefs = []
+        if page.response.status_code == 200 and 'html' in page.headers.get('content-type', 'text/html'):
+            try:
+                hrefs = await asyncio.to_thread(lambda: page.facts.links)
+            except Exception:
+                pass
+        try:
+            results = await self.analyze_url(url, force_refresh=force_refresh, page=page)
+        except Exception as e:
+            results = {'url': url, 'timestamp': datetime.now().isoformat(), 'error': str(e)}
+        return results, page.response.url, hrefs
+
+    async def _sitemap_pages(self, seed_url, robots, limit):
+        sitemap = await self.get_sitemap(seed_url)
+        urls = list(sitemap.urls)
+        pending = deque(sitemap.sitemaps + [urljoin(seed_url, location) for location in robots.sitemaps])
+        fetched = {urljoin(seed_url, '/sitemap.xml')}
+        while pending and len(urls) < limit and len(fetched) < SITEMAP_MAX_FILES:
+            sitemap_url = pending.popleft()
+            if sitemap_url in fetched:
+                continue
+            fetched.add(sitemap_url)
+            try:
+                child = await self._fetch_sitemap(sitemap_url)
+            except Exception:
+                continue
+            urls.extend(child.urls)
+            pending.extend(child.sitemaps)
+        return urls[:limit]
+
+    # HTML 분석은 동기 엔진의 로직을 그대로 사용 - 파싱/텍스트 통계/가독성은 CPU 작업이므로 스레드에서 실행
+    async def get_basic_info(self, url, page=None, force_refresh=False):
+        """기본 정보 수집 (단독 호출 시 캐시 사용)"""
+        if page is None and not force_refresh:
+            cached = self._cache_get('basic', url)
+            if cached is not None:
+                return cached
+
+        basic_info = await asyncio.to_thread(super().get_basic_info, url, page=await self._ensure_page(url, page))
+        if page is None:
+            self._cache_put('basic', url, basic_info)
+        return basic_info
+
+    async def analyze_seo(self, url, page=None, include_probes=True):
+        """SEO 분석 (include_probes=False면 robots.txt/sitemap 확인 생략)"""
+        seo = await asyncio.to_thread(super().analyze_seo, url, page=await self._ensure_page(url, page),
+                                      include_probes=False)
+        if include_probes:
+            robots, sitemap = await asyncio.gather(self._robots_summary(url), self._sitemap_summary(url))
+            seo = self._merge_seo_probes({'seo_analysis': seo, 'robots_txt': robots, 'sitemap': sitemap})
+        return seo
+
+    async def analyze_content(self, url, page=None):
+        """콘텐츠 분석"""
+        return await asyncio.to_thread(super().analyze_content, url, page=await self._ensure_page(url, page))
+
+    async def analyze_technical(self, url, page=None):
+        """기술적 분석"""
+        return await asyncio.to_thread(super().analyze_technical, url, page=await self._ensure_page(url, page))
+
+    async def analyze_keywords(self, url, page=None):
+        """키워드 분석"""
+        return await asyncio.to_thread(super().analyze_keywords, url, page=await self._ensure_page(url, page))
+
+    async def analyze_social_media(self, url, page=None):
+        """소셜 미디어 분석"""
+        return await asyncio.to_thread(super().analyze_social_media, url, page=await self._ensure_page(url, page))
+
+    async def analyze_mobile_compatibility(self, url, page=None):
+        """모바일 호환성 분석"""
+        return await asyncio.to_thread(super().analyze_mobile_compatibility, url,
+                                       page=await self._ensure_page(url, page))
+
+    # 네트워크 작업은 논블로킹으로 수행
+    async def measure_performance(self, url, samples=None, sample_gap=None, page=None, validators=None):
+        """성능 측정 - 요청마다 DNS/TCP 연결/TLS/첫 바이트/다운로드 시간을 나누어 기록 (렌더 모드면 탐색 시간 추가)"""
+        samples = self.performance_samples if samples is None else samples
+        sample_gap = self.sample_gap if sample_gap is None else sample_gap
+        try:
+            timings = []
+            for i in range(max(1, samples)):
+                if i and sample_gap > 0:
+                    await asyncio.sleep(sample_gap)
+                phases, status, headers, body, truncated = await self._timed_fetch(url, validators=validators)
+                timings.append(phases)
+
+            performance = self._summarize_performance(timings, headers, body, truncated,
+                                                      **self._not_modified_size(status, validators))
+            if self.browser_pool is not None:
+                performance['navigation_timing'] = await asyncio.to_thread(self._navigation_timing, url, page)
+            return performance
+        except Exception as e:
+            return {'error': str(e)}
+
+    async def _timed_fetch(self, url, max_redirects=5, validators=None):
+        """요청 한 번을 단계별로 시간 측정 (리다이렉트는 따라가며 단계별 시간을 합산)"""
+        await self._get_http()
+        phases = self._new_phases()
+        for _ in range(max_redirects + 1):
+            parsed = urlparse(url)
+            is_https = parsed.scheme == 'https'
+            port = parsed.port or (443 if is_https else 80)
+
+            # 속도 제한 대기는 측정 시간에 포함하지 않음
+            await self._polite_wait(url)
+            lap = time.perf_counter()
+            resolved = []
+
+            async def resolve():
+                resolved.append(True)
+                addresses = await asyncio.wait_for(self._resolver.resolve(parsed.hostname, port), self.connect_timeout)
+                # 동기 엔진과 출처 캐시를 함께 쓸 수 있도록 getaddrinfo 항목 형식으로 저장
+                first = addresses[0]
+                return first['family'], socket.SOCK_STREAM, first['proto'], '', (first['host'], first['port'])
+
+            _, _, _, _, address = await self._origin_fact(url, 'dns', resolve)
+            lap = self._add_dns_phase(phases, lap, cached=not resolved)
+
+            # Python 3.11+는 TCP 연결 후 TLS를 따로 올려 두 단계를 구분, 이전 버전은 연결 시간에 포함
+            split_tls = is_https and hasattr(asyncio.StreamWriter, 'start_tls')
+            context = self._ssl_context() if is_https else None
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(
+                address[0], port,
+                ssl=None if split_tls else context,
+                server_hostname=parsed.hostname if is_https and not split_tls else None
+            ), self.connect_timeout)
+            try:
+                lap = self._add_phase(phases, 'connect', lap)
+
+                if split_tls:
+                    await asyncio.wait_for(writer.start_tls(context, server_hostname=parsed.hostname), self.read_timeout)
+                    lap = self._add_phase(phases, 'tls', lap)
+
+                writer.write(self._build_timing_request(parsed, validators))
+                first = await asyncio.wait_for(reader.read(65536), self.read_timeout)
+                lap = self._add_phase(phases, 'ttfb', lap)
+
+                # 페이지 본문과 같은 읽기 예산 - 넘으면 거기까지를 다운로드 시간으로 기록
+                budget = self._body_budget()
+                reading = budget.add(first)
+                while reading:
+                    chunk = await asyncio.wait_for(reader.read(65536), self.read_timeout)
+                    if not chunk:
+                        break
+                    reading = budget.add(chunk)
+                self._add_phase(phases, 'download', lap)
+            finally:
+                writer.close()
+
+            status, headers, body, truncated = await asyncio.to_thread(
+                self._parse_timed_response, budget.body(), budget.truncated)
+            self._note_response(url, status, headers)
+            if status in REDIRECT_STATUSES and headers.get('location'):
+                url = urljoin(url, headers['location'])
+                continue
+            break
+
+        phases['total'] = sum(phases[phase] or 0.0 for phase in TIMING_PHASES)
+        return phases, status, headers, body, truncated
+
+    async def analyze_page_weight(self, url, page=None):
+        """페이지 무게 분석 - 자원을 asset_workers개까지 동시에 확인"""
+        try:
+            page = self._get_page(url, await self._ensure_page(url, page))
+            page_url = page.response.url
+            assets = await asyncio.to_thread(lambda: page_assets(page.facts, page_url))
+            return await self._page_weight(page_url, len(page.content), assets[:self.max_assets], len(assets))
+        except Exception as e:
+            return {'error': str(e)}
+
+    async def _page_weight(self, page_url, document_bytes, assets, assets_found):
+        probes, cached = await self._probe_assets([asset['url'] for asset in assets])
+        assets = [dict(asset, **probes[asset['url']]) for asset in assets]
+        return summarize_page_weight(page_url, document_bytes, assets, assets_found, cached_probes=cached)
+
+    async def _probe_assets(self, urls):
+        """자원을 asset_workers개까지 동시에 확인 (asset_budget초 안에 끝나지 않은 자원은 취소하고 크기를 모르는 것으로 표시)"""
+        if not urls:
+            return {}, 0
+        slots = asyncio.Semaphore(max(1, self.asset_workers))
+
+        async def probe(url):
+            async with slots:
+                return await self._cached_asset_probe(url)
+
+        tasks = {asyncio.ensure_future(probe(url)): url for url in urls}
+        done, pending = await asyncio.wait(tasks, timeout=self.asset_budget)
+        probes = {}
+        cached = 0
+        for task in done:
+            probes[tasks[task]], hit = task.result()
+            cached += hit
+        for task in pending:
+            task.cancel()
+            probes[tasks[task]] = unprobed_details(tasks[task])
+        return probes, cached
+
+    async def _cached_asset_probe(self, url):
+        """자원 캐시가 있으면 캐시된 결과를 사용 - (확인 결과, 캐시 적중 여부)
+
+        같은 자원을 여러 페이지가 동시에 확인하면 요청은 한 번만 보냄 (AssetCache.get_or_load와 같음)
+        """
+        if self.asset_cache is None:
+            return await self._probe_asset(url), False
+        probe = self.asset_cache.get(url)
+        if probe is not None:
+            return probe, True
+
+        async def load():
+            probe = await self._probe_asset(url)
+            if 'error' not in probe:
+                self.asset_cache.set(url, probe)
+            return probe
+
+        return await self._single_flight(('asset', url), load), False
+
+    async def _probe_asset(self, url):
+        """자원 하나의 크기와 헤더 확인 - HEAD가 실패하거나 크기를 알려 주지 않으면 첫 바이트만 GET"""
+        http = await self._get_http()
+        headers = {'Accept-Encoding': ASSET_ACCEPT_ENCODING}
+        try:
+            try:
+                await self._polite_wait(url)
+                async with http.head(url, timeout=self._client_timeout(), headers=headers,
+                                     allow_redirects=True) as resp:
+                    self._note_response(url, resp.status, resp.headers)
+                    size = response_size(resp.status, resp.headers)
+                    if head_is_final(resp.status, size):
+                        return probe_details(url, resp.status, resp.headers, 'HEAD', size)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+            await self._polite_wait(url)
+            # 전송 크기를 세야 하므로 압축을 풀지 않음
+            async with http.get(url, timeout=self._client_timeout(), headers=dict(headers, Range=RANGE_PROBE_HEADER),
+                                auto_decompress=False) as resp:
+                self._note_response(url, resp.status, resp.headers)
+                size = response_size(resp.status, resp.headers)
+                truncated = False
+                if size is None and resp.status == 200:
+                    size = 0
+                    async for chunk in resp.content.iter_chunked(READ_CHUNK_SIZE):
+                        size += len(chunk)
+                        if size >= MAX_COUNTED_BYTES:
+                            truncated = True
+                            resp.close()
+                            break
+                return probe_details(url, resp.status, resp.headers, 'GET', size, truncated)
+        except Exception as e:
+            return {'error': str(e)}
+
+    async def analyze_security(self, url, page=None):
+        """보안 분석"""
+        try:
+            page = self._get_page(url, await self._ensure_page(url, page))
+
+            is_https = url.startswith('https://')
+            ssl_info = await self._get_ssl_info(url) if is_https else {}
+
+            return await asyncio.to_thread(self._summarize_security, page, is_https, ssl_info)
+        except Exception as e:
+            return {'error': str(e)}
+
+    async def _get_ssl_info(self, url):
+        """서버 인증서 정보 (출처 캐시 사용, 실패 시 오류 정보 반환)"""
+        try:
+            return dict(await self._origin_fact(url, 'tls', lambda: self._load_ssl_info(url)))
+        except Exception as ssl_e:
+            return {'error': str(ssl_e)}
+
+    async def _load_ssl_info(self, url):
+        """비동기 TLS 연결로 서버 인증서 조회"""
+        parsed = urlparse(url)
+        context = self._ssl_context()
+        await self._polite_wait(url)
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(parsed.hostname, parsed.port or 443, ssl=context, server_hostname=parsed.hostname),
+            timeout=self.connect_timeout + self.read_timeout
+        )
+        try:
+            return self._parse_certificate(writer.get_extra_info('peercert'))
+        finally:
+            writer.close()
+
+    async def _origin_fact(self, url, fact, loader):
+        """출처 단위 정보 - 출처 캐시가 있으면 캐시된 값, 없으면 await loader()로 조회
+
+        같은 출처의 정보를 동시에 조회하면 loader는 한 번만 실행 (OriginCache.get_or_load와 같음)
+        """
+        if self.origin_cache is None:
+            return await loader()
+        value = self.origin_cache.get(url, fact)
+        if value is not None:
+            return value
+
+        async def load():
+            value = await loader()
+            self.origin_cache.set(url, fact, value)
+            return value
+
+        return await self._single_flight(('origin', origin_of(url), fact), load)
+
+    async def _single_flight(self, key, load):
+        """같은 key의 load()가 진행 중이면 새로 실행하지 않고 그 결과를 기다림
+
+        기다리던 쪽이 취소돼도(자원 확인 시간 초과 등) 진행 중인 조회는 다른 대기자를 위해 계속함
+        """
+        task = self._loading.get(key)
+        # 다른 이벤트 루프에서 시작된 조회(루프가 닫혀 끝나지 못한 것 포함)는 쓰지 않음
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(load())
+            self._loading[key] = task
+            task.add_done_callback(lambda done: self._loading.pop(key, None) if self._loading.get(key) is done else None)
+        return await asyncio.shield(task)
+
+    async def get_robots(self, url):
+        """URL이 속한 출처의 robots.txt 규칙 (RobotsRules, 요청 실패 시 빈 규칙은 캐시하지 않음)"""
+        try:
+            rules = await self._origin_fact(url, 'robots', lambda: self._load_robots(url))
+        except Exception:
+            return RobotsRules()
+        if self.scheduler is not None:
+            self.scheduler.set_crawl_delay(urlparse(url).netloc.lower(),
+                                           rules.crawl_delay(self.session.headers['User-Agent']))
+        return rules
+
+    async def _load_robots(self, url):
+        response = await self._request(urljoin(url, '/robots.txt'), read_timeout=self._probe_timeout()[1],
+                                       max_bytes=ROBOTS_MAX_BYTES)
+        return RobotsRules(response.text, response.status_code)
+
+    async def get_sitemap(self, url):
+        """URL이 속한 출처의 /sitemap.xml (Sitemap, 요청 실패 시 빈 사이트맵은 캐시하지 않음)"""
+        try:
+            return await self._origin_fact(url, 'sitemap', lambda: self._load_sitemap(url))
+        except Exception:
+            return Sitemap()
+
+    async def _load_sitemap(self, url):
+        return await self._fetch_sitemap(urljoin(url, '/sitemap.xml'))
+
+    async def _fetch_sitemap(self, sitemap_url):
+        response = await self._request(sitemap_url, read_timeout=self._probe_timeout()[1],
+                                       max_bytes=SITEMAP_MAX_BYTES)
+        return Sitemap(response.content, response.status_code, base_url=response.url)
+
+    async def _robots_summary(self, url):
+        return (await self.get_robots(url)).summary(url, self.session.headers['User-Agent'])
+
+    async def _sitemap_summary(self, url):
+        return (await self.get_sitemap(url)).summary(url)
+
+def compare_engines(url):
+    """같은 URL을 두 엔진으로 분석하고 차이점 목록을 반환 (빈 목록이면 일치)"""
+    sync_results = URLAnalyzer().analyze_url(url)
+
+    async def run_async():
+        async with AsyncURLAnalyzer() as analyzer:
+            return await analyzer.analyze_url(url)
+
+    return diff_results(sync_results, asyncio.run(run_async()))
+
+
+if __name__ == "__main__":
+    failed = False
+    with FixtureServer() as server:
+        for path in ['/', '/about.html', '/missing.html']:
+            differences = compare_engines(server.url(path))
+            if differences:
+                failed = True
+                print(f"❌ {path}")
+                for difference in differences:
+                    print(f"   {difference}")
+            else:
+                print(f"✅ {path}: 동기/비동기 결과 일치")
+    sys.exit(1 if failed else 0)
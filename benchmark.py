@@ -0,0 +1,329 @@
+"""
+분석 성능 벤치마크 - 로컬 픽스처 서버(HTTP/HTTPS, 지연 주입)에 만든 페이지 묶음으로 URLAnalyzer를 측정
+analyze_url 전체 지연 시간, 분석기별 CPU 시간, 최대 메모리, 여러 URL 처리량을 JSON으로 저장하고 기준 결과와 비교
+(python benchmark.py [--https] [--latency 0.02] [--output bench.json] [--baseline base.json --threshold 0.2])
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from fixture_server import FixtureServer, make_self_signed_cert
+from main import URLAnalyzer, PageContext
+from origin_cache import OriginCache
+
+# 기준 결과보다 이 비율 이상 나빠지면 회귀로 판단
+REGRESSION_THRESHOLD = 0.2
+
+# 이보다 작은 값(초)의 차이는 측정 잡음으로 보고 비교하지 않음
+NOISE_FLOOR = 0.01
+
+# build_corpus가 만드는 페이지 종류
+CORPUS_PAGES = ('small', 'large', 'links', 'scripts')
+
+# 분석기별 CPU 시간 측정 대상 (페이지를 공유하는 단계만, 네트워크 확인 단계는 제외)
+CPU_STAGES = {
+    'basic_info': lambda analyzer, url, page: analyzer.get_basic_info(url, page=page),
+    'seo_analysis': lambda analyzer, url, page: analyzer.analyze_seo(url, page=page, include_probes=False),
+    'content_analysis': lambda analyzer, url, page: analyzer.analyze_content(url, page=page),
+    'technical_analysis': lambda analyzer, url, page: analyzer.analyze_technical(url, page=page),
+    'security_analysis': lambda analyzer, url, page: analyzer.analyze_security(url, page=page),
+    'keyword_analysis': lambda analyzer, url, page: analyzer.analyze_keywords(url, page=page),
+    'social_media': lambda analyzer, url, page: analyzer.analyze_social_media(url, page=page),
+    'mobile_analysis': lambda analyzer, url, page: analyzer.analyze_mobile_compatibility(url, page=page)
+}
+
+_WORDS = (
+    'performance', 'analysis', 'website', 'search', 'engine', 'content', 'mobile', 'security',
+    'network', 'browser', 'server', 'latency', 'keyword', 'quality', 'design', 'user',
+    '성능', '분석', '웹사이트', '검색', '콘텐츠', '모바일', '보안', '사용자', '서버', '품질'
+)
+
+
+def _sentence(rng, words=12):
+    return ' '.join(rng.choice(_WORDS) for _ in range(words)).capitalize() + '.'
+
+
+def _page(title, head='', body=''):
+    return (
+        '<!DOCTYPE html>\n<html lang="ko">\n<head>\n<meta charset="utf-8">\n'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+        f'<title>{title}</title>\n<meta name="description" content="{title} 벤치마크 페이지">\n'
+        f'{head}</head>\n<body>\n<h1>{title}</h1>\n{body}</body>\n</html>\n'
+    )
+
+
+def build_corpus(directory, seed=0, large_bytes=2 * 1024 * 1024, link_count=5000, script_count=300):
+    """벤치마크용 페이지 묶음을 directory에 생성 (같은 seed면 항상 같은 내용)
+
+    small: 일반적인 작은 페이지, large: 본문이 큰 페이지(약 large_bytes),
+    links: 링크가 많은 페이지, scripts: 인라인/외부 스크립트가 많은 페이지
+    """
+    rng = random.Random(seed)
+    pages = {}
+
+    paragraphs = ''.join(f'<p>{_sentence(rng, 20)}</p>\n' for _ in range(8))
+    pages['small'] = _page('작은 페이지', '<meta property="og:title" content="작은 페이지">\n',
+                           f'<h2>소개</h2>\n{paragraphs}<img src="/logo.png" alt="로고">\n<a href="/links.html">링크</a>\n')
+
+    chunks = []
+    size = 0
+    while size < large_bytes:
+        chunk = f'<h2>{_sentence(rng, 4)}</h2>\n' + ''.join(f'<p>{_sentence(rng, 40)}</p>\n' for _ in range(20))
+        chunks.append(chunk)
+        size += len(chunk.encode('utf-8'))
+    pages['large'] = _page('큰 페이지', body=''.join(chunks))
+
+    links = ''.join(f'<li><a href="/article/{i}.html">{_sentence(rng, 3)}</a></li>\n' for i in range(link_count))
+    pages['links'] = _page('링크가 많은 페이지', body=f'<ul>\n{links}</ul>\n')
+
+    head = ''.join(f'<script src="/static/bundle-{i}.js"></script>\n' for i in range(script_count // 3))
+    head += '<script type="application/ld+json">{"@context": "https://schema.org", "@type": "WebPage"}</script>\n'
+    inline = ''.join(f'<script>window.bench{i} = {json.dumps([_sentence(rng, 6) for _ in range(5)], ensure_ascii=False)};</script>\n'
+                     for i in range(script_count - script_count // 3))
+    pages['scripts'] = _page('스크립트가 많은 페이지', head, f'<p>{_sentence(rng)}</p>\n{inline}')
+
+    for name, html in pages.items():
+        with open(os.path.join(directory, f'{name}.html'), 'w', encoding='utf-8') as f:
+            f.write(html)
+    with open(os.path.join(directory, 'robots.txt'), 'w', encoding='utf-8') as f:
+        f.write('User-agent: *\nDisallow: /private/\nSitemap: /sitemap.xml\n')
+    with open(os.path.join(directory, 'sitemap.xml'), 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+                + ''.join(f'<url><loc>/{name}.html</loc></url>\n' for name in pages) + '</urlset>\n')
+    return {name: f'/{name}.html' for name in pages}
+
+
+def _summary(samples):
+    samples = sorted(samples)
+    return {
+        'runs': len(samples),
+        'mean': statistics.fmean(samples),
+        'p50': samples[len(samples) // 2],
+        'p95': samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        'min': samples[0],
+        'max': samples[-1]
+    }
+
+
+def measure_latency(analyzer, urls, runs=5):
+    """페이지별 analyze_url 전체 소요 시간(초, 캐시 없이)"""
+    result = {}
+    for name, url in urls.items():
+        samples = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            analyzer.analyze_url(url, force_refresh=True)
+            samples.append(time.perf_counter() - started)
+        result[name] = _summary(samples)
+    return result
+
+
+def measure_cpu(analyzer, urls, runs=5):
+    """페이지별로 파싱과 각 분석기가 쓴 CPU 시간(초, 중앙값)
+
+    페이지는 한 번만 받고 매번 새 PageContext로 파싱부터 다시 하며, 분석기는 한 스레드에서 차례로 실행
+    """
+    result = {}
+    for name, url in urls.items():
+        fetched = analyzer.fetch_page(url)
+        samples = {'parse': []}
+        samples.update((stage, []) for stage in CPU_STAGES)
+        for _ in range(runs):
+            page = PageContext(url, fetched.response, parser=analyzer.parser, truncated=fetched.truncated)
+            started = time.thread_time()
+            page.soup
+            page.facts
+            samples['parse'].append(time.thread_time() - started)
+            for stage, run in CPU_STAGES.items():
+                started = time.thread_time()
+                run(analyzer, url, page)
+                samples[stage].append(time.thread_time() - started)
+        result[name] = {stage: statistics.median(values) for stage, values in samples.items()}
+        result[name]['total'] = sum(result[name].values())
+    return result
+
+
+def measure_memory(analyzer, urls):
+    """페이지별 analyze_url 한 번의 최대 메모리 사용량(MB, tracemalloc 기준)"""
+    result = {}
+    for name, url in urls.items():
+        tracemalloc.start()
+        try:
+            analyzer.analyze_url(url, force_refresh=True)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result[name] = peak / 1024 / 1024
+    return result
+
+
+def measure_throughput(analyzer, url, count=40, max_workers=8, page=None):
+    """같은 페이지를 쿼리 문자열만 바꿔 count번 analyze_many로 분석한 처리량 (page: 기록할 페이지 이름)"""
+    urls = [f'{url}?bench={i}' for i in range(count)]
+    started = time.perf_counter()
+    errors = sum(1 for result in analyzer.analyze_many(urls, max_workers=max_workers, per_host_limit=max_workers,
+                                                        force_refresh=True)
+                 if 'error' in result)
+    elapsed = time.perf_counter() - started
+    return {
+        'page': page,
+        'pages': count,
+        'errors': errors,
+        'max_workers': max_workers,
+        'seconds': elapsed,
+        'pages_per_second': count / elapsed if elapsed else 0.0
+    }
+
+
+def run_benchmark(https=False, latency=0.0, runs=5, throughput_pages=40, max_workers=8, performance_samples=3,
+                  pages=CORPUS_PAGES, seed=0):
+    """픽스처 서버를 띄워 모든 측정을 실행하고 결과 딕셔너리 반환"""
+    with tempfile.TemporaryDirectory() as directory:
+        paths = build_corpus(directory, seed=seed)
+        certfile = keyfile = None
+        if https:
+            certfile, keyfile = make_self_signed_cert(directory)
+        options = dict(performance_samples=performance_samples, ca_bundle=certfile)
+
+        with FixtureServer(directory, latency=latency, certfile=certfile, keyfile=keyfile) as server:
+            urls = {name: server.url(paths[name]) for name in pages}
+            analyzer = URLAnalyzer(**options)
+            # CPU 측정은 TLS/DNS 확인이 섞이지 않도록 출처 정보를 캐시한 분석기로 실행
+            cpu_analyzer = URLAnalyzer(origin_cache=OriginCache(), **options)
+            # 분석기가 출력하는 진행 메시지는 측정에 포함하지 않음
+            with contextlib.redirect_stdout(io.StringIO()):
+                for url in urls.values():
+                    analyzer.analyze_url(url, force_refresh=True)  # 지연 로딩(NLTK 등)과 연결 준비
+                    cpu_analyzer.analyze_url(url, force_refresh=True)
+                results = {
+                    'latency': measure_latency(analyzer, urls, runs),
+                    'cpu': measure_cpu(cpu_analyzer, urls, runs),
+                    'memory_mb': measure_memory(analyzer, urls),
+                    'throughput': measure_throughput(analyzer, urls[pages[0]], throughput_pages, max_workers, pages[0])
+                }
+            analyzer.close()
+            cpu_analyzer.close()
+
+    results['meta'] = {
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'parser': analyzer.parser,
+        'https': https,
+        'latency': latency,
+        'runs': runs,
+        'performance_samples': performance_samples,
+        'seed': seed
+    }
+    return results
+
+
+def flatten_metrics(results):
+    """비교용 지표 목록 {이름: (값, 클수록 좋은지)}"""
+    metrics = {}
+    for page, summary in results.get('latency', {}).items():
+        metrics[f'latency.{page}.p50'] = (summary['p50'], False)
+    for page, stages in results.get('cpu', {}).items():
+        for stage, value in stages.items():
+            metrics[f'cpu.{page}.{stage}'] = (value, False)
+    for page, value in results.get('memory_mb', {}).items():
+        metrics[f'memory_mb.{page}'] = (value, False)
+    if 'throughput' in results:
+        throughput = results['throughput']
+        metrics[f"throughput.{throughput.get('page')}.pages_per_second"] = (throughput['pages_per_second'], True)
+    return metrics
+
+
+def compare(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """기준 결과와 비교해 지표별 변화 목록 반환 - [{'metric', 'baseline', 'current', 'change', 'regression'}]
+
+    change는 나빠진 비율 (양수면 느려지거나 메모리/처리량이 나빠짐)
+    """
+    current = flatten_metrics(results)
+    rows = []
+    for metric, (base_value, higher_is_better) in flatten_metrics(baseline).items():
+        if metric not in current or not base_value:
+            continue
+        value = current[metric][0]
+        change = (base_value - value) / base_value if higher_is_better else (value - base_value) / base_value
+        # 시간 지표는 절대 차이가 작으면 비율이 커도 잡음으로 봄
+        noise = not metric.startswith(('memory_mb', 'throughput')) and abs(value - base_value) < NOISE_FLOOR
+        rows.append({
+            'metric': metric,
+            'baseline': base_value,
+            'current': value,
+            'change': change,
+            'regression': change > threshold and not noise
+        })
+    return rows
+
+
+def print_report(results):
+    print(f"⏱️  analyze_url 지연 시간 (지연 주입 {results['meta']['latency']}초, "
+          f"{'HTTPS' if results['meta']['https'] else 'HTTP'})")
+    for page, summary in results['latency'].items():
+        print(f"   {page:<8} p50 {summary['p50']:.3f}초  p95 {summary['p95']:.3f}초  평균 {summary['mean']:.3f}초")
+    print("🧮 분석기별 CPU 시간 (중앙값, ms)")
+    for page, stages in results['cpu'].items():
+        slowest = sorted(((value, stage) for stage, value in stages.items() if stage != 'total'), reverse=True)[:3]
+        detail = ', '.join(f"{stage} {value * 1000:.1f}" for value, stage in slowest)
+        print(f"   {page:<8} 합계 {stages['total'] * 1000:.1f}  ({detail})")
+    print("💾 최대 메모리 (MB)")
+    for page, value in results['memory_mb'].items():
+        print(f"   {page:<8} {value:.1f}")
+    throughput = results['throughput']
+    print(f"🚀 처리량 ({throughput['page']}): {throughput['pages']}페이지 {throughput['seconds']:.2f}초 "
+          f"({throughput['pages_per_second']:.1f}페이지/초, 오류 {throughput['errors']}건)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="URLAnalyzer 성능 벤치마크")
+    parser.add_argument('--https', action='store_true', help="자체 서명 인증서로 HTTPS 픽스처 서버 사용")
+    parser.add_argument('--latency', type=float, default=0.0, help="요청마다 주입할 응답 지연(초)")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--pages', nargs='+', choices=CORPUS_PAGES, default=list(CORPUS_PAGES))
+    parser.add_argument('--throughput-pages', type=int, default=40)
+    parser.add_argument('--max-workers', type=int, default=8)
+    parser.add_argument('--performance-samples', type=int, default=3)
+    parser.add_argument('--output', help="결과를 저장할 JSON 파일")
+    parser.add_argument('--baseline', help="비교할 기준 결과 JSON 파일")
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help="회귀로 판단할 악화 비율 (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    results = run_benchmark(https=args.https, latency=args.latency, runs=args.runs,
+                            throughput_pages=args.throughput_pages, max_workers=args.max_workers,
+                            performance_samples=args.performance_samples, pages=args.pages)
+    print_report(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"📁 결과 저장: {args.output}")
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        changed = [key for key in ('https', 'latency', 'performance_samples', 'parser')
+                   if baseline.get('meta', {}).get(key) != results['meta'][key]]
+        if changed:
+            print(f"⚠️  기준 결과와 측정 설정이 다릅니다: {', '.join(changed)}")
+        rows = compare(results, baseline, args.threshold)
+        regressions = [row for row in rows if row['regression']]
+        for row in regressions:
+            print(f"❌ {row['metric']}: {row['baseline']:.4f} → {row['current']:.4f} ({row['change']:+.0%})")
+        if not regressions:
+            print(f"✅ 기준 결과 대비 {args.threshold:.0%} 이상 나빠진 지표 없음 ({len(rows)}개 비교)")
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,377 @@
+"""
+헤드리스 브라우저 풀 - 렌더 모드(URLAnalyzer(browser_pool=...))에서 스크립트를 실행한 뒤의 DOM과 실제 탐색 시간 수집
+pip install selenium (선택: webdriver-manager) - 브라우저(Chrome/Chromium 또는 Firefox)와 드라이버가 필요
+
+브라우저를 URL마다 띄우지 않고 미리 띄워 둔 인스턴스를 돌려 쓰며, 인스턴스마다 처리한 페이지 수가
+max_pages에 이르거나 오류가 나면 종료하고 새 인스턴스로 교체(백그라운드에서 미리 띄움)
+오프라인에서 쓰려면 드라이버가 PATH에 있거나 driver_path를 지정해야 함 (없으면 webdriver-manager/Selenium Manager가 내려받음)
+(python browser_pool.py - 로컬 픽스처 서버에서 렌더 모드와 일반 모드 결과 비교, 브라우저가 있을 때)
+"""
+
+import atexit
+import importlib
+import importlib.util
+import shutil
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Selenium은 import가 느리므로 설치 여부만 확인하고 브라우저를 처음 띄울 때 불러옴
+SELENIUM_AVAILABLE = importlib.util.find_spec('selenium') is not None
+WEBDRIVER_MANAGER_AVAILABLE = importlib.util.find_spec('webdriver_manager') is not None
+
+# 브라우저 종류별 드라이버 실행 파일
+DRIVER_EXECUTABLES = {'chrome': 'chromedriver', 'firefox': 'geckodriver'}
+
+# Chrome이 분석 대상 외의 주소(업데이트, 동기화, 프록시 등)에 접속하지 않도록 하는 옵션 - 오프라인/로컬 서버용
+CHROME_ARGUMENTS = (
+    '--headless=new', '--disable-gpu', '--no-sandbox', '--disable-dev-shm-usage',
+    '--no-first-run', '--no-default-browser-check', '--disable-background-networking',
+    '--disable-component-update', '--disable-default-apps', '--disable-sync', '--disable-extensions',
+    '--no-proxy-server', '--mute-audio'
+)
+
+# 스크립트 실행 후 DOM이 더 바뀌지 않는지 확인하는 간격(초)
+SETTLE_INTERVAL = 0.1
+
+# 렌더링이 끝난 문서 (doctype 포함)
+DOCUMENT_HTML_SCRIPT = """
+const doctype = document.doctype ? new XMLSerializer().serializeToString(document.doctype) : '';
+return doctype + document.documentElement.outerHTML;
+"""
+# load 이벤트 처리까지 끝났는지
+LOAD_FINISHED_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+return document.readyState === 'complete' && (!nav || nav.loadEventEnd > 0);
+"""
+# DOM 요소 수 (안정될 때까지 비교)
+DOM_SIZE_SCRIPT = "return document.getElementsByTagName('*').length;"
+# Navigation Timing / Paint Timing (밀리초, 탐색 시작 기준)
+NAVIGATION_TIMING_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+if (!nav) { return null; }
+const paint = name => { const entry = performance.getEntriesByName(name)[0]; return entry ? entry.startTime : null; };
+return {
+    ttfb: nav.responseStart, dom_interactive: nav.domInteractive,
+    dom_content_loaded: nav.domContentLoadedEventEnd, load: nav.loadEventEnd,
+    first_paint: paint('first-paint'), first_contentful_paint: paint('first-contentful-paint'),
+    transfer_size: nav.transferSize
+};
+"""
+TIMING_MILLISECONDS = ('ttfb', 'dom_interactive', 'dom_content_loaded', 'load', 'first_paint', 'first_contentful_paint')
+
+
+class RenderedPage:
+    """브라우저가 렌더링한 페이지
+
+    html: 스크립트를 실행한 뒤의 DOM, url: 리다이렉트 후 최종 주소,
+    timing: 탐색 시간(초, 탐색 시작 기준 - ttfb, dom_interactive, dom_content_loaded, load, first_paint,
+    first_contentful_paint)과 transfer_size(바이트), render_time: 렌더링에 걸린 시간(초, 브라우저 대기 제외)
+    """
+
+    def __init__(self, url, html, timing, render_time):
+        self.url = url
+        self.html = html
+        self.timing = timing
+        self.render_time = render_time
+
+
+def _timing_seconds(raw):
+    """브라우저의 밀리초 값을 초로 (값이 없으면 None)"""
+    if not raw:
+        return None
+    timing = {key: raw[key] / 1000 if raw.get(key) is not None else None for key in TIMING_MILLISECONDS}
+    timing['transfer_size'] = raw.get('transfer_size')
+    return timing
+
+
+class _Browser:
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+
+
+class BrowserPool:
+    """재사용하는 헤드리스 브라우저 풀 (스레드 안전)
+
+    size: 동시에 띄워 둘 브라우저 수 (동시에 렌더링할 수 있는 페이지 수)
+    max_pages: 브라우저 하나가 처리할 최대 페이지 수 (넘으면 종료하고 새로 띄움, 메모리 누수/상태 누적 방지)
+    browser: 'chrome' 또는 'firefox', driver_path/binary_path: 드라이버/브라우저 실행 파일 (None이면 자동으로 찾음)
+    page_load_timeout: 페이지 로드 시간 제한(초), settle_timeout: load 이후 DOM이 안정되기를 기다리는 최대 시간(초)
+    acquire_timeout: 모든 브라우저가 사용 중일 때 기다리는 최대 시간(초, None이면 무제한)
+    accept_insecure_certs: 자체 서명 인증서 허용 (로컬 HTTPS 픽스처 서버용)
+    driver_factory: WebDriver를 만드는 함수 (원격 Selenium Grid 등, None이면 로컬 브라우저 실행)
+    """
+
+    def __init__(self, size=2, max_pages=50, browser='chrome', driver_path=None, binary_path=None,
+                 page_load_timeout=30, settle_timeout=2.0, acquire_timeout=60, window_size=(1366, 768),
+                 accept_insecure_certs=False, keep_warm=True, driver_factory=None):
+        if browser not in DRIVER_EXECUTABLES:
+            raise ValueError(f"지원하지 않는 브라우저입니다: {browser}")
+        if driver_factory is None and not SELENIUM_AVAILABLE:
+            raise RuntimeError("렌더 모드를 사용하려면 selenium을 설치해주세요 (pip install selenium)")
+        self.size = max(1, size)
+        self.max_pages = max(1, max_pages)
+        self.browser = browser
+        self.driver_path = driver_path
+        self.binary_path = binary_path
+        self.page_load_timeout = page_load_timeout
+        self.settle_timeout = settle_timeout
+        self.acquire_timeout = acquire_timeout
+        self.window_size = window_size
+        self.accept_insecure_certs = accept_insecure_certs
+        self.keep_warm = keep_warm  # 교체한 브라우저를 다음 요청 전에 미리 띄울지 여부
+        self.driver_factory = driver_factory or self._launch_driver
+
+        self._idle = deque()
+        self._launched = 0   # 실행 중이거나 띄우는 중인 브라우저 수
+        self._closed = False
+        self._condition = threading.Condition()
+        self._stats = {'launched': 0, 'recycled': 0, 'failures': 0, 'pages': 0, 'waits': 0}
+        atexit.register(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _launch_driver(self):
+        """로컬 헤드리스 브라우저 실행"""
+        webdriver = importlib.import_module('selenium.webdriver')
+        driver_path = self.driver_path or shutil.which(DRIVER_EXECUTABLES[self.browser])
+        if driver_path is None and WEBDRIVER_MANAGER_AVAILABLE:
+            # 드라이버가 없을 때만 내려받음 (한 번 받으면 캐시 사용)
+            if self.browser == 'chrome':
+                manager = importlib.import_module('webdriver_manager.chrome').ChromeDriverManager
+            else:
+                manager = importlib.import_module('webdriver_manager.firefox').GeckoDriverManager
+            driver_path = manager().install()
+
+        if self.browser == 'chrome':
+            options = webdriver.ChromeOptions()
+            for argument in CHROME_ARGUMENTS:
+                options.add_argument(argument)
+            options.add_argument(f'--window-size={self.window_size[0]},{self.window_size[1]}')
+            service = webdriver.ChromeService(executable_path=driver_path) if driver_path else webdriver.ChromeService()
+            driver_class = webdriver.Chrome
+        else:
+            options = webdriver.FirefoxOptions()
+            options.add_argument('-headless')
+            options.add_argument(f'--width={self.window_size[0]}')
+            options.add_argument(f'--height={self.window_size[1]}')
+            service = webdriver.FirefoxService(executable_path=driver_path) if driver_path else webdriver.FirefoxService()
+            driver_class = webdriver.Firefox
+        if self.binary_path:
+            options.binary_location = self.binary_path
+        options.accept_insecure_certs = self.accept_insecure_certs
+        driver = driver_class(options=options, service=service)
+        driver.set_page_load_timeout(self.page_load_timeout)
+        return driver
+
+    def _start(self):
+        """브라우저 하나 실행 (자리는 호출 전에 확보해 둠, 실패하면 자리를 돌려줌)"""
+        try:
+            browser = _Browser(self.driver_factory())
+        except Exception:
+            with self._condition:
+                self._launched -= 1
+                self._stats['failures'] += 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._stats['launched'] += 1
+        return browser
+
+    def _reserve(self):
+        """새 브라우저를 띄울 자리가 있으면 확보 (조건 변수 잠금 안에서 호출)"""
+        if self._launched < self.size:
+            self._launched += 1
+            return True
+        return False
+
+    def warm(self):
+        """빈 자리만큼 브라우저를 동시에 미리 띄움 - 반환: 새로 띄운 수 (하나도 띄우지 못하면 첫 오류를 다시 발생)"""
+        with self._condition:
+            count = 0
+            while not self._closed and self._reserve():
+                count += 1
+        errors = []
+
+        def start():
+            try:
+                self._checkin(self._start(), healthy=True, served=False)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=start) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if count and len(errors) == count:
+            raise errors[0]
+        return count - len(errors)
+
+    def _replenish(self):
+        """교체할 브라우저를 하나 띄워 대기열에 추가 (실패해도 다음 요청 때 다시 시도)"""
+        with self._condition:
+            if self._closed or not self._reserve():
+                return
+        try:
+            browser = self._start()
+        except Exception:
+            return
+        self._checkin(browser, healthy=True, served=False)
+
+    def _checkout(self):
+        deadline = None if self.acquire_timeout is None else time.monotonic() + self.acquire_timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("브라우저 풀이 닫혔습니다")
+                if self._idle:
+                    return self._idle.popleft()
+                if self._reserve():
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"{self.acquire_timeout}초 안에 사용할 수 있는 브라우저가 없습니다")
+                self._stats['waits'] += 1
+                self._condition.wait(remaining)
+        return self._start()
+
+    def _checkin(self, browser, healthy, served=True):
+        """사용이 끝난 브라우저를 대기열로 돌려주거나, 한도에 이르렀거나 오류가 났으면 종료"""
+        if served:
+            browser.pages += 1
+        with self._condition:
+            if served:
+                self._stats['pages'] += 1
+            retire = self._closed or not healthy or browser.pages >= self.max_pages
+            if retire:
+                self._launched -= 1
+                if not self._closed:
+                    self._stats['recycled'] += 1
+            else:
+                self._idle.append(browser)
+            self._condition.notify()
+        if retire:
+            self._quit(browser)
+            if self.keep_warm and not self._closed:
+                threading.Thread(target=self._replenish, daemon=True).start()
+
+    def _quit(self, browser):
+        try:
+            browser.driver.quit()
+        except Exception:
+            pass
+
+    @contextmanager
+    def driver(self):
+        """풀에서 WebDriver를 하나 빌려 줌 - 블록 안에서 예외가 나면 그 브라우저는 교체"""
+        browser = self._checkout()
+        healthy = False
+        try:
+            yield browser.driver
+            healthy = True
+        finally:
+            self._checkin(browser, healthy)
+
+    def render(self, url):
+        """페이지를 불러와 load 이벤트와 DOM 안정화까지 기다린 뒤 RenderedPage 반환"""
+        with self.driver() as driver:
+            started = time.perf_counter()
+            driver.get(url)
+            self._wait_until(driver, LOAD_FINISHED_SCRIPT, self.page_load_timeout)
+            self._wait_for_settle(driver)
+            html = driver.execute_script(DOCUMENT_HTML_SCRIPT)
+            timing = _timing_seconds(driver.execute_script(NAVIGATION_TIMING_SCRIPT))
+            final_url = driver.current_url
+            render_time = time.perf_counter() - started
+            # 이전 페이지의 스크립트가 계속 실행되지 않도록 빈 페이지로 이동해 둠
+            driver.get('about:blank')
+        return RenderedPage(final_url, html, timing, render_time)
+
+    def _wait_until(self, driver, script, timeout):
+        deadline = time.monotonic() + timeout
+        while not driver.execute_script(script):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"{timeout}초 안에 페이지 로드가 끝나지 않았습니다")
+            time.sleep(SETTLE_INTERVAL)
+
+    def _wait_for_settle(self, driver):
+        """load 이후 스크립트가 DOM을 더 바꾸지 않을 때까지 대기 (최대 settle_timeout초)"""
+        deadline = time.monotonic() + self.settle_timeout
+        previous = None
+        while time.monotonic() < deadline:
+            size = driver.execute_script(DOM_SIZE_SCRIPT)
+            if size == previous:
+                return
+            previous = size
+            time.sleep(SETTLE_INTERVAL)
+
+    def stats(self):
+        """풀 사용 통계 (띄운 브라우저 수, 교체 수, 처리한 페이지 수, 대기 횟수 등)"""
+        with self._condition:
+            stats = dict(self._stats)
+            stats.update(size=self.size, max_pages=self.max_pages, running=self._launched,
+                         idle=len(self._idle), in_use=self._launched - len(self._idle))
+        return stats
+
+    def close(self):
+        """대기 중인 브라우저를 모두 종료 (사용 중인 브라우저는 반납될 때 종료)"""
+        with self._condition:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._launched -= len(idle)
+            self._condition.notify_all()
+        for browser in idle:
+            self._quit(browser)
+
+
+def compare_render_mode(pool, paths=('/', '/spa.html')):
+    """로컬 픽스처 서버의 페이지를 일반 모드와 렌더 모드로 분석해 {경로: (일반 결과, 렌더 결과)} 반환"""
+    from fixture_server import FixtureServer
+    from main import URLAnalyzer
+
+    report = {}
+    with FixtureServer() as server:
+        plain = URLAnalyzer(performance_samples=1)
+        rendered = URLAnalyzer(performance_samples=1, browser_pool=pool)
+        for path in paths:
+            url = server.url(path)
+            report[path] = (plain.analyze_url(url), rendered.analyze_url(url))
+    return report
+
+
+if __name__ == "__main__":
+    if not SELENIUM_AVAILABLE:
+        print("selenium이 설치되지 않아 렌더 모드 확인을 건너뜁니다 (pip install selenium)")
+        sys.exit(0)
+    try:
+        pool = BrowserPool(size=2, max_pages=3)
+        started = time.perf_counter()
+        pool.warm()
+        warm_time = time.perf_counter() - started
+    except Exception as e:
+        print(f"브라우저를 실행할 수 없어 렌더 모드 확인을 건너뜁니다: {e}")
+        sys.exit(0)
+
+    failed = False
+    with pool:
+        print(f"🌐 브라우저 {pool.size}개 준비: {warm_time:.2f}초")
+        for path, (plain, rendered) in compare_render_mode(pool).items():
+            timing = rendered['performance'].get('navigation_timing') or {}
+            ok = rendered['basic_info'].get('rendered') is True and timing.get('load') is not None
+            failed = failed or not ok
+            fcp = timing.get('first_contentful_paint')
+            print(f"{'✅' if ok else '❌'} {path}: 단어 수 {plain['content_analysis'].get('word_count')} → "
+                  f"{rendered['content_analysis'].get('word_count')}, 제목 {plain['basic_info'].get('title')!r} → "
+                  f"{rendered['basic_info'].get('title')!r}, DOMContentLoaded {timing.get('dom_content_loaded')}, "
+                  f"load {timing.get('load')}, FCP {fcp}")
+        print(f"📊 풀 통계: {pool.stats()}")
+    sys.exit(1 if failed else 0)
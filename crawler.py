@@ -0,0 +1,281 @@
+"""
+사이트 크롤링 도구 - URL 정규화, 방문 기록(집합 또는 블룸 필터), 사이트 단위 리포트 집계
+URLAnalyzer.crawl()이 시작 URL에서 내부 링크를 너비 우선으로 따라가며 사용
+"""
+
+import hashlib
+import math
+from collections import Counter, deque
+from urllib.parse import urljoin, urlparse, urlunparse, parse_qsl, urlencode
+
+from result_cache import DEFAULT_PORTS
+
+# 페이지가 아닌 것으로 보고 따라가지 않는 확장자
+SKIP_EXTENSIONS = (
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.ico', '.bmp', '.avif',
+    '.css', '.js', '.json', '.xml', '.txt', '.pdf', '.zip', '.gz', '.tar', '.rar', '.7z',
+    '.mp3', '.mp4', '.avi', '.mov', '.webm', '.woff', '.woff2', '.ttf', '.eot',
+    '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.exe', '.dmg'
+)
+
+# 같은 페이지를 가리키므로 정규화할 때 제거하는 추적용 쿼리 파라미터
+TRACKING_PARAMS = ('utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content', 'gclid', 'fbclid')
+
+# 방문 기록이 이 개수를 넘을 것으로 예상되면 집합 대신 블룸 필터 사용
+EXACT_SEEN_LIMIT = 100000
+# 페이지 한도로 건너뛴 URL을 한 번씩만 세기 위한 블룸 필터 크기 (방문 기록과 달리 고정 크기)
+SKIPPED_CAPACITY = 100000
+
+
+def normalize_url(url):
+    """같은 페이지를 가리키는 URL을 하나로 맞춤 (http(s)가 아니면 None)
+
+    스킴/호스트 소문자, 기본 포트와 #fragment 제거, 빈 경로는 /, 추적용 파라미터 제거 후 쿼리 정렬
+    """
+    parsed = urlparse(url.strip())
+    scheme = parsed.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parsed.hostname:
+        return None
+    try:
+        port = parsed.port
+    except ValueError:
+        return None
+    host = parsed.hostname.lower()
+    if port and port != DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+    query = urlencode(sorted((key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+                             if key.lower() not in TRACKING_PARAMS))
+    return urlunparse((scheme, host, parsed.path or '/', parsed.params, query, ''))
+
+
+def site_variants(netloc):
+    """같은 사이트로 보는 호스트 - 호스트와 그 www 변형 (example.com <-> www.example.com)"""
+    if netloc.startswith('www.'):
+        return {netloc, netloc[4:]}
+    return {netloc, f"www.{netloc}"}
+
+
+def is_page_url(url):
+    """확장자로 보아 HTML 페이지일 수 있는 URL인지"""
+    return not urlparse(url).path.lower().endswith(SKIP_EXTENSIONS)
+
+
+class BloomFilter:
+    """확률적 방문 기록 - 메모리를 고정 크기로 쓰는 대신 드물게 처음 보는 URL을 본 것으로 판단
+
+    capacity: 예상 항목 수
+    error_rate: 그 개수만큼 넣었을 때의 오판 확률
+    """
+
+    def __init__(self, capacity, error_rate=0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        # 해시 하나를 둘로 나눠 k개의 위치를 만듦 (Kirsch-Mitzenmacher)
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, item):
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __len__(self):
+        return self.count
+
+
+def make_seen_set(expected):
+    """예상 개수에 맞는 방문 기록 (작으면 정확한 집합, 크면 블룸 필터)"""
+    if expected <= EXACT_SEEN_LIMIT:
+        return set()
+    return BloomFilter(expected)
+
+
+class CrawlFrontier:
+    """너비 우선 크롤링 대기열 - 같은 사이트의 처음 보는 페이지 URL만 깊이와 개수 한도 안에서 받음
+
+    같은 사이트: 시작 URL의 호스트와 www 변형, 시작 페이지가 리다이렉트된 최종 호스트(add_site)
+    robots: RobotsRules (None이면 robots.txt 확인 안 함)
+    skipped: 받지 않은 이유별 URL 수 ('robots', 'page_limit') - 같은 URL의 링크가 여러 번 나와도 한 번만 셈
+    """
+
+    def __init__(self, seed_url, max_depth=3, max_pages=100, robots=None, user_agent='*'):
+        self.seed_url = normalize_url(seed_url)
+        if self.seed_url is None:
+            raise ValueError(f"크롤링할 수 없는 URL입니다: {seed_url}")
+        self.site = urlparse(self.seed_url).netloc
+        self.sites = site_variants(self.site)
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.robots = robots
+        self.user_agent = user_agent
+        self.accepted = 0
+        self.skipped = Counter()
+        self._seen = make_seen_set(max_pages)
+        self._skipped_urls = None
+        self._queue = deque()
+
+    def add_site(self, url):
+        """URL의 호스트(와 www 변형)도 같은 사이트로 인정 - 시작 페이지가 다른 호스트로 리다이렉트된 경우"""
+        url = normalize_url(url)
+        if url is not None:
+            self.sites |= site_variants(urlparse(url).netloc)
+
+    def is_internal(self, url):
+        """정규화한 URL이 같은 사이트인지"""
+        return urlparse(url).netloc in self.sites
+
+    def add(self, url, depth):
+        """URL을 대기열에 추가 (받았으면 True)"""
+        url = normalize_url(url)
+        if url is None or depth > self.max_depth or not self.is_internal(url) or not is_page_url(url):
+            return False
+        if url in self._seen:
+            return False
+        # 한도를 넘은 URL은 방문 기록에 넣지 않고(한도 없이 커지므로) 고정 크기 블룸 필터로 한 번만 셈
+        if self.accepted >= self.max_pages:
+            if self._skipped_urls is None:
+                self._skipped_urls = BloomFilter(SKIPPED_CAPACITY)
+            if url not in self._skipped_urls:
+                self._skipped_urls.add(url)
+                self.skipped['page_limit'] += 1
+            return False
+        self._seen.add(url)
+        if self.robots is not None and not self.robots.can_fetch(url, self.user_agent):
+            self.skipped['robots'] += 1
+            return False
+        self._queue.append((url, depth))
+        self.accepted += 1
+        return True
+
+    def add_links(self, base_url, hrefs, depth):
+        """페이지의 링크(href 목록)를 기준 URL로 풀어 다음 깊이로 추가하고, 정규화한 내부 링크 목록(중복 제외) 반환"""
+        links = {}
+        for href in hrefs:
+            link = normalize_url(urljoin(base_url, href))
+            if link is not None and link not in links and self.is_internal(link):
+                links[link] = True
+                self.add(link, depth)
+        return list(links)
+
+    def pop(self):
+        """다음에 분석할 (URL, 깊이)"""
+        return self._queue.popleft()
+
+    def __len__(self):
+        return len(self._queue)
+
+
+def _ratio(count, total):
+    return round(count / total, 3) if total else 0.0
+
+
+def build_site_report(seed_url, pages, skipped=None, elapsed=None):
+    """페이지별 분석 결과를 사이트 단위 리포트로 집계
+
+    pages: [{'url', 'depth', 'results', 'links'(정규화한 내부 링크)}]
+    skipped: 건너뛴 이유별 URL 수 (robots 차단, 한도 초과 등)
+    """
+    total = len(pages)
+    status_codes = Counter()
+    depths = Counter()
+    titles = {}
+    descriptions = {}
+    inbound = Counter()
+    issues = {
+        'errors': [],
+        'client_errors': [],
+        'server_errors': [],
+        'missing_title': [],
+        'missing_meta_description': [],
+        'missing_h1': [],
+        'multiple_h1': [],
+        'images_without_alt': [],
+        'slow_pages': [],
+        'truncated': []
+    }
+    response_times = []
+    word_counts = []
+    performance_scores = []
+
+    for page in pages:
+        url, results = page['url'], page['results']
+        depths[page['depth']] += 1
+        for link in set(page.get('links', ())):
+            if link != url:
+                inbound[link] += 1
+
+        basic = results.get('basic_info', {})
+        if 'error' in results or 'error' in basic:
+            issues['errors'].append(url)
+            continue
+        status = basic.get('status_code')
+        status_codes[status] += 1
+        if status and status >= 500:
+            issues['server_errors'].append(url)
+        elif status and status >= 400:
+            issues['client_errors'].append(url)
+        if basic.get('truncated'):
+            issues['truncated'].append(url)
+        if basic.get('response_time') is not None:
+            response_times.append(basic['response_time'])
+
+        title = basic.get('title', '')
+        if title:
+            titles.setdefault(title, []).append(url)
+        else:
+            issues['missing_title'].append(url)
+        description = basic.get('meta_description', '')
+        if description:
+            descriptions.setdefault(description, []).append(url)
+        else:
+            issues['missing_meta_description'].append(url)
+
+        seo = results.get('seo_analysis', {})
+        h1_count = len(seo.get('headings', {}).get('h1', []))
+        if 'error' not in seo:
+            if h1_count == 0:
+                issues['missing_h1'].append(url)
+            elif h1_count > 1:
+                issues['multiple_h1'].append(url)
+            if seo.get('images', {}).get('images_without_alt'):
+                issues['images_without_alt'].append(url)
+
+        performance = results.get('performance', {})
+        if 'performance_score' in performance:
+            performance_scores.append(performance['performance_score'])
+            if performance.get('avg_response_time', 0) > 3:
+                issues['slow_pages'].append(url)
+        content = results.get('content_analysis', {})
+        if 'word_count' in content:
+            word_counts.append(content['word_count'])
+
+    crawled = {page['url'] for page in pages}
+    return {
+        'seed_url': seed_url,
+        'pages_crawled': total,
+        'elapsed': round(elapsed, 3) if elapsed is not None else None,
+        'skipped': dict(skipped or {}),
+        'depths': dict(sorted(depths.items())),
+        'status_codes': {str(code): count for code, count in status_codes.items()},
+        'avg_response_time': round(sum(response_times) / len(response_times), 3) if response_times else 0,
+        'avg_performance_score': round(sum(performance_scores) / len(performance_scores), 1) if performance_scores else 0,
+        'avg_word_count': round(sum(word_counts) / len(word_counts), 1) if word_counts else 0,
+        'duplicate_titles': {title: urls for title, urls in titles.items() if len(urls) > 1},
+        'duplicate_meta_descriptions': {text: urls for text, urls in descriptions.items() if len(urls) > 1},
+        'issues': issues,
+        'issue_ratios': {name: _ratio(len(urls), total) for name, urls in issues.items()},
+        # 다른 페이지에서 링크가 없는 페이지 (시작 페이지 제외, 사이트맵으로만 발견된 페이지 등)
+        'orphan_pages': sorted(url for url in crawled if not inbound[url] and url != seed_url),
+        'most_linked_pages': [{'url': url, 'inbound_links': count} for url, count in inbound.most_common(10)]
+    }
@@ -0,0 +1,388 @@
+"""
+기술 지문 - technologies.json의 지문(응답 헤더, 스크립트/스타일시트 주소, 메타 태그, 쿠키 이름 패턴)으로 사용 기술 탐지
+지문은 처음 사용할 때 한 번 컴파일: 정규식마다 반드시 나오는 리터럴(앵커)을 뽑아 Aho-Corasick 오토마톤 하나로 묶고,
+값마다 오토마톤을 한 번만 훑어 앵커가 나온 패턴만 정규식으로 확인하므로 지문이 늘어도 탐지 비용이 거의 일정
+(python fingerprints.py - 페이지 묶음에서 패턴을 하나씩 검사하는 방식과 결과/시간 비교, 지문 수를 늘려 가며 측정)
+
+technologies.json 형식 - 기술 이름: {
+    'category': 분류,
+    'headers': {헤더 이름(소문자): 값 정규식 ('' 이면 헤더가 있기만 하면 일치)},
+    'meta': {메타 name(소문자): content 정규식},
+    'scripts': [스크립트 src 정규식], 'stylesheets': [스타일시트 href 정규식], 'cookies': [쿠키 이름 정규식],
+    'implies': [함께 쓰이는 기술 이름]
+}
+정규식은 대소문자를 구분하지 않고, 첫 번째 그룹이 있으면 버전으로 씀
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+from functools import lru_cache, partial
+
+TECHNOLOGIES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'technologies.json')
+
+# 앵커로 쓰는 리터럴의 최소 길이 (더 짧으면 후보가 너무 많아지므로 앵커 없이 항상 확인)
+MIN_ANCHOR_LENGTH = 3
+
+# Set-Cookie 값에서 쿠키 이름 (requests는 여러 Set-Cookie를 쉼표로 이어 붙임)
+COOKIE_NAME_PATTERN = re.compile(r'(?:^|,)\s*([^=;,\s]+)=')
+
+# 앵커 추출 시 리터럴이 아닌 정규식 문자
+_QUANTIFIERS = '*?{'
+_BREAKS = '.^$+'
+
+
+def required_literals(pattern):
+    """정규식이 일치할 때 반드시 나오는 최상위 리터럴 조각 목록 (소문자)
+
+    그룹과 문자 클래스 안은 보지 않고, 최상위에 |가 있으면 반드시 나오는 조각이 없으므로 빈 목록
+    """
+    runs = []
+    run = ''
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        literal = None
+        if ch == '\\':
+            escaped = pattern[i + 1:i + 2]
+            # \d, \b, \w 같은 이스케이프는 리터럴이 아님
+            if escaped and not escaped.isalnum():
+                literal = escaped
+            i += 2
+        elif ch == '[':
+            i += 1
+            if pattern[i:i + 1] in ('^', ']'):
+                i += 1
+            while i < len(pattern) and pattern[i] != ']':
+                i += 2 if pattern[i] == '\\' else 1
+            i += 1
+        elif ch in '()':
+            depth += 1 if ch == '(' else -1
+            i += 1
+        elif ch == '|':
+            if depth == 0:
+                return []
+            i += 1
+        elif ch in _QUANTIFIERS:
+            if ch == '{':
+                i = pattern.find('}', i) + 1 or len(pattern)
+            else:
+                i += 1
+        elif ch in _BREAKS:
+            # +는 앞 글자가 남지만 그 뒤로는 이어지지 않음
+            i += 1
+        else:
+            literal = ch
+            i += 1
+        # 뒤에 *, ?, {가 붙은 글자는 없을 수도 있으므로 조각을 끊음
+        if literal is not None and depth == 0 and not (i < len(pattern) and pattern[i] in _QUANTIFIERS):
+            run += literal.lower()
+        else:
+            if run:
+                runs.append(run)
+            run = ''
+    if run:
+        runs.append(run)
+    return runs
+
+
+def anchor_for(pattern):
+    """가장 긴 필수 리터럴 (MIN_ANCHOR_LENGTH보다 짧으면 None)"""
+    literals = required_literals(pattern)
+    anchor = max(literals, key=len) if literals else ''
+    return anchor if len(anchor) >= MIN_ANCHOR_LENGTH else None
+
+
+class AhoCorasick:
+    """여러 문자열을 한 번에 찾는 Aho-Corasick 오토마톤 - 텍스트 길이에 비례하고 찾는 문자열 수와는 거의 무관"""
+
+    def __init__(self, words):
+        goto = [{}]
+        outputs = [[]]
+        for index, word in enumerate(words):
+            state = 0
+            for ch in word:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(index)
+
+        # 너비 우선으로 실패 링크를 만들고, 실패 링크 쪽 출력을 미리 합쳐 둠
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            for ch, next_state in goto[state].items():
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(ch, 0)
+                queue.append(next_state)
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(output) for output in outputs]
+        self.states = len(goto)
+
+    def find(self, text):
+        """text에 나오는 단어들의 번호 집합"""
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        found = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return found
+
+
+def _entry_patterns(entry):
+    """지문 항목의 (종류, 정규식 문자열) - 종류: ('header', 이름), ('meta', 이름), 'script', 'stylesheet', 'cookie'"""
+    for name, pattern in entry.get('headers', {}).items():
+        yield ('header', name.lower()), pattern
+    for name, pattern in entry.get('meta', {}).items():
+        yield ('meta', name.lower()), pattern
+    for key, kind in (('scripts', 'script'), ('stylesheets', 'stylesheet'), ('cookies', 'cookie')):
+        for pattern in entry.get(key, []):
+            yield kind, pattern
+
+
+class FingerprintEngine:
+    """기술 지문을 컴파일한 탐지기
+
+    패턴마다 앵커를 뽑아 오토마톤 하나로 묶고, 앵커가 없는 패턴은 종류별로 모아 그 종류의 값에만 확인
+    """
+
+    def __init__(self, technologies):
+        self.technologies = technologies
+        self.patterns = []             # (기술 이름, 종류, 컴파일한 정규식)
+        anchors = {}                   # 앵커 → {종류: [패턴 번호]}
+        self._unanchored = {}          # 종류 → [패턴 번호]
+        for name, entry in technologies.items():
+            for kind, pattern in _entry_patterns(entry):
+                index = len(self.patterns)
+                self.patterns.append((name, kind, re.compile(pattern, re.IGNORECASE)))
+                anchor = anchor_for(pattern)
+                if anchor is None:
+                    self._unanchored.setdefault(kind, []).append(index)
+                else:
+                    anchors.setdefault(anchor, {}).setdefault(kind, []).append(index)
+        self._anchor_words = list(anchors)
+        self._anchor_patterns = [anchors[word] for word in self._anchor_words]
+        self._matcher = AhoCorasick(self._anchor_words)
+
+    def candidates(self, kind, value):
+        """값에 앵커가 나온 패턴과 앵커 없는 패턴의 번호 (지문 순서)"""
+        indexes = set(self._unanchored.get(kind, ()))
+        for word in self._matcher.find(value.lower()):
+            indexes.update(self._anchor_patterns[word].get(kind, ()))
+        return sorted(indexes)
+
+    def detect(self, signals):
+        """(종류, 값) 목록에서 탐지한 기술 - [{'name', 'category', 'version'}] (찾은 순서, 함께 쓰이는 기술은 뒤에)"""
+        found = {}
+        for kind, value in signals:
+            for index in self.candidates(kind, value):
+                self._match(index, value, found)
+        return self._details(found)
+
+    def _match(self, index, value, found):
+        name, _, regex = self.patterns[index]
+        match = regex.search(value)
+        if match is None:
+            return
+        version = match.group(1) if regex.groups else None
+        if found.get(name) is None:
+            found[name] = version or None
+
+    def _details(self, found):
+        names = list(found)
+        # 함께 쓰이는 기술(implies)은 버전 없이 추가
+        for name in names:
+            for implied in self.technologies[name].get('implies', []):
+                if implied not in found:
+                    found[implied] = None
+                    names.append(implied)
+        return [{'name': name, 'category': self.technologies[name]['category'], 'version': found[name]}
+                for name in names]
+
+
+@lru_cache(maxsize=None)
+def load_fingerprints(path=TECHNOLOGIES_PATH):
+    """지문 파일을 읽어 컴파일한 FingerprintEngine (처음 한 번만)"""
+    with open(path, encoding='utf-8') as f:
+        return FingerprintEngine(json.load(f))
+
+
+def page_signals(headers, facts):
+    """응답 헤더와 PageFacts에서 지문과 비교할 (종류, 값) 목록
+
+    headers는 requests 응답 헤더와 aiohttp 헤더(같은 이름이 여러 번 나올 수 있음) 모두 가능
+    """
+    signals = []
+    for name, value in headers.items():
+        name = name.lower()
+        signals.append((('header', name), value))
+        if name == 'set-cookie':
+            signals.extend(('cookie', cookie) for cookie in COOKIE_NAME_PATTERN.findall(value))
+    for meta in facts.metas:
+        if meta['name'] and meta['content']:
+            signals.append((('meta', meta['name'].lower()), meta['content']))
+    signals.extend(('script', script['src']) for script in facts.scripts if script['src'])
+    signals.extend(('stylesheet', href) for href in facts.stylesheets if href)
+    return signals
+
+
+def detect_technologies(headers, facts, engine=None):
+    """페이지에서 사용 기술 탐지 - [{'name', 'category', 'version'}]"""
+    return (engine or load_fingerprints()).detect(page_signals(headers, facts))
+
+
+def _reference_detect(engine, signals):
+    """이전 방식 - 값마다 같은 종류의 패턴을 하나씩 검사 (비교용)"""
+    found = {}
+    for kind, value in signals:
+        for index, (_, pattern_kind, _) in enumerate(engine.patterns):
+            if pattern_kind == kind:
+                engine._match(index, value, found)
+    return engine._details(found)
+
+
+_LITERAL_WORD = re.compile(r'(?<!\\)([a-z]{2,})')
+
+
+def scaled_technologies(technologies, factor):
+    """지문을 factor배로 늘린 사본 - 늘어난 지문은 리터럴을 바꿔 실제 페이지와는 일치하지 않음 (측정용)"""
+    scaled = dict(technologies)
+    for copy in range(1, factor):
+        def mutate(pattern):
+            return _LITERAL_WORD.sub(lambda m: f'{m.group(1)}q{copy}', pattern)
+        for name, entry in technologies.items():
+            clone = {'category': entry['category']}
+            if 'headers' in entry:
+                clone['headers'] = {f'{header}-q{copy}': mutate(pattern) for header, pattern in entry['headers'].items()}
+            if 'meta' in entry:
+                clone['meta'] = {meta: mutate(pattern) for meta, pattern in entry['meta'].items()}
+            for key in ('scripts', 'stylesheets', 'cookies'):
+                if key in entry:
+                    clone[key] = [mutate(pattern) for pattern in entry[key]]
+            scaled[f'{name} #{copy}'] = clone
+    return scaled
+
+
+# 측정용 응답 헤더 (흔한 조합)
+SAMPLE_HEADERS = {
+    'Server': 'nginx/1.25.3',
+    'Content-Type': 'text/html; charset=UTF-8',
+    'X-Powered-By': 'PHP/8.2.12',
+    'Link': '<https://example.com/wp-json/>; rel="https://api.w.org/"',
+    'CF-Ray': '8a1b2c3d4e5f6a7b-ICN',
+    'Cache-Control': 'max-age=600',
+    'Alt-Svc': 'h3=":443"; ma=86400',
+    'Set-Cookie': 'PHPSESSID=abc123; path=/; HttpOnly, __cf_bm=xyz; expires=Sat, 17-Oct-26 10:00:00 GMT; path=/',
+}
+
+# 측정용 실제 사이트 모양 스크립트/스타일시트 주소
+SAMPLE_SCRIPTS = (
+    'https://example.com/wp-includes/js/jquery/jquery.min.js?ver=3.7.1',
+    'https://example.com/wp-includes/js/jquery/jquery-migrate.min.js?ver=3.4.1',
+    'https://example.com/wp-content/plugins/contact-form-7/includes/js/index.js?ver=5.9',
+    'https://www.googletagmanager.com/gtag/js?id=G-XXXXXXX',
+    'https://www.googletagmanager.com/gtm.js?id=GTM-XXXXXX',
+    'https://connect.facebook.net/en_US/fbevents.js',
+    'https://static.hotjar.com/c/hotjar-123.js?sv=6',
+    'https://cdn.jsdelivr.net/npm/swiper@11/swiper-bundle.min.js',
+    'https://cdnjs.cloudflare.com/ajax/libs/gsap/3.12.2/gsap.min.js',
+    'https://wcs.naver.net/wcslog.js',
+    'https://t1.kakaocdn.net/kakao_js_sdk/2.7.2/kakao.min.js',
+    'https://cdn.channel.io/plugin/ch-plugin-web.js',
+    'https://js.tosspayments.com/v1/payment',
+    'https://www.google.com/recaptcha/api.js',
+    '/assets/app.3f9a1c.js',
+)
+SAMPLE_STYLESHEETS = (
+    'https://fonts.googleapis.com/css2?family=Noto+Sans+KR&display=swap',
+    'https://cdn.jsdelivr.net/gh/orioncactus/pretendard/dist/web/static/pretendard.css',
+    'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css',
+    'https://example.com/wp-content/themes/site/style.css',
+)
+
+
+def benchmark_pages():
+    """측정용 페이지 묶음 {이름: (헤더, PageFacts)} - 픽스처 HTML, 벤치마크 페이지, 실제 사이트 모양 페이지"""
+    import tempfile
+    from bs4 import BeautifulSoup
+    from benchmark import build_corpus
+    from fixture_server import FIXTURES_DIR
+    from main import PageFacts, DEFAULT_PARSER
+
+    def facts_for(html):
+        return PageFacts(BeautifulSoup(html, DEFAULT_PARSER))
+
+    pages = {}
+    for filename in sorted(os.listdir(FIXTURES_DIR)):
+        if filename.endswith('.html'):
+            with open(os.path.join(FIXTURES_DIR, filename), encoding='utf-8') as f:
+                pages[f'fixture:{filename}'] = (SAMPLE_HEADERS, facts_for(f.read()))
+    with tempfile.TemporaryDirectory() as directory:
+        for name, path in build_corpus(directory, large_bytes=256 * 1024).items():
+            with open(directory + path, encoding='utf-8') as f:
+                pages[f'corpus:{name}'] = (SAMPLE_HEADERS, facts_for(f.read()))
+    tags = ''.join(f'<script src="{src}"></script>' for src in SAMPLE_SCRIPTS)
+    tags += ''.join(f'<link rel="stylesheet" href="{href}">' for href in SAMPLE_STYLESHEETS)
+    pages['site'] = (SAMPLE_HEADERS, facts_for(
+        f'<html><head><meta name="generator" content="WordPress 6.4.2">{tags}</head><body></body></html>'))
+    return pages
+
+
+def compare_engines(factors=(1, 4, 16), runs=5):
+    """지문 수를 factor배로 늘려 가며 오토마톤 탐지와 패턴별 검사를 비교
+
+    반환: {factor: {'patterns', 'compile', 'engine', 'reference', 'match'}} (시간은 페이지 묶음 전체, 초, 최솟값)
+    """
+    with open(TECHNOLOGIES_PATH, encoding='utf-8') as f:
+        technologies = json.load(f)
+    pages = benchmark_pages()
+    signals = [page_signals(headers, facts) for headers, facts in pages.values()]
+    report = {}
+    for factor in factors:
+        started = time.perf_counter()
+        engine = FingerprintEngine(scaled_technologies(technologies, factor))
+        compile_time = time.perf_counter() - started
+        timings = {}
+        outputs = {}
+        for label, detect in (('engine', engine.detect), ('reference', partial(_reference_detect, engine))):
+            samples = []
+            for _ in range(runs):
+                started = time.perf_counter()
+                outputs[label] = [detect(page) for page in signals]
+                samples.append(time.perf_counter() - started)
+            timings[label] = min(samples)
+        report[factor] = dict(timings, patterns=len(engine.patterns), compile=compile_time,
+                              match=outputs['engine'] == outputs['reference'], pages=len(pages))
+    return report
+
+
+if __name__ == "__main__":
+    report = compare_engines()
+    failed = False
+    for factor, result in report.items():
+        failed = failed or not result['match']
+        speedup = result['reference'] / result['engine'] if result['engine'] else 0
+        print(f"{'✅' if result['match'] else '❌'} 지문 {factor}배 (패턴 {result['patterns']}개, 컴파일 "
+              f"{result['compile'] * 1000:.0f}ms): 페이지 {result['pages']}개 패턴별 검사 "
+              f"{result['reference'] * 1000:.1f}ms → {result['engine'] * 1000:.1f}ms ({speedup:.1f}배)")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,134 @@
+"""
+로컬 픽스처 HTTP 서버 - 네트워크 없이 분석기를 검증하기 위한 도구
+fixtures/ 디렉터리의 페이지를 백그라운드 스레드에서 제공 (선택: 자체 서명 인증서로 HTTPS, 응답 지연 주입)
+"""
+
+import os
+import shutil
+import ssl
+import subprocess
+import threading
+import time
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+# 결과 비교 시 측정 시간에 따라 달라지는 값은 제외
+VOLATILE_KEYS = {'timestamp', 'timings', 'response_time', 'avg_response_time', 'min_response_time',
+                 'max_response_time', 'dns_lookup_time', 'timing_breakdown', 'samples', 'performance_score'}
+
+
+def diff_results(expected, actual, path=''):
+    """두 분석 결과를 비교해 서로 다른 항목을 '경로: 기대값 != 실제값' 목록으로 반환"""
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        differences = []
+        for key in sorted(set(expected) | set(actual)):
+            if key in VOLATILE_KEYS:
+                continue
+            differences += diff_results(expected.get(key), actual.get(key), f"{path}.{key}" if path else key)
+        return differences
+    return [] if expected == actual else [f"{path}: {expected!r} != {actual!r}"]
+
+
+def fixture_pages(directory=FIXTURES_DIR):
+    """픽스처 디렉터리의 HTML 페이지 경로 목록 ('/index.html' 형식)"""
+    return sorted('/' + name for name in os.listdir(directory) if name.endswith('.html'))
+
+
+def make_self_signed_cert(directory, host='127.0.0.1'):
+    """openssl로 host용 자체 서명 인증서를 만들어 (인증서 파일, 키 파일) 반환
+
+    클라이언트는 인증서 파일을 CA로 지정해 검증 (URLAnalyzer(ca_bundle=인증서 파일))
+    """
+    if shutil.which('openssl') is None:
+        raise RuntimeError("HTTPS 픽스처 서버에 필요한 openssl 명령을 찾을 수 없습니다")
+    certfile = os.path.join(directory, 'fixture-cert.pem')
+    keyfile = os.path.join(directory, 'fixture-key.pem')
+    subprocess.run(
+        ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+         '-keyout', keyfile, '-out', certfile, '-subj', f'/CN={host}',
+         '-addext', f'subjectAltName=IP:{host},DNS:localhost'],
+        check=True, capture_output=True
+    )
+    return certfile, keyfile
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """요청 로그를 출력하지 않는 정적 파일 핸들러 (latency초 뒤에 응답 시작)"""
+
+    def __init__(self, *args, latency=0.0, **kwargs):
+        self.latency = latency
+        super().__init__(*args, **kwargs)
+
+    def send_head(self):
+        if self.latency > 0:
+            time.sleep(self.latency)
+        return super().send_head()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer:
+    """픽스처 디렉터리를 제공하는 로컬 서버 (with 문으로 사용)
+
+    latency: 요청마다 응답 전에 기다리는 시간(초) - 네트워크 지연 흉내
+    certfile/keyfile: 지정하면 HTTPS로 제공 (make_self_signed_cert로 생성 가능)
+    """
+
+    def __init__(self, directory=FIXTURES_DIR, host='127.0.0.1', port=0, latency=0.0, certfile=None, keyfile=None):
+        self.directory = directory
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.certfile = certfile
+        self.keyfile = keyfile
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        scheme = 'https' if self.certfile else 'http'
+        return f"{scheme}://{self.host}:{self.port}"
+
+    def url(self, path='/'):
+        return self.base_url + path
+
+    def start(self):
+        handler = partial(_QuietHandler, directory=self.directory, latency=self.latency)
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        if self.certfile:
+            context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+            context.load_cert_chain(self.certfile, self.keyfile)
+            # TLS 핸드셰이크는 accept 스레드가 아니라 요청 처리 스레드에서 수행
+            self._server.socket = context.wrap_socket(self._server.socket, server_side=True,
+                                                      do_handshake_on_connect=False)
+        # port=0이면 운영체제가 빈 포트를 할당
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    with FixtureServer(port=8765) as server:
+        print(f"🧪 픽스처 서버 실행 중: {server.base_url} (Ctrl+C로 종료)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
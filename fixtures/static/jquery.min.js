@@ -0,0 +1,15 @@
+/*! 픽스처용 jQuery 대체 스크립트 - 파일 이름으로 기술 감지를, 크기로 페이지 무게 분석을 확인 */
+(function(global){"use strict";function $(selector){return new Collection(typeof selector==="string"?global.document.querySelectorAll(selector):[selector])}
+function Collection(nodes){this.length=nodes.length;for(var i=0;i<nodes.length;i++){this[i]=nodes[i]}}
+Collection.prototype.each=function(callback){for(var i=0;i<this.length;i++){callback.call(this[i],i,this[i])}return this};
+Collection.prototype.on=function(type,handler){return this.each(function(){this.addEventListener(type,handler)})};
+Collection.prototype.off=function(type,handler){return this.each(function(){this.removeEventListener(type,handler)})};
+Collection.prototype.addClass=function(name){return this.each(function(){this.classList.add(name)})};
+Collection.prototype.removeClass=function(name){return this.each(function(){this.classList.remove(name)})};
+Collection.prototype.toggleClass=function(name){return this.each(function(){this.classList.toggle(name)})};
+Collection.prototype.text=function(value){if(value===undefined){return this.length?this[0].textContent:""}return this.each(function(){this.textContent=value})};
+Collection.prototype.attr=function(name,value){if(value===undefined){return this.length?this[0].getAttribute(name):null}return this.each(function(){this.setAttribute(name,value)})};
+Collection.prototype.css=function(name,value){return this.each(function(){this.style[name]=value})};
+Collection.prototype.hide=function(){return this.css("display","none")};Collection.prototype.show=function(){return this.css("display","")};
+$.fn=Collection.prototype;$.ready=function(callback){if(global.document.readyState!=="loading"){callback()}else{global.document.addEventListener("DOMContentLoaded",callback)}};
+$.version="3.6.0-fixture";global.jQuery=global.$=$})(typeof window!=="undefined"?window:this);
@@ -0,0 +1,184 @@
+"""
+분석 작업 큐 - 요청 스레드를 막지 않도록 분석을 백그라운드 작업자 풀에서 실행
+대기열이 가득 차면 새 작업을 거부하고(QueueFullError), 끝난 작업 결과는 일정 시간 보관
+스트리밍 작업은 진행 중에 나오는 이벤트를 기록해 구독자가 순서대로 받아갈 수 있음
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# 작업 상태
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+FINISHED_STATUSES = (DONE, FAILED)
+
+
+class QueueFullError(Exception):
+    """대기 중인 작업 수가 상한에 도달해 새 작업을 받을 수 없음"""
+
+    def __init__(self, retry_after):
+        super().__init__("분석 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요")
+        self.retry_after = retry_after  # 다시 시도하기까지 권장 대기 시간(초)
+
+
+class JobQueue:
+    """크기가 제한된 백그라운드 작업 큐 (스레드 안전)
+
+    max_workers: 동시에 실행할 작업 수
+    max_pending: 실행을 기다릴 수 있는 작업 수 (넘으면 submit이 QueueFullError)
+    result_ttl: 끝난 작업 결과를 보관하는 시간(초)
+    """
+
+    def __init__(self, max_workers=4, max_pending=32, result_ttl=600):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self.rejected = 0
+        self._jobs = OrderedDict()
+        self._active = 0  # 대기 + 실행 중인 작업 수
+        self._durations = []  # 최근 작업 소요 시간 (Retry-After 추정용)
+        self._changed = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='analysis-job')
+
+    def submit(self, fn, *args, **kwargs):
+        """작업을 등록하고 작업 id를 바로 반환"""
+        return self._submit(fn, args, kwargs, stream=False)
+
+    def submit_stream(self, fn, *args, **kwargs):
+        """(이벤트 이름, 데이터)를 반환하는 이터레이터 함수를 작업으로 등록
+
+        각 이벤트는 events()로 구독할 수 있고, 마지막 이벤트의 데이터가 작업 결과가 됨
+        """
+        return self._submit(fn, args, kwargs, stream=True)
+
+    def _submit(self, fn, args, kwargs, stream):
+        with self._changed:
+            self._expire()
+            if self._active >= self.max_workers + self.max_pending:
+                self.rejected += 1
+                raise QueueFullError(self._retry_after())
+            job_id = uuid.uuid4().hex
+            self._jobs[job_id] = {
+                'id': job_id,
+                'status': QUEUED,
+                'created_at': time.time(),
+                'started_at': None,
+                'finished_at': None,
+                'result': None,
+                'error': None,
+                'events': []
+            }
+            self._active += 1
+        self._executor.submit(self._run, job_id, fn, args, kwargs, stream)
+        return job_id
+
+    def _run(self, job_id, fn, args, kwargs, stream):
+        self._update(job_id, status=RUNNING, started_at=time.time())
+        try:
+            if stream:
+                result = None
+                for event, data in fn(*args, **kwargs):
+                    self._publish(job_id, event, data)
+                    result = data
+            else:
+                result = fn(*args, **kwargs)
+            changes = {'status': DONE, 'result': result}
+        except Exception as e:
+            changes = {'status': FAILED, 'error': str(e)}
+        with self._changed:
+            self._active -= 1
+            self._update(job_id, finished_at=time.time(), **changes)
+
+    def _update(self, job_id, **changes):
+        with self._changed:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.update(changes)
+                if job['status'] in FINISHED_STATUSES:
+                    self._durations = (self._durations + [job['finished_at'] - job['started_at']])[-50:]
+            self._changed.notify_all()
+
+    def _publish(self, job_id, event, data):
+        with self._changed:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job['events'].append((event, data))
+            self._changed.notify_all()
+
+    def events(self, job_id, after=0, wait=0):
+        """after번째 이후의 이벤트 목록과 작업 상태 (작업이 없으면 None)
+
+        새 이벤트가 없고 작업이 끝나지 않았으면 wait초 동안 기다림
+        """
+        deadline = time.time() + wait
+        with self._changed:
+            while True:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    return None
+                remaining = deadline - time.time()
+                if len(job['events']) > after or job['status'] in FINISHED_STATUSES or remaining <= 0:
+                    return job['events'][after:], job['status']
+                self._changed.wait(remaining)
+
+    def get(self, job_id, wait=0):
+        """작업 정보 (없거나 만료되면 None) - wait초 동안 작업이 끝나기를 기다릴 수 있음 (롱 폴링)"""
+        deadline = time.time() + wait
+        with self._changed:
+            while True:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    return None
+                remaining = deadline - time.time()
+                if job['status'] in FINISHED_STATUSES or remaining <= 0:
+                    info = {key: value for key, value in job.items() if key != 'events'}
+                    info['position'] = self._position(job_id)
+                    return info
+                self._changed.wait(remaining)
+
+    def _position(self, job_id):
+        """대기 중인 작업이면 앞에 남은 대기 작업 수, 아니면 None"""
+        if self._jobs[job_id]['status'] != QUEUED:
+            return None
+        position = 0
+        for other_id, job in self._jobs.items():
+            if other_id == job_id:
+                return position
+            if job['status'] == QUEUED:
+                position += 1
+
+    def _retry_after(self):
+        """지금 대기열이 비워지기까지 걸릴 시간 추정(초)"""
+        average = sum(self._durations) / len(self._durations) if self._durations else 10
+        return max(1, round(average * self._active / self.max_workers))
+
+    def _expire(self):
+        # 결과 보관 시간이 지난 작업 정리 (등록 순서대로 저장되어 있음)
+        cutoff = time.time() - self.result_ttl
+        for job_id in [job_id for job_id, job in self._jobs.items()
+                       if job['status'] in FINISHED_STATUSES and job['finished_at'] < cutoff]:
+            del self._jobs[job_id]
+
+    def stats(self):
+        with self._changed:
+            self._expire()
+            counts = {QUEUED: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+            for job in self._jobs.values():
+                counts[job['status']] += 1
+            return {
+                'queued': counts[QUEUED],
+                'running': counts[RUNNING],
+                'done': counts[DONE],
+                'failed': counts[FAILED],
+                'rejected': self.rejected,
+                'max_workers': self.max_workers,
+                'max_pending': self.max_pending
+            }
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
@@ -1,50 +1,741 @@
 """
 URL Analytics Library - 종합적인 URL 분석 도구
-pip install requests beautifulsoup4 selenium webdriver-manager matplotlib seaborn pandas nltk textstat whois python-whois
+pip install requests beautifulsoup4 selenium webdriver-manager matplotlib seaborn pandas nltk whois python-whois
+
+NLTK는 선택 사항이며 처음 사용할 때 불러옴. NLTK 데이터는 실행 중에 다운로드하지 않으므로 미리 설치:
+python -m nltk.downloader stopwords
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+from bs4.element import Tag, NavigableString, CData
 import time
 import re
 from urllib.parse import urljoin, urlparse, parse_qs
-from collections import Counter, defaultdict
+from contextlib import nullcontext
+import xml.etree.ElementTree as ElementTree
+from collections import Counter, OrderedDict, defaultdict, deque
 import json
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
+import importlib
+import importlib.util
+from functools import partial, lru_cache
 from datetime import datetime, timedelta
 import ssl
 import socket
+import zlib
+import http.client
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import warnings
 warnings.filterwarnings('ignore')
 
-# NLTK와 textstat은 선택적으로 사용
-try:
-    import nltk
-    from nltk.corpus import stopwords
-    from nltk.tokenize import word_tokenize
-    NLTK_AVAILABLE = True
-except ImportError:
-    NLTK_AVAILABLE = False
+from crawler import CrawlFrontier, build_site_report
+from politeness import THROTTLE_STATUSES
+from text_analytics import TextStats
+from readability import readability
+from fingerprints import detect_technologies
+from page_weight import (page_assets, probe_details, response_size, summarize_page_weight, ASSET_ACCEPT_ENCODING,
+                         RANGE_PROBE_HEADER, MAX_COUNTED_BYTES, head_is_final, unprobed_details)
+
+# NLTK는 선택적으로 사용 - import가 느리므로 설치 여부만 확인하고 처음 사용할 때 불러옴
+NLTK_AVAILABLE = importlib.util.find_spec('nltk') is not None
+if not NLTK_AVAILABLE:
     print("NLTK가 설치되지 않아 기본 텍스트 분석을 사용합니다.")
 
-try:
-    from textstat import flesch_reading_ease, flesch_kincaid_grade
-    TEXTSTAT_AVAILABLE = True
-except ImportError:
-    TEXTSTAT_AVAILABLE = False
-    print("textstat이 설치되지 않아 가독성 분석을 건너뜁니다.")
+
+@lru_cache(maxsize=None)
+def lazy_import(name):
+    """모듈을 처음 요청할 때 import해 재사용 (설치되지 않았으면 None)"""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def _nltk_data_installed(resource):
+    """NLTK 데이터가 로컬에 있는지 확인 - 실행 중에는 절대 다운로드하지 않음"""
+    nltk = lazy_import('nltk') if NLTK_AVAILABLE else None
+    if nltk is None:
+        return False
+    try:
+        nltk.data.find(resource)
+        return True
+    except LookupError:
+        return False
+
+
+@lru_cache(maxsize=None)
+def load_nltk_stopwords():
+    """설치된 NLTK 영어 불용어 (데이터가 없으면 빈 집합)"""
+    if not _nltk_data_installed('corpora/stopwords'):
+        if NLTK_AVAILABLE:
+            print("NLTK stopwords 데이터가 없어 기본 불용어만 사용합니다 (python -m nltk.downloader stopwords)")
+        return frozenset()
+    from nltk.corpus import stopwords
+    return frozenset(stopwords.words('english'))
+
+
+# 성능 측정 시 요청 한 번을 나누어 기록하는 단계
+TIMING_PHASES = ('dns', 'connect', 'tls', 'ttfb', 'download')
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+# 페이지 본문에서 나오는 분석 단계 - 304 재검증 시 저장된 결과를 재사용
+PAGE_STAGES = ('basic_info', 'seo_analysis', 'content_analysis', 'technical_analysis', 'page_weight',
+               'security_analysis', 'keyword_analysis', 'social_media', 'mobile_analysis')
+
+# analyze_url 결과에서 분석 단계별로 채워지는 섹션 (analyze_url_iter가 이 이름으로 반환)
+RESULT_SECTIONS = ('basic_info', 'seo_analysis', 'performance', 'page_weight', 'content_analysis',
+                   'technical_analysis', 'security_analysis', 'keyword_analysis', 'social_media', 'mobile_analysis')
+
+# HTML 파서 백엔드 - 'auto'는 설치된 것 중 가장 빠른 파서를 사용
+FAST_PARSERS = ('lxml',)
+DEFAULT_PARSER = 'html.parser'
+
+def resolve_parser(parser='auto'):
+    """사용할 BeautifulSoup 파서 결정 - 요청한 파서가 없으면 html.parser로 대체"""
+    if parser == 'auto':
+        for candidate in FAST_PARSERS:
+            if builder_registry.lookup(candidate):
+                return candidate
+        return DEFAULT_PARSER
+    if builder_registry.lookup(parser):
+        return parser
+    print(f"{parser} 파서가 설치되지 않아 {DEFAULT_PARSER}를 사용합니다.")
+    return DEFAULT_PARSER
+
+# 본문을 읽을 때 한 번에 가져오는 크기
+READ_CHUNK_SIZE = 16 * 1024
+
+
+class BodyBudget:
+    """본문 읽기 예산 - 바이트 수나 경과 시간이 한도를 넘으면 읽기를 중단
+    
+    max_bytes: 보관할 최대 바이트 수 (None이면 무제한)
+    max_seconds: 본문을 읽는 최대 시간(초, None이면 무제한) - 청크 사이에서 확인
+    """
+    
+    def __init__(self, max_bytes=None, max_seconds=None):
+        self.max_bytes = max_bytes
+        self.deadline = time.time() + max_seconds if max_seconds is not None else None
+        self.size = 0
+        self.truncated = False
+        self._chunks = []
+    
+    def add(self, chunk):
+        """청크를 보관하고, 더 읽어도 되면 True 반환"""
+        if self.max_bytes is not None and self.size + len(chunk) > self.max_bytes:
+            chunk = chunk[:self.max_bytes - self.size]
+            self.truncated = True
+        self._chunks.append(chunk)
+        self.size += len(chunk)
+        if self.deadline is not None and time.time() >= self.deadline:
+            self.truncated = True
+        return not self.truncated
+    
+    def body(self):
+        content = b''.join(self._chunks)
+        self._chunks = [content]
+        return content
+
+
+# 압축을 풀어 만드는 최대 바이트 수 (읽기 예산이 없을 때도 적용 - 압축 폭탄 방지)
+MAX_DECOMPRESSED_BYTES = 64 * 1024 * 1024
+# robots.txt/sitemap 읽기 예산 - robots.txt는 500KiB까지만 해석(RFC 9309), 사이트맵은 압축 전 50MB 이하(sitemaps.org)
+ROBOTS_MAX_BYTES = 500 * 1024
+SITEMAP_MAX_BYTES = 50 * 1000 * 1000
+PROBE_MAX_SECONDS = 10
+
+
+def decompress_limited(data, wbits, max_bytes=MAX_DECOMPRESSED_BYTES):
+    """압축 해제 결과를 max_bytes까지만 만듦 (잘린 압축 데이터는 풀린 데까지) - (본문, 한도에서 잘렸는지)"""
+    decompressor = zlib.decompressobj(wbits)
+    body = decompressor.decompress(data, max_bytes)
+    return body, bool(decompressor.unconsumed_tail)
+
+
+class PageFacts:
+    """문서를 한 번만 순회하며 분석기들이 쓰는 정보를 모아 둔 구조
+    
+    본문용 값(visible_*)은 script/style/nav/header/footer 안의 요소를 제외한 결과
+    """
+    
+    # 본문 텍스트 분석에서 제외하는 요소
+    HIDDEN_TAGS = frozenset(['script', 'style', 'nav', 'header', 'footer'])
+    # get_text()가 포함하는 문자열 종류 (주석, doctype 등 제외)
+    TEXT_TYPES = (NavigableString, CData)
+    HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+    
+    def __init__(self, soup):
+        self.doctype = str(soup.contents[0]) if soup.contents else ''
+        self.has_html_tag = False
+        self.lang = None
+        self.title = None             # 첫 <title>의 문자열 (없으면 None)
+        self.visible_title = None
+        self.metas = []               # {'name', 'property', 'content', 'hidden'}
+        self.headings = {tag: [] for tag in self.HEADING_TAGS}
+        self.visible_headings = []    # 본문의 h1~h3 텍스트 (문서 순서)
+        self.images = []              # {'src', 'alt', 'title', 'srcset'}
+        self.links = []               # <a href> 값
+        self.scripts = []             # {'src', 'type', 'async', 'defer'}
+        self.stylesheets = []         # <link rel="stylesheet"> href 값
+        self.resource_links = []      # href가 있는 <link> {'rel'(소문자 목록), 'href', 'as', 'media'}
+        self.ld_json = []             # application/ld+json 블록 내용
+        self.style_blocks = 0
+        self.media_style_blocks = 0   # @media를 포함한 <style> 수
+        self.paragraph_count = 0
+        self.visible_paragraph_count = 0
+        
+        text_parts = []
+        self._walk(soup, text_parts)
+        self.visible_text = ''.join(text_parts)
+    
+    def _walk(self, soup, text_parts):
+        # 깊은 문서에서도 재귀 한도에 걸리지 않도록 스택으로 순회
+        stack = [(iter(soup.contents), False)]
+        while stack:
+            children, hidden = stack[-1]
+            node = next(children, None)
+            if node is None:
+                stack.pop()
+            elif isinstance(node, Tag):
+                node_hidden = hidden or node.name in self.HIDDEN_TAGS
+                self._collect(node, node_hidden)
+                stack.append((iter(node.contents), node_hidden))
+            elif not hidden and type(node) in self.TEXT_TYPES:
+                text_parts.append(node)
+    
+    def _collect(self, tag, hidden):
+        name = tag.name
+        if name == 'meta':
+            self.metas.append({
+                'name': tag.get('name'),
+                'property': tag.get('property'),
+                'content': tag.get('content'),
+                'hidden': hidden
+            })
+        elif name == 'a':
+            href = tag.get('href')
+            if href is not None:
+                self.links.append(href)
+        elif name == 'img':
+            self.images.append({
+                'src': tag.get('src'),
+                'alt': tag.get('alt'),
+                'title': tag.get('title'),
+                'srcset': tag.get('srcset')
+            })
+        elif name == 'p':
+            self.paragraph_count += 1
+            if not hidden:
+                self.visible_paragraph_count += 1
+        elif name in self.headings:
+            text = tag.get_text().strip()
+            self.headings[name].append(text)
+            if not hidden and name in ('h1', 'h2', 'h3'):
+                self.visible_headings.append(text)
+        elif name == 'script':
+            script_type = tag.get('type')
+            self.scripts.append({'src': tag.get('src'), 'type': script_type,
+                                 'async': tag.has_attr('async'), 'defer': tag.has_attr('defer')})
+            if script_type == 'application/ld+json':
+                self.ld_json.append(tag.string or '')
+        elif name == 'link':
+            rel = tag.get('rel') or []
+            if 'stylesheet' in rel:
+                self.stylesheets.append(tag.get('href'))
+            if tag.get('href') is not None:
+                self.resource_links.append({
+                    'rel': [value.lower() for value in rel],
+                    'href': tag.get('href'),
+                    'as': tag.get('as'),
+                    'media': tag.get('media')
+                })
+        elif name == 'style':
+            self.style_blocks += 1
+            if tag.string is not None and '@media' in tag.string:
+                self.media_style_blocks += 1
+        elif name == 'title':
+            if self.title is None:
+                self.title = tag.string
+            if self.visible_title is None and not hidden:
+                self.visible_title = tag.string
+        elif name == 'html' and not self.has_html_tag:
+            self.has_html_tag = True
+            self.lang = tag.get('lang')
+    
+    def find_meta(self, name=None, visible_only=False):
+        """name 속성이 일치하는 첫 메타 태그 (없으면 None)"""
+        for meta in self.metas:
+            if meta['name'] == name and not (visible_only and meta['hidden']):
+                return meta
+        return None
+    
+    def meta_content(self, name, visible_only=False):
+        """name이 일치하는 메타 태그, 없으면 property가 일치하는 메타 태그의 content"""
+        meta = self.find_meta(name, visible_only)
+        if meta is None:
+            for candidate in self.metas:
+                if candidate['property'] == name and not (visible_only and candidate['hidden']):
+                    meta = candidate
+                    break
+        if meta is None or meta['content'] is None:
+            return ''
+        return meta['content']
+
+
+class PageContext:
+    """한 번 요청하고 한 번 파싱한 페이지를 모든 분석기가 공유하기 위한 컨텍스트"""
+    
+    def __init__(self, url, response=None, error=None, parser=DEFAULT_PARSER, truncated=False):
+        self.url = url
+        self.response = response
+        self.error = error
+        self.parser = parser
+        self.truncated = truncated  # 읽기 예산을 넘어 본문 일부만 받았는지 여부
+        # 렌더 모드에서 브라우저가 스크립트를 실행한 뒤의 페이지 (browser_pool.RenderedPage, 있으면 분석에 사용)
+        self.rendered = None
+        self.render_error = None    # 렌더링 실패 사유 (받은 HTML 그대로 분석)
+        self._text = None
+        self._soup = None
+        self._facts = None
+        self._text_stats = None
+        # 여러 분석 단계가 동시에 접근해도 한 번만 파싱되도록 보호
+        self._lock = threading.RLock()
+    
+    @property
+    def headers(self):
+        return self.response.headers
+    
+    @property
+    def not_modified(self):
+        """조건부 요청에 304로 응답했는지 여부"""
+        return self.response is not None and self.response.status_code == 304
+    
+    @property
+    def content(self):
+        return self.response.content
+    
+    @property
+    def text(self):
+        """디코딩된 본문 (최초 접근 시 한 번만 디코딩, 렌더링했으면 렌더링된 DOM)"""
+        with self._lock:
+            if self._text is None:
+                self._text = self.rendered.html if self.rendered is not None else self.response.text
+        return self._text
+    
+    @property
+    def soup(self):
+        """파싱된 문서 트리 - 분석기 간에 공유되므로 수정하면 안 됨"""
+        with self._lock:
+            if self._soup is None:
+                # 렌더링된 DOM은 이미 디코딩된 문자열이므로 그대로 파싱
+                markup = self.rendered.html if self.rendered is not None else self.content
+                self._soup = BeautifulSoup(markup, self.parser)
+        return self._soup
+    
+    @property
+    def facts(self):
+        """문서를 한 번 순회해 모은 분석용 정보"""
+        with self._lock:
+            if self._facts is None:
+                self._facts = PageFacts(self.soup)
+        return self._facts
+    
+    @property
+    def text_stats(self):
+        """본문을 한 번 토큰화해 모은 단어 통계 (text_analytics.TextStats, 콘텐츠/키워드 분석이 공유)"""
+        with self._lock:
+            if self._text_stats is None:
+                self._text_stats = TextStats.from_facts(self.facts)
+        return self._text_stats
+
+
+@lru_cache(maxsize=1024)
+def _robots_pattern(pattern):
+    """robots.txt 경로 패턴을 정규식으로 변환 (* = 임의 문자열, 끝의 $ = 경로 끝)"""
+    anchored = pattern.endswith('$')
+    body = pattern[:-1] if anchored else pattern
+    regex = '.*'.join(re.escape(part) for part in body.split('*'))
+    return re.compile(regex + ('$' if anchored else ''))
+
+
+class RobotsRules:
+    """robots.txt 규칙 (RFC 9309) - User-agent 그룹별 Allow/Disallow, Crawl-delay, Sitemap 목록
+    
+    status_code가 None이면 robots.txt를 가져오지 못한 것으로 보고 모든 경로를 허용
+    """
+    
+    def __init__(self, text='', status_code=None):
+        self.status_code = status_code
+        self.found = status_code == 200
+        self.sitemaps = []
+        self.groups = []  # {'agents': [...], 'rules': [(허용 여부, 패턴)], 'crawl_delay': 초}
+        if self.found:
+            self._parse(text)
+    
+    def _parse(self, text):
+        group = None
+        previous_was_agent = False
+        for raw_line in text.splitlines():
+            line = raw_line.split('#', 1)[0].strip()
+            if ':' not in line:
+                continue
+            key, value = (part.strip() for part in line.split(':', 1))
+            key = key.lower()
+            
+            if key == 'user-agent':
+                # 연속된 User-agent 줄은 같은 그룹
+                if group is None or not previous_was_agent:
+                    group = {'agents': [], 'rules': [], 'crawl_delay': None}
+                    self.groups.append(group)
+                group['agents'].append(value.lower())
+                previous_was_agent = True
+                continue
+            previous_was_agent = False
+            
+            if key == 'sitemap':
+                if value:
+                    self.sitemaps.append(value)
+            elif group is None:
+                continue
+            elif key in ('allow', 'disallow') and value:
+                group['rules'].append((key == 'allow', value))
+            elif key == 'crawl-delay':
+                try:
+                    group['crawl_delay'] = float(value)
+                except ValueError:
+                    pass
+    
+    def _groups_for(self, user_agent):
+        """User-Agent에 해당하는 그룹 (이름이 맞는 그룹이 없으면 * 그룹)"""
+        token = user_agent.split('/')[0].strip().lower()
+        specific = [group for group in self.groups
+                    if any(agent != '*' and agent in token for agent in group['agents'])]
+        return specific or [group for group in self.groups if '*' in group['agents']]
+    
+    def can_fetch(self, url, user_agent='*'):
+        """경로에 가장 길게 일치하는 규칙을 따름 (길이가 같으면 Allow 우선)"""
+        if self.status_code is not None and self.status_code >= 500:
+            # 서버 오류로 규칙을 알 수 없으면 전체 금지로 간주
+            return False
+        parsed = urlparse(url)
+        path = (parsed.path or '/') + (f'?{parsed.query}' if parsed.query else '')
+        best_length, allowed = -1, True
+        for group in self._groups_for(user_agent):
+            for allow, pattern in group['rules']:
+                if _robots_pattern(pattern).match(path):
+                    length = len(pattern)
+                    if length > best_length or (length == best_length and allow):
+                        best_length, allowed = length, allow
+        return allowed
+    
+    def crawl_delay(self, user_agent='*'):
+        for group in self._groups_for(user_agent):
+            if group['crawl_delay'] is not None:
+                return group['crawl_delay']
+        return None
+    
+    def summary(self, url, user_agent='*'):
+        """분석 결과용 요약"""
+        return {
+            'found': self.found,
+            'status_code': self.status_code,
+            'allowed': self.can_fetch(url, user_agent),
+            'crawl_delay': self.crawl_delay(user_agent),
+            'sitemaps': list(self.sitemaps),
+            'groups': len(self.groups)
+        }
+
+
+# 사이트맵 프로토콜의 URL 수 상한
+SITEMAP_MAX_URLS = 50000
+# 크롤링 시작 시 사이트맵 인덱스를 따라 읽는 최대 사이트맵 파일 수
+SITEMAP_MAX_FILES = 20
+
+
+class Sitemap:
+    """sitemap.xml 내용 - urlset(페이지 목록) 또는 sitemapindex(하위 사이트맵 목록), 텍스트 사이트맵도 지원
+    
+    base_url을 주면 상대 경로로 적힌 <loc>도 절대 URL로 변환
+    """
+    
+    def __init__(self, content=b'', status_code=None, base_url=None):
+        self.status_code = status_code
+        self.base_url = base_url
+        self.found = status_code == 200
+        self.type = None
+        self.urls = []
+        self.sitemaps = []
+        self.error = None
+        if self.found:
+            try:
+                self._parse(content)
+            except (ElementTree.ParseError, OSError, EOFError, zlib.error) as e:
+                self.error = str(e)
+        self._url_set = frozenset(self.urls)
+    
+    def _parse(self, content):
+        if content[:2] == b'\x1f\x8b':
+            content, _ = decompress_limited(content, 16 + zlib.MAX_WBITS, SITEMAP_MAX_BYTES)
+        if not content.lstrip().startswith(b'<'):
+            # 텍스트 사이트맵 - 한 줄에 URL 하나
+            self.type = 'text'
+            lines = content.decode('utf-8', errors='replace').splitlines()
+            self.urls = [line.strip() for line in lines if line.strip().startswith(('http://', 'https://'))]
+            del self.urls[SITEMAP_MAX_URLS:]
+            return
+        
+        root = ElementTree.fromstring(content)
+        # 네임스페이스를 제외한 태그 이름으로 비교
+        self.type = root.tag.rsplit('}', 1)[-1]
+        target = self.sitemaps if self.type == 'sitemapindex' else self.urls
+        for element in root.iter():
+            if element.tag.rsplit('}', 1)[-1] == 'loc' and element.text and element.text.strip():
+                loc = element.text.strip()
+                target.append(urljoin(self.base_url, loc) if self.base_url else loc)
+                if len(target) >= SITEMAP_MAX_URLS:
+                    break
+    
+    def contains(self, url):
+        return url in self._url_set
+    
+    def summary(self, url):
+        """분석 결과용 요약"""
+        summary = {
+            'found': self.found,
+            'status_code': self.status_code,
+            'type': self.type,
+            'url_count': len(self.urls),
+            'child_sitemaps': len(self.sitemaps),
+            'contains_page': self.contains(url)
+        }
+        if self.error:
+            summary['error'] = self.error
+        return summary
+
+
+# 점수 계산 가중치 - URLAnalyzer(score_weights=...)에서 바꿀 항목만 지정 (scoring.py의 일괄 계산도 같은 값 사용)
+DEFAULT_SCORE_WEIGHTS = {
+    'performance': {
+        'size_penalty_per_mb': 10,       # 본문 MB당 감점
+        'time_penalty_per_second': 20,   # 평균 응답 시간 초당 감점
+        'ttfb_penalty_per_second': 50    # 첫 바이트 시간 초당 감점
+    },
+    'mobile': {
+        'viewport': 40,        # 뷰포트 메타 태그
+        'device_width': 30,    # width=device-width
+        'media_queries': 30    # @media 규칙
+    },
+    'seo': {
+        'meta_tag': 10         # 메타 태그 하나당
+    },
+    'security': {
+        'https': 85,
+        'http': 45
+    }
+}
+
+
+def merge_score_weights(weights=None):
+    """기본 가중치에 지정한 항목만 덮어쓴 가중치"""
+    weights = weights or {}
+    return {group: dict(defaults, **weights.get(group, {})) for group, defaults in DEFAULT_SCORE_WEIGHTS.items()}
+
+
+# 재시도할 응답 상태 - 일시적인 과부하/게이트웨이 오류
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def enable_http2():
+    """urllib3의 실험적 HTTP/2 지원 활성화 (h2 패키지 필요, 프로세스 전체에 적용) - 성공 여부 반환"""
+    try:
+        from urllib3.http2 import inject_into_urllib3
+        inject_into_urllib3()
+        return True
+    except ImportError:
+        print("HTTP/2를 사용하려면 h2를 설치해주세요 (pip install urllib3[h2]). HTTP/1.1을 사용합니다.")
+        return False
+
+
+class PoliteAdapter(HTTPAdapter):
+    """요청마다 스케줄러(politeness.HostScheduler)의 호스트 속도 제한을 따르는 어댑터
+    
+    scheduler가 None이면 일반 HTTPAdapter와 같음
+    ca_bundle: 인증서 검증에 항상 쓸 CA 파일 (REQUESTS_CA_BUNDLE 등 환경 변수보다 우선)
+    """
+    
+    def __init__(self, scheduler=None, ca_bundle=None, **kwargs):
+        self.scheduler = scheduler
+        self.ca_bundle = ca_bundle
+        super().__init__(**kwargs)
+    
+    def send(self, request, **kwargs):
+        if self.ca_bundle and kwargs.get('verify') is not False:
+            kwargs['verify'] = self.ca_bundle
+        if self.scheduler is None:
+            return super().send(request, **kwargs)
+        host = urlparse(request.url).netloc.lower()
+        with self.scheduler.slot(host):
+            response = super().send(request, **kwargs)
+        self.scheduler.note_response(host, response.status_code, response.headers)
+        return response
+
+
+class ConnectionPool:
+    """스레드마다 별도의 requests.Session을 주되, 연결 풀(HTTPAdapter)은 모든 스레드가 공유
+    
+    Session은 쿠키/헤더 상태 때문에 스레드 간 공유가 안전하지 않지만
+    urllib3 연결 풀은 스레드 안전하므로 연결만 재사용
+    
+    pool_connections: 연결 풀을 유지할 호스트 수
+    pool_maxsize: 호스트당 유지할 연결 수
+    pool_block: True면 호스트당 연결이 모두 사용 중일 때 새로 만들지 않고 대기
+    retries/backoff_factor: 연결 실패와 일시적 오류 응답(RETRY_STATUSES)의 재시도 횟수와 지수 백오프 계수
+        (Retry-After는 따르지 않음 - 스케줄러가 있으면 429/503은 재시도하지 않고 스케줄러가 호스트 단위로 미룸)
+    keep_alive: False면 요청마다 연결을 닫음
+    scheduler: 호스트별 속도 제한 스케줄러 (politeness.HostScheduler, None이면 제한 없음)
+    ca_bundle: 서버 인증서 검증에 쓸 CA 인증서 파일 (None이면 기본 신뢰 저장소)
+    """
+    
+    def __init__(self, headers, pool_connections=10, pool_maxsize=16, pool_block=False,
+                 retries=2, backoff_factor=0.5, keep_alive=True, scheduler=None, ca_bundle=None):
+        self.headers = dict(headers)
+        if not keep_alive:
+            self.headers['Connection'] = 'close'
+        self.pool_maxsize = pool_maxsize
+        # urllib3가 Retry-After만큼 자면 어댑터가 잡은 호스트 슬롯을 그동안 놓지 않으므로 헤더는 무시
+        statuses = RETRY_STATUSES if scheduler is None else [s for s in RETRY_STATUSES if s not in THROTTLE_STATUSES]
+        retry = Retry(total=retries, backoff_factor=backoff_factor, status_forcelist=statuses,
+                      allowed_methods=frozenset(['GET', 'HEAD']), raise_on_status=False,
+                      respect_retry_after_header=False)
+        self.adapter = PoliteAdapter(scheduler, ca_bundle=ca_bundle, pool_connections=pool_connections,
+                                     pool_maxsize=pool_maxsize, pool_block=pool_block, max_retries=retry)
+        # 오래 사용하지 않아 제거되는 호스트 풀의 통계도 유지
+        self._retired = {'requests': 0, 'connections': 0}
+        self._stats_lock = threading.Lock()
+        pools = self.adapter.poolmanager.pools
+        pools.dispose_func = self._retire
+        self._local = threading.local()
+    
+    @property
+    def session(self):
+        """현재 스레드의 Session (처음 접근할 때 생성)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            session.mount('http://', self.adapter)
+            session.mount('https://', self.adapter)
+            self._local.session = session
+        return session
+    
+    def _retire(self, pool):
+        with self._stats_lock:
+            self._retired['requests'] += pool.num_requests
+            self._retired['connections'] += pool.num_connections
+        pool.close()
+    
+    def stats(self):
+        """연결 재사용 통계 - 새 연결 없이 처리한 요청을 hit로 계산"""
+        pools = self.adapter.poolmanager.pools
+        with self._stats_lock:
+            requests_made = self._retired['requests']
+            connections = self._retired['connections']
+        live_pools = idle = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            live_pools += 1
+            requests_made += pool.num_requests
+            connections += pool.num_connections
+            # 연결 큐는 빈 자리를 None으로 채워 두므로 실제 연결만 계산
+            idle += sum(1 for conn in list(pool.pool.queue) if conn is not None) if pool.pool is not None else 0
+        hits = max(0, requests_made - connections)
+        return {
+            'hosts': live_pools,
+            'requests': requests_made,
+            'new_connections': connections,
+            'hits': hits,
+            'misses': connections,
+            'hit_rate': hits / requests_made if requests_made else 0,
+            'idle_connections': idle,
+            'pool_maxsize': self.pool_maxsize
+        }
+    
+    def close(self):
+        self.adapter.close()
+
 
 class URLAnalyzer:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+    def __init__(self, max_workers=4, stage_timeout=30, performance_samples=3, sample_gap=0.0, cache=None,
+                 revalidation_cache=None, parser='auto', max_page_bytes=None, max_page_seconds=None,
+                 connect_timeout=5, read_timeout=10, pool_connections=10, pool_maxsize=16, pool_block=False,
+                 retries=2, backoff_factor=0.5, keep_alive=True, http2=False, scheduler=None,
+                 origin_cache=None, result_store=None, score_weights=None, ca_bundle=None, browser_pool=None,
+                 asset_cache=None, asset_workers=8, max_assets=100, asset_budget=20):
+        # analyze_url 내부 단계 동시 실행 설정
+        self.max_workers = max_workers      # 동시에 실행할 최대 단계 수
+        self.stage_timeout = stage_timeout  # 단계별 시간 예산(초), None이면 무제한
+        
+        # 성능 측정 설정
+        self.performance_samples = performance_samples  # 측정 요청 횟수
+        self.sample_gap = sample_gap                    # 측정 요청 사이 대기 시간(초), 0 허용
+        
+        # 결과 캐시 (result_cache.ResultCache, None이면 사용 안 함)
+        self.cache = cache
+        # ETag/Last-Modified와 페이지 분석 결과 저장소 (result_cache.ResultCache, None이면 재검증 안 함)
+        self.revalidation_cache = revalidation_cache
+        # robots.txt/sitemap/DNS/TLS 등 출처 단위 정보 캐시 (origin_cache.OriginCache, None이면 매번 조회)
+        self.origin_cache = origin_cache
+        # 분석 결과를 열 단위로 쌓아 두는 이력 저장소 (result_store.ResultStore, None이면 저장 안 함)
+        self.result_store = result_store
+        # 렌더 모드용 헤드리스 브라우저 풀 (browser_pool.BrowserPool, None이면 받은 HTML만 분석)
+        self.browser_pool = browser_pool
+        
+        # 페이지 무게 분석 - 자원 확인 결과 캐시 (page_weight.AssetCache, None이면 페이지마다 새로 확인)
+        self.asset_cache = asset_cache
+        self.asset_workers = asset_workers  # 동시에 확인할 최대 자원 수
+        self.max_assets = max_assets        # 페이지당 확인할 최대 자원 수 (문서 순서로 앞에서부터)
+        self.asset_budget = asset_budget    # 자원 확인 전체 시간 예산(초) - 넘으면 남은 자원은 크기를 모르는 것으로 표시
+        # 모든 페이지가 함께 쓰는 자원 확인 스레드 (동시에 여러 페이지를 분석해도 asset_workers개까지만 확인)
+        self._asset_executor = ThreadPoolExecutor(max_workers=max(1, asset_workers), thread_name_prefix='asset-probe')
+        
+        # 성능/모바일/SEO/보안 점수 가중치 (DEFAULT_SCORE_WEIGHTS 중 바꿀 항목만 지정)
+        self.score_weights = merge_score_weights(score_weights)
+        
+        # HTML 파서 백엔드 ('auto', 'lxml', 'html5lib', 'html.parser')
+        self.parser = resolve_parser(parser)
+        
+        # 페이지 본문 읽기 예산 - 넘으면 받은 부분까지만 분석하고 truncated로 표시
+        self.max_page_bytes = max_page_bytes      # 최대 바이트 수 (None이면 무제한)
+        self.max_page_seconds = max_page_seconds  # 본문을 읽는 최대 시간(초, None이면 무제한)
+        
+        # 요청 시간 제한(초) - 연결과 읽기를 따로 적용
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.keep_alive = keep_alive
+        # 서버 인증서 검증용 CA 인증서 파일 (None이면 기본 신뢰 저장소, 사설 CA나 테스트 서버용)
+        self.ca_bundle = ca_bundle
+        
+        # 호스트별 요청 속도 제한 (politeness.HostScheduler, None이면 제한 없음)
+        self.scheduler = scheduler
         
-        # 기본 불용어 설정
-        self.stop_words = {
+        # 스레드 간 공유하는 연결 풀 (스레드마다 별도 Session)
+        self.http2 = http2 and enable_http2()
+        self.pool = ConnectionPool(
+            {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'},
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block,
+            retries=retries, backoff_factor=backoff_factor, keep_alive=keep_alive, scheduler=scheduler,
+            ca_bundle=ca_bundle
+        )
+        
+        # 기본 불용어 설정 (NLTK 불용어는 처음 사용할 때 추가)
+        self._base_stop_words = {
             'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
             'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did',
             'will', 'would', 'should', 'could', 'can', 'may', 'might', 'must', 'this', 'that',
@@ -53,116 +744,588 @@ class URLAnalyzer:
             'out', 'off', 'over', 'under', 'again', 'further', 'then', 'once'
         }
         
-        # NLTK 초기화 시도
-        if NLTK_AVAILABLE:
-            self._initialize_nltk()
+        self._stop_words = None
+    
+    @property
+    def session(self):
+        """현재 스레드의 requests.Session (연결 풀은 모든 스레드가 공유)"""
+        return self.pool.session
+    
+    @property
+    def timeout(self):
+        """requests용 (연결, 읽기) 시간 제한"""
+        return (self.connect_timeout, self.read_timeout)
+    
+    def _ssl_context(self):
+        """직접 여는 TLS 연결(성능 측정, 인증서 조회)용 검증 설정"""
+        return ssl.create_default_context(cafile=self.ca_bundle)
+    
+    def _polite(self, url):
+        """requests를 거치지 않는 직접 연결(성능 측정, 인증서 조회)에 호스트 속도 제한 적용"""
+        if self.scheduler is None:
+            return nullcontext()
+        return self.scheduler.slot(urlparse(url).netloc.lower())
+    
+    def pool_stats(self):
+        """연결 풀 사용 통계 (요청 수, 새 연결 수, 재사용 비율 등)"""
+        stats = self.pool.stats()
+        stats['http2'] = self.http2
+        return stats
+    
+    def close(self):
+        """공유 연결 풀의 연결을 모두 닫고 자원 확인 스레드를 정리"""
+        self._asset_executor.shutdown(wait=False, cancel_futures=True)
+        self.pool.close()
+    
+    @property
+    def stop_words(self):
+        """기본 불용어 + 설치된 NLTK 불용어 (처음 접근할 때 불러옴)"""
+        if self._stop_words is None:
+            self._stop_words = self._base_stop_words | load_nltk_stopwords()
+        return self._stop_words
     
-    def _initialize_nltk(self):
-        """NLTK 초기화"""
+    @stop_words.setter
+    def stop_words(self, value):
+        self._stop_words = set(value)
+    
+    def analyze_url(self, url, force_refresh=False):
+        """메인 분석 함수 - 모든 분석 결과를 반환 (force_refresh=True면 캐시 무시)"""
+        for section, result in self.analyze_url_iter(url, force_refresh=force_refresh):
+            pass
+        return result
+    
+    def analyze_url_iter(self, url, force_refresh=False, page=None):
+        """분석 결과를 준비되는 순서대로 (섹션 이름, 결과)로 반환하는 제너레이터
+        
+        섹션은 RESULT_SECTIONS 중 하나이며, 마지막으로 ('results', 전체 결과)를 반환
+        page: 이미 받은 PageContext (주면 다시 요청하지 않고 재검증도 하지 않음)
+        """
+        if not force_refresh:
+            cached = self._cache_get('full', url)
+            if cached is not None:
+                for section in RESULT_SECTIONS:
+                    yield section, cached[section]
+                yield 'results', cached
+                return
+        
+        print(f"🔍 분석 시작: {url}")
+        started = time.time()
+        timings = {}
+        
+        # 페이지는 한 번만 요청/파싱하고 모든 분석기가 공유
+        # 이전 분석의 ETag/Last-Modified가 있으면 조건부 요청으로 재검증
+        stored = self._revalidation_get(url) if page is None else None
+        fetch_start = time.time()
         try:
-            # NLTK 데이터 확인 및 다운로드
-            try:
-                nltk.data.find('tokenizers/punkt')
-            except LookupError:
-                print("NLTK punkt 데이터를 다운로드합니다...")
-                nltk.download('punkt', quiet=True)
-            
-            try:
-                nltk.data.find('corpora/stopwords')
-                english_stopwords = set(stopwords.words('english'))
-                self.stop_words.update(english_stopwords)
-            except LookupError:
-                print("NLTK stopwords 데이터를 다운로드합니다...")
-                nltk.download('stopwords', quiet=True)
-                try:
-                    english_stopwords = set(stopwords.words('english'))
-                    self.stop_words.update(english_stopwords)
-                except:
-                    pass
+            if page is None:
+                page = self.fetch_page(url, validators=stored)
+            if not page.not_modified:
+                page.soup  # 단계들이 동시에 시작되기 전에 미리 파싱
         except Exception as e:
-            print(f"NLTK 초기화 중 오류: {e}")
+            page = PageContext(url, error=e)
+        timings['fetch'] = time.time() - fetch_start
+        revalidated = stored is not None and page.not_modified
+        
+        # 서로 독립적인 단계들을 스레드 풀에서 동시에 실행
+        stages = {
+            'basic_info': lambda: self.get_basic_info(url, page=page),
+            'seo_analysis': lambda: self.analyze_seo(url, page=page, include_probes=False),
+            'robots_txt': lambda: self._robots_summary(url),
+            'sitemap': lambda: self._sitemap_summary(url),
+            'performance': lambda: self.measure_performance(url, page=page),
+            'page_weight': lambda: self.analyze_page_weight(url, page=page),
+            'content_analysis': lambda: self.analyze_content(url, page=page),
+            'technical_analysis': lambda: self.analyze_technical(url, page=page),
+            'security_analysis': lambda: self.analyze_security(url, page=page),
+            'keyword_analysis': lambda: self.analyze_keywords(url, page=page),
+            'social_media': lambda: self.analyze_social_media(url, page=page),
+            'mobile_analysis': lambda: self.analyze_mobile_compatibility(url, page=page)
+        }
+        if revalidated:
+            # 본문이 바뀌지 않았으므로 저장된 결과를 쓰고, 인증서만 새로 확인
+            for name in PAGE_STAGES:
+                stages[name] = partial(self._reuse_stage, stored, page, name)
+            stages['security_analysis'] = lambda: self._refresh_security(
+                url, self._reuse_stage(stored, page, 'security_analysis'))
+            stages['page_weight'] = lambda: self._refresh_page_weight(self._reuse_stage(stored, page, 'page_weight'))
+            # 측정 요청도 조건부로 보내 본문을 다시 받지 않음
+            stages['performance'] = lambda: self.measure_performance(url, page=page, validators=stored)
+        
+        stage_results = {}
+        for name, result in self._iter_stages(stages, timings):
+            stage_results[name] = result
+            # SEO 결과는 robots.txt/sitemap 확인까지 끝나야 완성
+            if name in ('seo_analysis', 'robots_txt', 'sitemap'):
+                if all(probe in stage_results for probe in ('seo_analysis', 'robots_txt', 'sitemap')):
+                    yield 'seo_analysis', self._merge_seo_probes(stage_results)
+            else:
+                yield name, result
+        
+        results = self._assemble_results(url, stage_results, timings, started)
+        results['revalidation'] = self._revalidation_report(stored, revalidated, stage_results['performance'])
+        if not revalidated:
+            self._revalidation_put(url, page, stage_results)
+        self._cache_put('full', url, results)
+        self._store_put(results)
+        yield 'results', results
     
-    def analyze_url(self, url):
-        """메인 분석 함수 - 모든 분석 결과를 반환"""
-        print(f"🔍 분석 시작: {url}")
+    def _revalidation_get(self, url):
+        if self.revalidation_cache is None:
+            return None
+        return self.revalidation_cache.get(url, 'validators')
+    
+    def _revalidation_put(self, url, page, stage_results):
+        """검증자(ETag/Last-Modified)가 있는 정상 응답이면 페이지 분석 결과와 함께 저장"""
+        if self.revalidation_cache is None or page.error is not None or page.response.status_code != 200:
+            return
+        etag = page.headers.get('etag')
+        last_modified = page.headers.get('last-modified')
+        if not etag and not last_modified:
+            return
+        if any('error' in stage_results[name] for name in PAGE_STAGES):
+            return
+        self.revalidation_cache.set(url, 'validators', {
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_length': len(page.content),
+            'stages': {name: stage_results[name] for name in PAGE_STAGES}
+        })
+    
+    def _reuse_stage(self, stored, page, name):
+        """304 응답 시 저장된 단계 결과 재사용 (응답 시간은 이번 요청 기준)"""
+        result = stored['stages'][name]
+        if name == 'basic_info':
+            result['response_time'] = page.response.elapsed.total_seconds()
+        return result
+    
+    def _refresh_security(self, url, security):
+        if security.get('https'):
+            security['ssl_certificate'] = self._get_ssl_info(url)
+        return security
+    
+    def _refresh_page_weight(self, weight):
+        """저장된 자원 목록으로 크기와 헤더만 다시 확인 (자원은 문서와 따로 바뀔 수 있음)"""
+        if 'assets' not in weight:
+            return weight
+        assets = [{key: asset[key] for key in ('url', 'kind', 'render_blocking')} for asset in weight['assets']]
+        return self._page_weight(weight['page_url'], weight['document_bytes'], assets, weight['assets_found'])
+    
+    def _revalidation_report(self, stored, revalidated, performance=None):
+        """bytes_saved: 304로 받지 않은 본문 크기 (성능 측정 요청이 본문을 다시 받았으면 그만큼 뺌)"""
+        bytes_saved = 0
+        if revalidated:
+            bytes_saved = stored['content_length']
+            if performance and 'samples' in performance and not performance.get('not_modified'):
+                bytes_saved -= performance['content_size'] * len(performance['samples'])
+        return {
+            'conditional_request': stored is not None,
+            'revalidated': revalidated,
+            'bytes_saved': max(0, bytes_saved)
+        }
+    
+    def _cache_get(self, analysis_type, url):
+        if self.cache is None:
+            return None
+        return self.cache.get(url, analysis_type)
+    
+    def _cache_put(self, analysis_type, url, results):
+        """오류 없는 결과만 캐시에 저장"""
+        if self.cache is None or 'error' in results or 'error' in results.get('basic_info', {}):
+            return
+        self.cache.set(url, analysis_type, results)
+    
+    def _store_put(self, results):
+        """새로 분석한 결과를 이력 저장소에 추가 (캐시에서 꺼낸 결과는 다시 저장하지 않음)"""
+        if self.result_store is not None:
+            self.result_store.add(results)
+    
+    def _merge_seo_probes(self, stage_results):
+        """robots.txt / sitemap 결과는 기존처럼 SEO 분석 안에 포함 (존재 여부 + 해석한 내용 요약)"""
+        seo_analysis = stage_results['seo_analysis']
+        if 'error' not in seo_analysis:
+            robots, sitemap = stage_results['robots_txt'], stage_results['sitemap']
+            seo_analysis['robots_txt'] = robots.get('found') is True
+            seo_analysis['sitemap'] = sitemap.get('found') is True
+            seo_analysis['robots_details'] = robots
+            seo_analysis['sitemap_details'] = sitemap
+        return seo_analysis
+    
+    def _assemble_results(self, url, stage_results, timings, started):
+        """단계별 결과를 기존 결과 구조로 조립 (동기/비동기 엔진 공용)"""
+        seo_analysis = self._merge_seo_probes(stage_results)
+        timings['total'] = time.time() - started
         
-        results = {
+        return {
             'url': url,
             'timestamp': datetime.now().isoformat(),
-            'basic_info': self.get_basic_info(url),
-            'seo_analysis': self.analyze_seo(url),
-            'performance': self.measure_performance(url),
-            'content_analysis': self.analyze_content(url),
-            'technical_analysis': self.analyze_technical(url),
-            'security_analysis': self.analyze_security(url),
-            'keyword_analysis': self.analyze_keywords(url),
-            'social_media': self.analyze_social_media(url),
-            'mobile_analysis': self.analyze_mobile_compatibility(url)
+            'basic_info': stage_results['basic_info'],
+            'seo_analysis': seo_analysis,
+            'performance': stage_results['performance'],
+            'page_weight': stage_results['page_weight'],
+            'content_analysis': stage_results['content_analysis'],
+            'technical_analysis': stage_results['technical_analysis'],
+            'security_analysis': stage_results['security_analysis'],
+            'keyword_analysis': stage_results['keyword_analysis'],
+            'social_media': stage_results['social_media'],
+            'mobile_analysis': stage_results['mobile_analysis'],
+            'timings': timings
         }
+    
+    def _stage_timeout_error(self, name):
+        return {'error': f'{name} 단계가 {self.stage_timeout}초 안에 끝나지 않았습니다'}
+    
+    def _iter_stages(self, stages, timings):
+        """분석 단계들을 동시에 실행하고 끝나는 순서대로 (단계 이름, 결과) 반환
+        
+        시간 예산은 모든 단계에 대해 제출 시점부터 계산하며, 넘은 단계는 오류 결과로 반환
+        """
+        def timed(func):
+            stage_start = time.time()
+            try:
+                return func(), time.time() - stage_start
+            except Exception as e:
+                return {'error': str(e)}, time.time() - stage_start
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, self.max_workers))
+        try:
+            submitted = time.time()
+            futures = {executor.submit(timed, func): name for name, func in stages.items()}
+            
+            pending = set(futures)
+            while pending:
+                remaining = None
+                if self.stage_timeout is not None:
+                    remaining = max(0, submitted + self.stage_timeout - time.time())
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+                # 같은 시점에 끝난 단계는 등록 순서대로 반환
+                for future in sorted(done, key=list(futures).index):
+                    result, timings[futures[future]] = future.result()
+                    yield futures[future], result
+            
+            for future in sorted(pending, key=list(futures).index):
+                future.cancel()
+                name = futures[future]
+                timings[name] = time.time() - submitted
+                yield name, self._stage_timeout_error(name)
+        finally:
+            # 시간 초과된 단계는 기다리지 않음
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def analyze_many(self, urls=None, max_workers=8, per_host_limit=2, force_refresh=False, urls_file=None):
+        """여러 URL을 제한된 동시성으로 분석하고, 끝나는 순서대로 결과를 반환하는 제너레이터
+        
+        urls는 URL 반복 가능 객체 또는 파일 객체, urls_file은 한 줄에 하나씩 URL이 적힌 파일 경로
+        (파일 경로는 urls_file로만 받음 - 내부/명령줄 호출용).
+        입력은 필요한 만큼만 읽으므로 목록 길이와 관계없이 메모리 사용량이 일정하다.
+        """
+        max_workers = max(1, max_workers)
+        per_host_limit = max(1, per_host_limit)
+        # 실행을 기다리는 URL을 잠시 보관하는 대기열 크기
+        max_pending = max_workers * 4
+        
+        source = self._iter_urls(urls, urls_file)
+        host_queues = OrderedDict()  # 호스트별 대기 URL (돌아가며 하나씩 꺼냄)
+        queued = 0
+        host_active = Counter()
+        in_flight = {}
+        exhausted = False
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                # 입력은 대기열 크기만큼만 읽어 호스트별로 나눔
+                while not exhausted and queued < max_pending:
+                    candidate = next(source, None)
+                    if candidate is None:
+                        exhausted = True
+                    else:
+                        host_queues.setdefault(urlparse(candidate).netloc.lower(), deque()).append(candidate)
+                        queued += 1
+                
+                # 전역/호스트별 한도 안에서 호스트를 돌아가며 작업 채우기
+                while len(in_flight) < max_workers:
+                    host = self._next_host(host_queues, host_active, per_host_limit)
+                    if host is None:
+                        break
+                    next_url = host_queues[host].popleft()
+                    queued -= 1
+                    if host_queues[host]:
+                        host_queues.move_to_end(host)
+                    else:
+                        del host_queues[host]
+                    host_active[host] += 1
+                    in_flight[executor.submit(self._analyze_safely, next_url, force_refresh)] = host
+                
+                if not in_flight:
+                    if exhausted and not host_queues:
+                        break
+                    continue
+                
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    host = in_flight.pop(future)
+                    host_active[host] -= 1
+                    if host_active[host] <= 0:
+                        del host_active[host]
+                    yield future.result()
+    
+    def _next_host(self, host_queues, host_active, per_host_limit):
+        """다음에 실행할 호스트 - 돌아가는 순서대로 고르되 속도 제한으로 기다려야 하는 호스트는 뒤로 미룸"""
+        available = [host for host in host_queues if host_active[host] < per_host_limit]
+        if not available:
+            return None
+        if self.scheduler is not None:
+            # 정렬은 안정적이므로 대기 시간이 같으면 돌아가는 순서 유지
+            available.sort(key=self.scheduler.ready_in)
+        return available[0]
+    
+    def _analyze_safely(self, url, force_refresh=False):
+        """analyze_many용 - 예외를 결과 딕셔너리로 변환"""
+        try:
+            return self.analyze_url(url, force_refresh=force_refresh)
+        except Exception as e:
+            return {'url': url, 'timestamp': datetime.now().isoformat(), 'error': str(e)}
+    
+    def _iter_urls(self, urls, urls_file=None):
+        """URL 목록/파일 객체 또는 urls_file 경로에서 URL을 한 줄씩 읽기 (빈 줄과 # 주석 제외)
+        
+        문자열 하나는 파일 경로로 해석하지 않고 거부 (외부 입력이 서버 파일을 열지 못하도록)
+        """
+        if urls_file is not None:
+            with open(urls_file, encoding='utf-8') as f:
+                yield from self._iter_urls(f)
+            return
+        if isinstance(urls, (str, bytes)) or urls is None:
+            raise TypeError("urls는 URL 목록이어야 합니다 (파일 경로는 urls_file로 전달)")
+        for line in urls:
+            url = line.strip()
+            if url and not url.startswith('#'):
+                yield url
+    
+    def crawl(self, seed_url, max_depth=3, max_pages=100, max_workers=4, use_sitemap=True,
+              respect_robots=True, force_refresh=False):
+        """시작 URL에서 내부 링크를 너비 우선으로 따라가며 사이트 전체를 분석
+        
+        반환: {'seed_url', 'pages': [{'url', 'depth', 'results', 'links'}], 'report': 사이트 리포트}
+        """
+        pages = []
+        for event, data in self.crawl_iter(seed_url, max_depth, max_pages, max_workers, use_sitemap,
+                                           respect_robots, force_refresh):
+            if event == 'page':
+                pages.append(data)
+        return {'seed_url': data['seed_url'], 'pages': pages, 'report': data}
+    
+    def crawl_iter(self, seed_url, max_depth=3, max_pages=100, max_workers=4, use_sitemap=True,
+                   respect_robots=True, force_refresh=False):
+        """크롤링 제너레이터 - 페이지 분석이 끝날 때마다 ('page', 페이지), 마지막에 ('report', 사이트 리포트)
+        
+        max_depth: 시작 URL에서 따라갈 링크 단계 수 (사이트맵에서 찾은 페이지는 1단계)
+        max_pages: 분석할 최대 페이지 수
+        max_workers: 동시에 분석할 페이지 수
+        use_sitemap: sitemap.xml(과 robots.txt의 Sitemap)에 있는 페이지로 대기열을 미리 채움
+        respect_robots: robots.txt에서 막은 페이지는 건너뜀
+        """
+        started = time.time()
+        user_agent = self.session.headers['User-Agent']
+        frontier = CrawlFrontier(seed_url, max_depth=max_depth, max_pages=max_pages, user_agent=user_agent)
+        seed_url = frontier.seed_url
+        robots = self.get_robots(seed_url)
+        if respect_robots:
+            frontier.robots = robots
+        frontier.add(seed_url, 0)
+        if use_sitemap:
+            for sitemap_url in self._sitemap_pages(seed_url, robots, max_pages):
+                frontier.add(sitemap_url, 1)
+        
+        pages = []
+        in_flight = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while frontier or in_flight:
+                while frontier and len(in_flight) < max_workers:
+                    url, depth = frontier.pop()
+                    in_flight[executor.submit(self._crawl_page, url, force_refresh)] = (url, depth)
+                
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url, depth = in_flight.pop(future)
+                    results, base_url, hrefs = future.result()
+                    if depth == 0:
+                        # 시작 페이지가 리다이렉트되면(example.com -> www.example.com 등) 최종 호스트도 같은 사이트
+                        frontier.add_site(base_url)
+                    page = {
+                        'url': url,
+                        'depth': depth,
+                        'results': results,
+                        'links': frontier.add_links(base_url, hrefs, depth + 1)
+                    }
+                    pages.append(page)
+                    yield 'page', page
+        
+        yield 'report', build_site_report(seed_url, pages, frontier.skipped, time.time() - started)
+    
+    def _crawl_page(self, url, force_refresh=False):
+        """크롤링용 - 페이지를 한 번 받아 링크를 뽑고 같은 응답으로 분석 (결과, 링크 기준 URL, href 목록)"""
+        try:
+            page = self.fetch_page(url)
+        except Exception as e:
+            return {'url': url, 'timestamp': datetime.now().isoformat(), 'error': str(e)}, url, []
+        
+        hrefs = []
+        if page.response.status_code == 200 and 'html' in page.headers.get('content-type', 'text/html'):
+            try:
+                hrefs = page.facts.links
+            except Exception:
+                pass
+        try:
+            for section, results in self.analyze_url_iter(url, force_refresh=force_refresh, page=page):
+                pass
+        except Exception as e:
+            results = {'url': url, 'timestamp': datetime.now().isoformat(), 'error': str(e)}
+        return results, page.response.url, hrefs
+    
+    def _sitemap_pages(self, seed_url, robots, limit):
+        """크롤링 시작 페이지 후보 - /sitemap.xml, robots.txt의 Sitemap, 사이트맵 인덱스의 하위 사이트맵에 있는 URL"""
+        sitemap = self.get_sitemap(seed_url)
+        urls = list(sitemap.urls)
+        pending = deque(sitemap.sitemaps + [urljoin(seed_url, location) for location in robots.sitemaps])
+        fetched = {urljoin(seed_url, '/sitemap.xml')}
+        while pending and len(urls) < limit and len(fetched) < SITEMAP_MAX_FILES:
+            sitemap_url = pending.popleft()
+            if sitemap_url in fetched:
+                continue
+            fetched.add(sitemap_url)
+            try:
+                child = self._fetch_sitemap(sitemap_url)
+            except Exception:
+                continue
+            urls.extend(child.urls)
+            pending.extend(child.sitemaps)
+        return urls[:limit]
+    
+    def fetch_page(self, url, validators=None):
+        """페이지를 한 번 요청하여 공유 컨텍스트 생성 (validators가 있으면 조건부 요청)"""
+        response = self.session.get(url, timeout=self.timeout, headers=self._conditional_headers(validators),
+                                    stream=True)
+        try:
+            budget = self._read_body(response)
+        finally:
+            response.close()
+        return self._render_page(PageContext(url, response, parser=self.parser, truncated=budget.truncated))
+    
+    def _render_page(self, page):
+        """렌더 모드면 브라우저로 불러온 DOM과 탐색 시간을 컨텍스트에 붙임 (실패하면 받은 HTML 그대로 분석)
         
-        return results
+        헤더와 상태 코드, 문서 크기는 직접 받은 응답 값을 쓰고, 오류 응답과 HTML이 아닌 문서는 렌더링하지 않음
+        """
+        if (self.browser_pool is None or page.response.status_code >= 300
+                or 'html' not in page.headers.get('content-type', 'text/html')):
+            return page
+        try:
+            with self._polite(page.url):
+                page.rendered = self.browser_pool.render(page.url)
+        except Exception as e:
+            page.render_error = str(e)
+        return page
+    
+    def _body_budget(self):
+        """페이지 본문 읽기 예산 - 시간 한도가 없으면 단계 시간 예산까지만 읽음 (끝없이 보내는 서버 대비)"""
+        max_seconds = self.max_page_seconds if self.max_page_seconds is not None else self.stage_timeout
+        return BodyBudget(self.max_page_bytes, max_seconds)
     
-    def get_basic_info(self, url):
-        """기본 정보 수집"""
+    def _read_body(self, response, budget=None):
+        """본문을 청크 단위로 읽어 예산 안에서만 보관 (response.content가 읽은 부분이 됨)"""
+        budget = budget or self._body_budget()
+        for chunk in response.iter_content(READ_CHUNK_SIZE):
+            if not budget.add(chunk):
+                break
+        response._content = budget.body()
+        response._content_consumed = True
+        return budget
+    
+    def _conditional_headers(self, validators):
+        headers = {}
+        if validators:
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+    
+    def _get_page(self, url, page):
+        """전달된 컨텍스트를 사용하고, 없으면 단독 호출로 보고 새로 요청"""
+        if page is None:
+            return self.fetch_page(url)
+        if page.error is not None:
+            raise page.error
+        return page
+    
+    def get_basic_info(self, url, page=None, force_refresh=False):
+        """기본 정보 수집 (단독 호출 시 캐시 사용)"""
+        standalone = page is None
+        if standalone and not force_refresh:
+            cached = self._cache_get('basic', url)
+            if cached is not None:
+                return cached
+        
         try:
-            response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            page = self._get_page(url, page)
+            response = page.response
+            facts = page.facts
             
             # 제목 안전하게 추출
-            title = ''
-            if soup.title and soup.title.string:
-                title = soup.title.string.strip()
+            title = facts.title.strip() if facts.title else ''
             
-            return {
+            basic_info = {
                 'status_code': response.status_code,
                 'response_time': response.elapsed.total_seconds(),
-                'content_length': len(response.content),
+                'content_length': len(page.content),
+                'truncated': page.truncated,
+                'rendered': page.rendered is not None,
+                'render_error': page.render_error,
                 'content_type': response.headers.get('content-type', ''),
                 'server': response.headers.get('server', ''),
                 'title': title,
-                'meta_description': self._get_meta_content(soup, 'description'),
-                'language': soup.html.get('lang') if soup.html else '',
+                'meta_description': facts.meta_content('description'),
+                'language': facts.lang if facts.has_html_tag else '',
                 'charset': self._extract_charset(response.headers.get('content-type', ''))
             }
+            if standalone:
+                self._cache_put('basic', url, basic_info)
+            return basic_info
         except Exception as e:
             return {'error': str(e)}
     
-    def analyze_seo(self, url):
-        """SEO 분석"""
+    def analyze_seo(self, url, page=None, include_probes=True):
+        """SEO 분석 (include_probes=False면 robots.txt/sitemap 확인 생략)"""
         try:
-            response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            facts = self._get_page(url, page).facts
             
             # 메타 태그 분석
             meta_tags = {}
-            for meta in soup.find_all('meta'):
-                name = meta.get('name') or meta.get('property')
-                content = meta.get('content')
+            for meta in facts.metas:
+                name = meta['name'] or meta['property']
+                content = meta['content']
                 if name and content:
                     meta_tags[name] = content
             
             # 헤딩 태그 분석
-            headings = {}
-            for i in range(1, 7):
-                h_tags = soup.find_all(f'h{i}')
-                headings[f'h{i}'] = [tag.get_text().strip() for tag in h_tags]
+            headings = {tag: list(texts) for tag, texts in facts.headings.items()}
             
             # 이미지 분석
-            images = soup.find_all('img')
+            images = facts.images
             img_analysis = {
                 'total_images': len(images),
-                'images_without_alt': len([img for img in images if not img.get('alt')]),
-                'images_without_title': len([img for img in images if not img.get('title')])
+                'images_without_alt': len([img for img in images if not img['alt']]),
+                'images_without_title': len([img for img in images if not img['title']])
             }
             
             # 링크 분석
-            links = soup.find_all('a', href=True)
             internal_links = []
             external_links = []
             
             domain = urlparse(url).netloc
-            for link in links:
-                href = link['href']
+            for href in facts.links:
                 if href.startswith('http'):
                     if domain in href:
                         internal_links.append(href)
@@ -171,7 +1334,7 @@ class URLAnalyzer:
                 elif href.startswith('/'):
                     internal_links.append(urljoin(url, href))
             
-            return {
+            seo = {
                 'meta_tags': meta_tags,
                 'headings': headings,
                 'images': img_analysis,
@@ -180,109 +1343,253 @@ class URLAnalyzer:
                     'external_count': len(external_links),
                     'internal_links': internal_links[:10],
                     'external_links': external_links[:10]
-                },
-                'robots_txt': self._check_robots_txt(url),
-                'sitemap': self._check_sitemap(url)
+                }
             }
+            if include_probes:
+                seo = self._merge_seo_probes({
+                    'seo_analysis': seo,
+                    'robots_txt': self._robots_summary(url),
+                    'sitemap': self._sitemap_summary(url)
+                })
+            return seo
         except Exception as e:
             return {'error': str(e)}
     
-    def measure_performance(self, url):
-        """성능 측정"""
+    def measure_performance(self, url, samples=None, sample_gap=None, page=None, validators=None):
+        """성능 측정 - 요청마다 DNS/TCP 연결/TLS/첫 바이트/다운로드 시간을 나누어 기록
+        
+        validators(재검증 캐시의 ETag/Last-Modified/content_length)가 있으면 조건부로 요청해
+        304면 본문 없이 재검증 시간만 재고, 크기는 저장된 본문 크기를 사용 (not_modified=True)
+        렌더 모드면 브라우저의 실제 탐색 시간(FCP, DOMContentLoaded, load)을 navigation_timing에 추가
+        (page가 렌더링된 컨텍스트면 그 값을 쓰고, page 없이 호출하면 새로 렌더링)
+        """
+        samples = self.performance_samples if samples is None else samples
+        sample_gap = self.sample_gap if sample_gap is None else sample_gap
         try:
-            # 여러 번 요청하여 평균 측정
-            times = []
-            for _ in range(3):  # 5번에서 3번으로 줄여서 빠르게
-                start_time = time.time()
-                response = self.session.get(url, timeout=10)
-                end_time = time.time()
-                times.append(end_time - start_time)
-                time.sleep(0.3)
-            
-            # DNS 조회 시간 측정
-            try:
-                domain = urlparse(url).netloc
-                dns_start = time.time()
-                socket.gethostbyname(domain)
-                dns_time = time.time() - dns_start
-            except:
-                dns_time = 0
+            timings = []
+            for i in range(max(1, samples)):
+                if i and sample_gap > 0:
+                    time.sleep(sample_gap)
+                phases, status, headers, body, truncated = self._timed_fetch(url, validators=validators)
+                timings.append(phases)
             
-            return {
-                'avg_response_time': sum(times) / len(times),
-                'min_response_time': min(times),
-                'max_response_time': max(times),
-                'dns_lookup_time': dns_time,
-                'content_size': len(response.content),
-                'compression': 'gzip' in response.headers.get('content-encoding', ''),
-                'caching': response.headers.get('cache-control', ''),
-                'performance_score': self._calculate_performance_score(times, len(response.content))
-            }
+            performance = self._summarize_performance(timings, headers, body, truncated,
+                                                      **self._not_modified_size(status, validators))
+            if self.browser_pool is not None:
+                performance['navigation_timing'] = self._navigation_timing(url, page)
+            return performance
         except Exception as e:
             return {'error': str(e)}
     
-    def analyze_content(self, url):
-        """콘텐츠 분석 - 개선된 버전"""
+    def _navigation_timing(self, url, page=None):
+        """브라우저가 기록한 탐색 시간(초) - 렌더링에 실패했으면 None, 새로 렌더링하다 실패하면 오류"""
+        if page is not None:
+            return page.rendered.timing if page.rendered is not None else None
         try:
-            response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            with self._polite(url):
+                return self.browser_pool.render(url).timing
+        except Exception as e:
+            return {'error': str(e)}
+    
+    def _timed_fetch(self, url, max_redirects=5, validators=None):
+        """요청 한 번을 단계별로 시간 측정 (리다이렉트는 따라가며 단계별 시간을 합산)"""
+        phases = self._new_phases()
+        for _ in range(max_redirects + 1):
+            parsed = urlparse(url)
+            is_https = parsed.scheme == 'https'
+            port = parsed.port or (443 if is_https else 80)
+            
+            # 속도 제한 대기는 측정 시간에 포함하지 않음
+            with self._polite(url):
+                lap = time.perf_counter()
+                resolved = []
+                
+                def resolve():
+                    resolved.append(True)
+                    return socket.getaddrinfo(parsed.hostname, port, type=socket.SOCK_STREAM)[0]
+                
+                family, sock_type, proto, _, address = self._origin_fact(url, 'dns', resolve)
+                lap = self._add_dns_phase(phases, lap, cached=not resolved)
+                
+                sock = socket.socket(family, sock_type, proto)
+                try:
+                    sock.settimeout(self.connect_timeout)
+                    sock.connect(address)
+                    lap = self._add_phase(phases, 'connect', lap)
+                    sock.settimeout(self.read_timeout)
+                    
+                    if is_https:
+                        sock = self._ssl_context().wrap_socket(sock, server_hostname=parsed.hostname)
+                        lap = self._add_phase(phases, 'tls', lap)
+                    
+                    sock.sendall(self._build_timing_request(parsed, validators))
+                    first = sock.recv(65536)
+                    lap = self._add_phase(phases, 'ttfb', lap)
+                    
+                    # 페이지 본문과 같은 읽기 예산 - 넘으면 거기까지를 다운로드 시간으로 기록
+                    budget = self._body_budget()
+                    reading = budget.add(first)
+                    while reading:
+                        chunk = sock.recv(65536)
+                        if not chunk:
+                            break
+                        reading = budget.add(chunk)
+                    self._add_phase(phases, 'download', lap)
+                finally:
+                    sock.close()
             
-            # 불필요한 요소 제거
-            for element in soup(['script', 'style', 'nav', 'header', 'footer']):
-                element.decompose()
+            status, headers, body, truncated = self._parse_timed_response(budget.body(), budget.truncated)
+            if self.scheduler is not None:
+                self.scheduler.note_response(parsed.netloc.lower(), status, headers)
+            if status in REDIRECT_STATUSES and headers.get('location'):
+                url = urljoin(url, headers['location'])
+                continue
+            break
+        
+        phases['total'] = sum(phases[phase] or 0.0 for phase in TIMING_PHASES)
+        return phases, status, headers, body, truncated
+    
+    def _new_phases(self):
+        # dns는 실제로 조회한 시간만 기록 - 모든 조회를 출처 캐시에서 가져왔으면 None (dns_cached=True)
+        phases = dict.fromkeys(TIMING_PHASES, 0.0)
+        phases['dns'] = None
+        phases['dns_cached'] = False
+        return phases
+    
+    def _add_phase(self, phases, phase, lap):
+        now = time.perf_counter()
+        phases[phase] += now - lap
+        return now
+    
+    def _add_dns_phase(self, phases, lap, cached):
+        """DNS 단계 기록 - 출처 캐시에서 가져온 주소는 조회 시간이 아니므로 재지 않고 dns_cached로 표시"""
+        now = time.perf_counter()
+        if cached:
+            phases['dns_cached'] = True
+        else:
+            phases['dns'] = (phases['dns'] or 0.0) + now - lap
+        return now
+    
+    def _build_timing_request(self, parsed, validators=None):
+        """측정용 HTTP/1.0 요청 - 응답 끝을 연결 종료로 판단할 수 있도록 chunked 전송을 피함 (validators가 있으면 조건부)"""
+        path = parsed.path or '/'
+        if parsed.query:
+            path += '?' + parsed.query
+        conditional = ''.join(f"{name}: {value}\r\n" for name, value in self._conditional_headers(validators).items())
+        return (
+            f"GET {path} HTTP/1.0\r\n"
+            f"Host: {parsed.netloc}\r\n"
+            f"User-Agent: {self.session.headers['User-Agent']}\r\n"
+            "Accept: */*\r\n"
+            "Accept-Encoding: gzip, deflate\r\n"
+            f"{conditional}"
+            "Connection: close\r\n\r\n"
+        ).encode('latin-1')
+    
+    def _parse_timed_response(self, data, truncated=False):
+        """원시 응답을 (상태 코드, 헤더, 압축 해제된 본문, 잘렸는지)로 분리
+        
+        압축 해제도 읽기 예산(max_page_bytes, 없으면 MAX_DECOMPRESSED_BYTES) 안에서만 수행
+        """
+        head, _, body = data.partition(b'\r\n\r\n')
+        status_line, _, header_block = head.partition(b'\r\n')
+        status = int(status_line.split()[1])
+        headers = http.client.parse_headers(io.BytesIO(header_block + b'\r\n\r\n'))
+        
+        encoding = headers.get('content-encoding', '').lower()
+        max_bytes = self.max_page_bytes if self.max_page_bytes is not None else MAX_DECOMPRESSED_BYTES
+        limited = False
+        if 'gzip' in encoding:
+            body, limited = decompress_limited(body, 16 + zlib.MAX_WBITS, max_bytes)
+        elif 'deflate' in encoding:
+            body, limited = decompress_limited(body, zlib.MAX_WBITS, max_bytes)
+        return status, headers, body, truncated or limited
+    
+    def _not_modified_size(self, status, validators):
+        """조건부 측정이 304를 받았으면 저장된 본문 크기로 결과를 구성하도록 인자를 만듦"""
+        if status == 304 and validators:
+            return {'content_size': validators['content_length'], 'not_modified': True}
+        return {}
+    
+    def _summarize_performance(self, timings, headers, content, truncated=False, content_size=None, not_modified=False):
+        """단계별 측정값으로 성능 결과 구성 (동기/비동기 엔진 공용, truncated: 마지막 측정이 읽기 예산에서 멈췄는지)
+        
+        content_size: 본문 크기 (None이면 len(content), 304면 저장된 크기)
+        DNS 백분위수는 실제로 조회한 측정만으로 계산 (모두 출처 캐시를 썼으면 None, dns_cached_samples에 개수)
+        """
+        if content_size is None:
+            content_size = len(content)
+        times = [sample['total'] for sample in timings]
+        breakdown = {}
+        for phase in TIMING_PHASES + ('total',):
+            values = [sample[phase] for sample in timings if sample[phase] is not None]
+            breakdown[phase] = self._percentiles(values) if values else None
+        return {
+            'avg_response_time': sum(times) / len(times),
+            'min_response_time': min(times),
+            'max_response_time': max(times),
+            'dns_lookup_time': breakdown['dns']['p50'] if breakdown['dns'] else None,
+            'dns_cached_samples': sum(1 for sample in timings if sample['dns_cached']),
+            'timing_breakdown': breakdown,
+            'samples': timings,
+            'content_size': content_size,
+            'truncated': truncated,
+            'not_modified': not_modified,
+            'compression': 'gzip' in headers.get('content-encoding', ''),
+            'caching': headers.get('cache-control', ''),
+            'performance_score': self._calculate_performance_score(
+                times, content_size, ttfb=breakdown['ttfb']['p50'])
+        }
+    
+    def _percentiles(self, values, points=(50, 90, 95)):
+        """선형 보간 백분위수"""
+        ordered = sorted(values)
+        result = {}
+        for point in points:
+            rank = (len(ordered) - 1) * point / 100
+            lower = int(rank)
+            upper = min(lower + 1, len(ordered) - 1)
+            result[f'p{point}'] = ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+        return result
+    
+    def analyze_content(self, url, page=None):
+        """콘텐츠 분석 - 개선된 버전"""
+        try:
+            page = self._get_page(url, page)
+            facts = page.facts
             
-            # 텍스트 추출
-            text = soup.get_text()
+            # 본문 텍스트(script/style/nav/header/footer 제외)의 단어 통계
+            stats = page.text_stats
+            text = stats.text
             
-            if not text or not text.strip():
+            if not text:
                 return {
                     'word_count': 0,
                     'character_count': 0,
                     'paragraph_count': 0,
                     'reading_ease': 0,
                     'reading_grade': 0,
+                    'reading_language': None,
                     'most_common_words': {},
                     'content_density': 0
                 }
             
-            # 텍스트 정리
-            text = re.sub(r'\s+', ' ', text.strip())
+            # 불용어와 짧은 단어를 뺀 본문 단어 빈도
+            keywords = stats.keywords(self.stop_words, body_only=True)
+            word_count = sum(keywords.values())
             
-            # 단어 분리
-            if NLTK_AVAILABLE:
-                try:
-                    words = word_tokenize(text.lower())
-                except:
-                    words = self._simple_tokenize(text)
-            else:
-                words = self._simple_tokenize(text)
-            
-            # 단어 필터링
-            filtered_words = []
-            for word in words:
-                if (len(word) > 2 and 
-                    word.isalpha() and 
-                    word.lower() not in self.stop_words):
-                    filtered_words.append(word.lower())
-            
-            # 가독성 분석
-            reading_ease = 0
-            reading_grade = 0
-            if TEXTSTAT_AVAILABLE and text:
-                try:
-                    reading_ease = flesch_reading_ease(text)
-                    reading_grade = flesch_kincaid_grade(text)
-                except:
-                    pass
+            # 가독성 분석 (한글이 절반 이상이면 한국어 계수 사용)
+            reading = readability(text)
             
             return {
-                'word_count': len(filtered_words),
+                'word_count': word_count,
                 'character_count': len(text),
-                'paragraph_count': len(soup.find_all('p')),
-                'reading_ease': reading_ease,
-                'reading_grade': reading_grade,
-                'most_common_words': dict(Counter(filtered_words).most_common(20)),
-                'content_density': len(filtered_words) / len(response.content) * 1000 if response.content else 0
+                'paragraph_count': facts.visible_paragraph_count,
+                'reading_ease': reading['reading_ease'],
+                'reading_grade': reading['reading_grade'],
+                'reading_language': reading['language'],
+                'most_common_words': dict(keywords.most_common(20)),
+                'content_density': word_count / len(page.content) * 1000 if page.content else 0
             }
         except Exception as e:
             print(f"콘텐츠 분석 오류: {e}")
@@ -293,103 +1600,179 @@ class URLAnalyzer:
                 'paragraph_count': 0,
                 'reading_ease': 0,
                 'reading_grade': 0,
+                'reading_language': None,
                 'most_common_words': {},
                 'content_density': 0
             }
     
-    def _simple_tokenize(self, text):
-        """간단한 토큰화 (NLTK 대체)"""
-        # 기본적인 단어 분리
-        words = re.findall(r'\b\w+\b', text.lower())
-        return words
-    
-    def analyze_technical(self, url):
+    def analyze_technical(self, url, page=None):
         """기술적 분석"""
         try:
-            response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            page = self._get_page(url, page)
+            facts = page.facts
             
             # JavaScript 및 CSS 파일 분석
-            scripts = soup.find_all('script', src=True)
-            stylesheets = soup.find_all('link', rel='stylesheet')
-            
-            # Schema.org 마크업 확인
-            schema_scripts = soup.find_all('script', type='application/ld+json')
+            external_scripts = [script for script in facts.scripts if script['src'] is not None]
+            technologies = self._detect_technologies(page.headers, facts)
             
             return {
-                'doctype': str(soup.contents[0]) if soup.contents else '',
-                'html5': '<!DOCTYPE html>' in response.text.upper(),
-                'javascript_files': len(scripts),
-                'css_files': len(stylesheets),
-                'inline_scripts': len(soup.find_all('script', src=False)),
-                'inline_styles': len(soup.find_all('style')),
-                'schema_markup': len(schema_scripts),
-                'viewport_meta': bool(soup.find('meta', attrs={'name': 'viewport'})),
-                'responsive_design': self._check_responsive_design(soup),
-                'technologies': self._detect_technologies(response.headers, soup)
+                'doctype': facts.doctype,
+                'html5': '<!DOCTYPE html>' in page.text.upper(),
+                'javascript_files': len(external_scripts),
+                'css_files': len(facts.stylesheets),
+                'inline_scripts': len(facts.scripts) - len(external_scripts),
+                'inline_styles': facts.style_blocks,
+                'schema_markup': len(facts.ld_json),
+                'viewport_meta': facts.find_meta('viewport') is not None,
+                'responsive_design': self._check_responsive_design(facts),
+                'technologies': [technology['name'] for technology in technologies],
+                'technology_details': technologies
             }
         except Exception as e:
             return {'error': str(e)}
     
-    def analyze_security(self, url):
+    def analyze_page_weight(self, url, page=None):
+        """페이지 무게 분석 - 문서가 참조하는 자원을 동시에 확인해 전체 전송 크기, 큰 자원, 자원별 압축/캐시 헤더,
+        렌더링 차단 자원의 주요 경로 추정을 계산 (상대 경로는 최종 응답 URL 기준)
+        """
+        try:
+            page = self._get_page(url, page)
+            page_url = page.response.url
+            assets = page_assets(page.facts, page_url)
+            return self._page_weight(page_url, len(page.content), assets[:self.max_assets], len(assets))
+        except Exception as e:
+            return {'error': str(e)}
+    
+    def _page_weight(self, page_url, document_bytes, assets, assets_found):
+        probes, cached = self._probe_assets([asset['url'] for asset in assets])
+        assets = [dict(asset, **probes[asset['url']]) for asset in assets]
+        return summarize_page_weight(page_url, document_bytes, assets, assets_found, cached_probes=cached)
+    
+    def _probe_assets(self, urls):
+        """자원을 asset_workers개까지 동시에 확인해 ({URL: 확인 결과}, 캐시에서 가져온 수) 반환
+        
+        asset_budget초 안에 끝나지 않은 자원은 기다리지 않고 크기를 모르는 것으로 표시 (unprobed_details)
+        """
+        if not urls:
+            return {}, 0
+        probes = {}
+        cached = 0
+        futures = {self._asset_executor.submit(self._cached_asset_probe, url): url for url in urls}
+        done, pending = wait(futures, timeout=self.asset_budget)
+        for future in done:
+            probes[futures[future]], hit = future.result()
+            cached += hit
+        for future in pending:
+            # 아직 시작하지 않은 확인은 공유 스레드를 차지하지 않도록 취소
+            future.cancel()
+            probes[futures[future]] = unprobed_details(futures[future])
+        return probes, cached
+    
+    def _cached_asset_probe(self, url):
+        """자원 캐시가 있으면 캐시된 결과를 사용 - (확인 결과, 캐시 적중 여부)"""
+        if self.asset_cache is None:
+            return self._probe_asset(url), False
+        loaded = []
+        
+        def load():
+            loaded.append(url)
+            return self._probe_asset(url)
+        
+        return self.asset_cache.get_or_load(url, load), not loaded
+    
+    def _probe_asset(self, url):
+        """자원 하나의 크기와 헤더 확인 - HEAD가 실패하거나 크기를 알려 주지 않으면 첫 바이트만 GET
+        
+        범위 요청을 무시하고 전체를 보내면서 길이도 없으면 받은 바이트를 셈 (압축을 풀지 않은 전송 크기,
+        MAX_COUNTED_BYTES에서 멈추면 크기를 모르는 것으로 보고 truncated로 표시)
+        """
+        headers = {'Accept-Encoding': ASSET_ACCEPT_ENCODING}
+        try:
+            try:
+                response = self.session.head(url, timeout=self.timeout, headers=headers, allow_redirects=True)
+                size = response_size(response.status_code, response.headers)
+                if head_is_final(response.status_code, size):
+                    return probe_details(url, response.status_code, response.headers, 'HEAD', size)
+            except requests.RequestException:
+                pass
+            response = self.session.get(url, timeout=self.timeout, stream=True,
+                                        headers=dict(headers, Range=RANGE_PROBE_HEADER))
+            try:
+                size = response_size(response.status_code, response.headers)
+                truncated = False
+                if size is None and response.status_code == 200:
+                    size = 0
+                    for chunk in response.raw.stream(READ_CHUNK_SIZE, decode_content=False):
+                        size += len(chunk)
+                        if size >= MAX_COUNTED_BYTES:
+                            truncated = True
+                            break
+                return probe_details(url, response.status_code, response.headers, 'GET', size, truncated)
+            finally:
+                response.close()
+        except Exception as e:
+            return {'error': str(e)}
+    
+    def analyze_security(self, url, page=None):
         """보안 분석"""
         try:
-            response = self.session.get(url, timeout=10)
+            page = self._get_page(url, page)
             
             # SSL 인증서 확인
             is_https = url.startswith('https://')
-            ssl_info = {}
+            ssl_info = self._get_ssl_info(url) if is_https else {}
             
-            if is_https:
-                try:
-                    domain = urlparse(url).netloc
-                    context = ssl.create_default_context()
-                    with socket.create_connection((domain, 443), timeout=10) as sock:
-                        with context.wrap_socket(sock, server_hostname=domain) as ssock:
-                            cert = ssock.getpeercert()
-                            ssl_info = {
-                                'issuer': dict(x[0] for x in cert['issuer']),
-                                'subject': dict(x[0] for x in cert['subject']),
-                                'expires': cert['notAfter']
-                            }
-                except Exception as ssl_e:
-                    ssl_info = {'error': str(ssl_e)}
-            
-            return {
-                'https': is_https,
-                'ssl_certificate': ssl_info,
-                'security_headers': {
-                    'strict_transport_security': response.headers.get('strict-transport-security'),
-                    'content_security_policy': response.headers.get('content-security-policy'),
-                    'x_frame_options': response.headers.get('x-frame-options'),
-                    'x_content_type_options': response.headers.get('x-content-type-options')
-                },
-                'mixed_content': self._check_mixed_content(response.text, is_https)
-            }
+            return self._summarize_security(page, is_https, ssl_info)
         except Exception as e:
             return {'error': str(e)}
     
-    def analyze_keywords(self, url):
+    def _get_ssl_info(self, url):
+        """서버 인증서 정보 (출처 캐시 사용, 실패 시 오류 정보 반환)"""
+        try:
+            return dict(self._origin_fact(url, 'tls', lambda: self._load_ssl_info(url)))
+        except Exception as ssl_e:
+            return {'error': str(ssl_e)}
+    
+    def _load_ssl_info(self, url):
+        """TLS 연결로 서버 인증서 조회"""
+        parsed = urlparse(url)
+        context = self._ssl_context()
+        with self._polite(url), socket.create_connection((parsed.hostname, parsed.port or 443),
+                                                         timeout=self.connect_timeout) as sock:
+            sock.settimeout(self.read_timeout)
+            with context.wrap_socket(sock, server_hostname=parsed.hostname) as ssock:
+                return self._parse_certificate(ssock.getpeercert())
+    
+    def _parse_certificate(self, cert):
+        return {
+            'issuer': dict(x[0] for x in cert['issuer']),
+            'subject': dict(x[0] for x in cert['subject']),
+            'expires': cert['notAfter']
+        }
+    
+    def _summarize_security(self, page, is_https, ssl_info):
+        """헤더와 인증서 정보로 보안 결과 구성 (동기/비동기 엔진 공용)"""
+        return {
+            'https': is_https,
+            'ssl_certificate': ssl_info,
+            'security_headers': {
+                'strict_transport_security': page.headers.get('strict-transport-security'),
+                'content_security_policy': page.headers.get('content-security-policy'),
+                'x_frame_options': page.headers.get('x-frame-options'),
+                'x_content_type_options': page.headers.get('x-content-type-options')
+            },
+            'mixed_content': self._check_mixed_content(page.text, is_https)
+        }
+    
+    def analyze_keywords(self, url, page=None):
         """키워드 분석 - 개선된 버전"""
         try:
-            response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 불필요한 요소 제거
-            for element in soup(['script', 'style', 'nav', 'header', 'footer']):
-                element.decompose()
-            
-            # 텍스트 추출
-            title = soup.title.string.strip() if soup.title and soup.title.string else ''
-            meta_desc = self._get_meta_content(soup, 'description')
-            headings = ' '.join([h.get_text().strip() for h in soup.find_all(['h1', 'h2', 'h3'])])
-            body_text = soup.get_text()
+            page = self._get_page(url, page)
             
-            # 전체 텍스트 결합
-            all_text = f"{title} {meta_desc} {headings} {body_text}".lower()
-            all_text = re.sub(r'\s+', ' ', all_text.strip())
+            # 제목, 설명, h1~h3, 본문 텍스트(script/style/nav/header/footer 제외)의 단어 통계
+            stats = page.text_stats
             
-            if not all_text:
+            if not stats.has_keyword_text:
                 return {
                     'total_words': 0,
                     'unique_words': 0,
@@ -399,40 +1782,16 @@ class URLAnalyzer:
                     'meta_keywords': ''
                 }
             
-            # 단어 추출
-            words = re.findall(r'\b\w+\b', all_text)
-            word_freq = Counter(words)
-            
-            # 불용어 제거 및 필터링
-            filtered_freq = {}
-            for word, freq in word_freq.items():
-                if (len(word) > 2 and 
-                    word not in self.stop_words and 
-                    word.isalpha()):
-                    filtered_freq[word] = freq
-            
-            total_words = len(words)
-            
-            # 키워드 밀도 계산
-            keyword_density = {}
-            if total_words > 0:
-                for word, freq in list(filtered_freq.items())[:20]:
-                    keyword_density[word] = (freq / total_words) * 100
-            
-            # 제목 키워드 분석
-            title_words = re.findall(r'\b\w+\b', title.lower())
-            title_keywords = {}
-            for word in title_words:
-                if word not in self.stop_words and len(word) > 2:
-                    title_keywords[word] = title_keywords.get(word, 0) + 1
+            # 불용어와 짧은 단어를 뺀 단어 빈도
+            keywords = stats.keywords(self.stop_words)
             
             return {
-                'total_words': total_words,
-                'unique_words': len(set(words)),
-                'keyword_density': keyword_density,
-                'top_keywords': dict(Counter(filtered_freq).most_common(20)),
-                'title_keywords': title_keywords,
-                'meta_keywords': self._get_meta_content(soup, 'keywords')
+                'total_words': stats.word_total,
+                'unique_words': len(stats.counts),
+                'keyword_density': stats.keyword_density(keywords),
+                'top_keywords': dict(keywords.most_common(20)),
+                'title_keywords': stats.title_keywords(self.stop_words),
+                'meta_keywords': page.facts.meta_content('keywords', visible_only=True)
             }
         except Exception as e:
             print(f"키워드 분석 오류: {e}")
@@ -446,60 +1805,62 @@ class URLAnalyzer:
                 'meta_keywords': ''
             }
     
-    def analyze_social_media(self, url):
+    def analyze_social_media(self, url, page=None):
         """소셜 미디어 분석"""
         try:
-            response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            facts = self._get_page(url, page).facts
             
-            # Open Graph 태그
+            # Open Graph / Twitter Card 태그
             og_tags = {}
-            for meta in soup.find_all('meta', property=re.compile(r'^og:')):
-                og_tags[meta['property']] = meta.get('content', '')
-            
-            # Twitter Card 태그
             twitter_tags = {}
-            for meta in soup.find_all('meta', attrs={'name': re.compile(r'^twitter:')}):
-                twitter_tags[meta['name']] = meta.get('content', '')
+            for meta in facts.metas:
+                content = meta['content'] if meta['content'] is not None else ''
+                if meta['property'] is not None and meta['property'].startswith('og:'):
+                    og_tags[meta['property']] = content
+                if meta['name'] is not None and meta['name'].startswith('twitter:'):
+                    twitter_tags[meta['name']] = content
             
             # 소셜 미디어 링크 찾기
             social_links = []
             social_domains = ['facebook.com', 'twitter.com', 'instagram.com', 'linkedin.com', 
                             'youtube.com', 'tiktok.com', 'pinterest.com']
             
-            for link in soup.find_all('a', href=True):
-                href = link['href']
+            share_pattern = re.compile(r'(facebook|twitter|linkedin)\.com/share')
+            share_buttons = 0
+            for href in facts.links:
                 for domain in social_domains:
                     if domain in href:
                         social_links.append({'platform': domain, 'url': href})
+                if share_pattern.search(href):
+                    share_buttons += 1
             
             return {
                 'open_graph': og_tags,
                 'twitter_cards': twitter_tags,
                 'social_links': social_links,
-                'social_share_buttons': len(soup.find_all('a', href=re.compile(r'(facebook|twitter|linkedin)\.com/share')))
+                'social_share_buttons': share_buttons
             }
         except Exception as e:
             return {'error': str(e)}
     
-    def analyze_mobile_compatibility(self, url):
+    def analyze_mobile_compatibility(self, url, page=None):
         """모바일 호환성 분석"""
         try:
-            response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            page = self._get_page(url, page)
+            facts = page.facts
             
             # 뷰포트 메타 태그 확인
-            viewport = soup.find('meta', attrs={'name': 'viewport'})
-            viewport_content = viewport.get('content', '') if viewport else ''
+            viewport = facts.find_meta('viewport')
+            viewport_content = (viewport['content'] or '') if viewport else ''
             
             # 반응형 디자인 요소 확인
-            media_queries = len(re.findall(r'@media', response.text))
+            media_queries = len(re.findall(r'@media', page.text))
             
             return {
                 'viewport_meta': bool(viewport),
                 'viewport_content': viewport_content,
                 'media_queries_count': media_queries,
-                'responsive_images': len(soup.find_all('img', srcset=True)),
+                'responsive_images': len([img for img in facts.images if img['srcset'] is not None]),
                 'mobile_friendly_score': self._calculate_mobile_score(viewport_content, media_queries)
             }
         except Exception as e:
@@ -581,9 +1942,9 @@ class URLAnalyzer:
                     performance.get('max_response_time', 0)
                 ],
                 'scores': {
-                    'seo': len(seo_analysis.get('meta_tags', {})) * 10,
+                    'seo': self._calculate_seo_score(len(seo_analysis.get('meta_tags', {}))),
                     'performance': performance.get('performance_score', 0),
-                    'security': 85 if security_analysis.get('https') else 45,
+                    'security': self._calculate_security_score(security_analysis.get('https')),
                     'mobile': mobile_analysis.get('mobile_friendly_score', 0)
                 }
             }
@@ -591,66 +1952,85 @@ class URLAnalyzer:
         return dashboard_data
     
     # 헬퍼 메서드들
-    def _get_meta_content(self, soup, name):
-        meta = soup.find('meta', attrs={'name': name}) or soup.find('meta', attrs={'property': name})
-        return meta.get('content', '') if meta else ''
-    
     def _extract_charset(self, content_type):
         if 'charset=' in content_type:
             return content_type.split('charset=')[1].split(';')[0]
         return ''
     
-    def _check_robots_txt(self, url):
+    def _probe_timeout(self):
+        # robots.txt/sitemap 확인은 부가 정보이므로 읽기 시간을 5초 이내로 제한
+        return (self.connect_timeout, min(self.read_timeout, 5))
+    
+    def _origin_fact(self, url, fact, loader):
+        """출처 단위 정보 - 출처 캐시가 있으면 캐시된 값, 없으면 loader()로 조회"""
+        if self.origin_cache is None:
+            return loader()
+        return self.origin_cache.get_or_load(url, fact, loader)
+    
+    def get_robots(self, url):
+        """URL이 속한 출처의 robots.txt 규칙 (RobotsRules, 요청 실패 시 빈 규칙은 캐시하지 않음)"""
         try:
-            robots_url = urljoin(url, '/robots.txt')
-            response = self.session.get(robots_url, timeout=5)
-            return response.status_code == 200
-        except:
-            return False
+            rules = self._origin_fact(url, 'robots', lambda: self._load_robots(url))
+        except Exception:
+            return RobotsRules()
+        if self.scheduler is not None:
+            self.scheduler.set_crawl_delay(urlparse(url).netloc.lower(),
+                                           rules.crawl_delay(self.session.headers['User-Agent']))
+        return rules
     
-    def _check_sitemap(self, url):
+    def _probe_get(self, url, max_bytes):
+        """robots.txt/sitemap 요청 - 본문은 max_bytes와 PROBE_MAX_SECONDS 안에서만 읽음"""
+        response = self.session.get(url, timeout=self._probe_timeout(), stream=True)
         try:
-            sitemap_url = urljoin(url, '/sitemap.xml')
-            response = self.session.get(sitemap_url, timeout=5)
-            return response.status_code == 200
-        except:
-            return False
+            self._read_body(response, BodyBudget(max_bytes, PROBE_MAX_SECONDS))
+        finally:
+            response.close()
+        return response
+    
+    def _load_robots(self, url):
+        response = self._probe_get(urljoin(url, '/robots.txt'), ROBOTS_MAX_BYTES)
+        return RobotsRules(response.text, response.status_code)
+    
+    def get_sitemap(self, url):
+        """URL이 속한 출처의 /sitemap.xml (Sitemap, 요청 실패 시 빈 사이트맵은 캐시하지 않음)"""
+        try:
+            return self._origin_fact(url, 'sitemap', lambda: self._load_sitemap(url))
+        except Exception:
+            return Sitemap()
     
-    def _calculate_performance_score(self, times, content_size):
+    def _load_sitemap(self, url):
+        return self._fetch_sitemap(urljoin(url, '/sitemap.xml'))
+    
+    def _fetch_sitemap(self, sitemap_url):
+        response = self._probe_get(sitemap_url, SITEMAP_MAX_BYTES)
+        return Sitemap(response.content, response.status_code, base_url=response.url)
+    
+    def _robots_summary(self, url):
+        return self.get_robots(url).summary(url, self.session.headers['User-Agent'])
+    
+    def _sitemap_summary(self, url):
+        return self.get_sitemap(url).summary(url)
+    
+    # 점수 계산 - scoring.py의 일괄(벡터) 계산과 같은 식이므로 함께 수정해야 함
+    def _calculate_performance_score(self, times, content_size, ttfb=None):
+        weights = self.score_weights['performance']
         avg_time = sum(times) / len(times)
-        size_score = max(0, 100 - (content_size / 1024 / 1024) * 10)  # MB당 10점 감점
-        time_score = max(0, 100 - avg_time * 20)  # 초당 20점 감점
+        size_score = max(0, 100 - (content_size / 1024 / 1024) * weights['size_penalty_per_mb'])
+        time_score = max(0, 100 - avg_time * weights['time_penalty_per_second'])
+        if ttfb is not None:
+            # 첫 바이트 시간은 서버 응답성을 직접 보여주므로 함께 반영
+            time_score = (time_score + max(0, 100 - ttfb * weights['ttfb_penalty_per_second'])) / 2
         return (size_score + time_score) / 2
     
-    def _check_responsive_design(self, soup):
-        viewport = soup.find('meta', attrs={'name': 'viewport'})
-        media_queries = len(soup.find_all('style', string=re.compile(r'@media')))
-        return bool(viewport) and media_queries > 0
-    
-    def _detect_technologies(self, headers, soup):
-        technologies = []
-        
-        # 서버 정보
-        server = headers.get('server', '').lower()
-        if 'nginx' in server:
-            technologies.append('Nginx')
-        elif 'apache' in server:
-            technologies.append('Apache')
-        
-        # JavaScript 프레임워크
-        scripts = soup.find_all('script', src=True)
-        for script in scripts:
-            src = script['src'].lower()
-            if 'react' in src:
-                technologies.append('React')
-            elif 'vue' in src:
-                technologies.append('Vue.js')
-            elif 'angular' in src:
-                technologies.append('Angular')
-            elif 'jquery' in src:
-                technologies.append('jQuery')
-        
-        return technologies
+    def _check_responsive_design(self, facts):
+        return facts.find_meta('viewport') is not None and facts.media_style_blocks > 0
+    
+    def _detect_technologies(self, headers, facts):
+        """응답 헤더, 스크립트/스타일시트 주소, 메타 태그, 쿠키를 기술 지문(technologies.json)과 비교
+        
+        반환: [{'name', 'category', 'version'}] (버전을 알 수 없으면 None)
+        """
+        return detect_technologies(headers, facts)
     
     def _check_mixed_content(self, html_content, is_https):
         if not is_https:
@@ -658,14 +2038,22 @@ class URLAnalyzer:
         return 'http://' in html_content and 'https://' in html_content
     
     def _calculate_mobile_score(self, viewport_content, media_queries):
+        weights = self.score_weights['mobile']
         score = 0
         if viewport_content:
-            score += 40
+            score += weights['viewport']
             if 'width=device-width' in viewport_content:
-                score += 30
+                score += weights['device_width']
         if media_queries > 0:
-            score += 30
+            score += weights['media_queries']
         return min(score, 100)
+    
+    def _calculate_seo_score(self, meta_tag_count):
+        return meta_tag_count * self.score_weights['seo']['meta_tag']
+    
+    def _calculate_security_score(self, https):
+        weights = self.score_weights['security']
+        return weights['https'] if https else weights['http']
 
 
 # 사용 예시 및 테스트 함수
@@ -0,0 +1,126 @@
+"""
+출처(origin) 단위 캐시 - 같은 사이트의 여러 페이지를 분석할 때 사이트 공통 정보를 재사용
+robots.txt, sitemap.xml, DNS 조회, TLS 인증서 결과를 각자의 TTL로 메모리에 보관
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+from result_cache import DEFAULT_PORTS
+
+# 정보별 기본 유효 시간(초)
+DEFAULT_TTLS = {
+    'robots': 3600,
+    'sitemap': 3600,
+    'dns': 300,
+    'tls': 3600
+}
+
+
+def origin_of(url):
+    """URL의 출처 키 - 스킴과 호스트(소문자), 기본이 아닌 포트"""
+    parsed = urlparse(url)
+    scheme = parsed.scheme.lower()
+    host = (parsed.hostname or '').lower()
+    if parsed.port and parsed.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parsed.port}"
+    return f"{scheme}://{host}"
+
+
+class OriginCache:
+    """출처별 정보 캐시 (스레드 안전)
+
+    ttls: 정보별 유효 시간(초) - DEFAULT_TTLS 중 바꿀 항목만 지정
+    max_origins: 보관할 최대 출처 수 (초과 시 가장 오래 사용하지 않은 출처부터 제거)
+
+    같은 정보를 여러 스레드가 동시에 요청하면 한 스레드만 불러오고 나머지는 그 결과를 사용
+    """
+
+    def __init__(self, ttls=None, max_origins=1000):
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.max_origins = max_origins
+        self.hits = dict.fromkeys(self.ttls, 0)
+        self.misses = dict.fromkeys(self.ttls, 0)
+        self._origins = OrderedDict()
+        self._loading = {}
+        self._lock = threading.Lock()
+
+    def _lookup(self, origin, fact):
+        facts = self._origins.get(origin)
+        entry = facts.get(fact) if facts else None
+        if entry is None:
+            return None
+        if entry[0] <= time.time():
+            del facts[fact]
+            return None
+        self._origins.move_to_end(origin)
+        return entry[1]
+
+    def get(self, url, fact):
+        """유효한 정보가 있으면 반환, 없으면 None"""
+        origin = origin_of(url)
+        with self._lock:
+            value = self._lookup(origin, fact)
+            if value is None:
+                self.misses[fact] = self.misses.get(fact, 0) + 1
+            else:
+                self.hits[fact] = self.hits.get(fact, 0) + 1
+            return value
+
+    def set(self, url, fact, value):
+        origin = origin_of(url)
+        with self._lock:
+            self._origins.setdefault(origin, {})[fact] = (time.time() + self.ttls.get(fact, 300), value)
+            self._origins.move_to_end(origin)
+            while len(self._origins) > self.max_origins:
+                self._origins.popitem(last=False)
+
+    def get_or_load(self, url, fact, loader):
+        """캐시된 정보를 반환하고, 없으면 loader()로 불러와 저장 (예외는 저장하지 않고 그대로 전달)"""
+        value = self.get(url, fact)
+        if value is not None:
+            return value
+        key = (origin_of(url), fact)
+        # 키마다 [잠금, 기다리거나 불러오는 스레드 수] - 마지막 스레드가 끝날 때 제거
+        with self._lock:
+            loading = self._loading.setdefault(key, [threading.Lock(), 0])
+            loading[1] += 1
+        try:
+            with loading[0]:
+                # 기다리는 동안 다른 스레드가 불러왔으면 그 결과 사용
+                with self._lock:
+                    value = self._lookup(*key)
+                if value is None:
+                    value = loader()
+                    self.set(url, fact, value)
+        finally:
+            with self._lock:
+                loading[1] -= 1
+                if not loading[1]:
+                    del self._loading[key]
+        return value
+
+    def invalidate(self, url, fact=None):
+        """출처의 정보 하나(fact) 또는 전체 삭제"""
+        origin = origin_of(url)
+        with self._lock:
+            if fact is None:
+                self._origins.pop(origin, None)
+            elif origin in self._origins:
+                self._origins[origin].pop(fact, None)
+
+    def clear(self):
+        with self._lock:
+            self._origins.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'origins': len(self._origins),
+                'hits': dict(self.hits),
+                'misses': dict(self.misses),
+                'ttls': dict(self.ttls),
+                'max_origins': self.max_origins
+            }
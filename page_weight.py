@@ -0,0 +1,369 @@
+"""
+페이지 무게 분석 - 문서가 참조하는 스크립트/스타일시트/이미지/폰트의 전송 크기와 캐시/압축 헤더
+자원은 본문을 받지 않고 HEAD로 확인하며, HEAD가 실패하거나 크기를 알려 주지 않으면 첫 바이트만 요청(Range)해
+Content-Range의 전체 크기를 사용. 확인 결과는 자원 URL별로 캐시해 같은 사이트의 페이지들이 공유
+(python page_weight.py - 픽스처 서버에서 확인한 크기를 실제 파일 크기와 비교)
+"""
+
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urljoin, urldefrag, urlparse
+
+from origin_cache import origin_of
+
+# 자원 확인 요청의 Accept-Encoding - 브라우저가 받는 크기(압축 후)를 알기 위해 브라우저와 같게 보냄
+ASSET_ACCEPT_ENCODING = 'gzip, deflate, br'
+# 크기 확인용 범위 요청 (첫 바이트만)
+RANGE_PROBE_HEADER = 'bytes=0-0'
+# 범위 요청도 크기를 알려 주지 않아 본문을 세어야 할 때 읽는 최대 바이트 수
+MAX_COUNTED_BYTES = 10 * 1024 * 1024
+
+# HEAD 응답 상태가 이 값 이상이면 범위 요청으로 다시 확인 (405/501 등 HEAD를 막은 서버)
+HEAD_FALLBACK_STATUS = 400
+# 자원이 없다는 응답은 GET으로 다시 확인하지 않음
+MISSING_STATUSES = (404, 410)
+
+# 자바스크립트로 실행되는 <script type> 값 (그 외는 템플릿/데이터 블록으로 보고 제외)
+SCRIPT_TYPES = frozenset(['', 'text/javascript', 'application/javascript', 'text/ecmascript',
+                          'application/ecmascript', 'module'])
+# 렌더링을 막는 스타일시트 media 값 (print 등 다른 매체용은 내려받기만 하고 렌더링을 막지 않음)
+BLOCKING_MEDIA = frozenset(['', 'all', 'screen'])
+# <link rel="preload" as="..."> 값별 자원 종류
+PRELOAD_KINDS = {'script': 'script', 'style': 'stylesheet', 'font': 'font', 'image': 'image'}
+ICON_RELS = frozenset(['icon', 'apple-touch-icon'])
+
+# 압축하면 크게 줄어드는 텍스트 자원 - 이 크기 이상인데 Content-Encoding이 없으면 압축 누락으로 보고
+COMPRESSIBLE_KINDS = frozenset(['script', 'stylesheet'])
+COMPRESSIBLE_TYPES = re.compile(r'^(?:text/|application/(?:javascript|json|xml)|image/svg\+xml)')
+MIN_COMPRESSIBLE_BYTES = 1024
+COMPRESSED_ENCODINGS = frozenset(['gzip', 'br', 'deflate', 'zstd', 'compress'])
+
+MAX_AGE_PATTERN = re.compile(r'(?:^|,)\s*max-age\s*=\s*"?(\d+)', re.IGNORECASE)
+
+# 결과에 나열하는 큰 자원 수
+LARGEST_ASSETS = 10
+
+# 주요 경로 추정에 쓰는 기준 네트워크 - 측정 환경과 관계없이 비교할 수 있도록 고정값
+# (Lighthouse 모바일 기준의 느린 4G: 왕복 150ms, 1.6Mbps)
+CRITICAL_PATH_RTT = 0.15
+CRITICAL_PATH_BANDWIDTH = 1.6 * 1000 * 1000 / 8   # 초당 바이트
+# 새 출처에 연결할 때 드는 왕복 수 (TCP, HTTPS면 TLS 추가)
+CONNECTION_ROUND_TRIPS = {'http': 1, 'https': 2}
+
+
+def page_assets(facts, base_url):
+    """문서가 참조하는 자원 목록 [{'url', 'kind', 'render_blocking'}] (같은 URL은 한 번만, http/https만)
+
+    async/defer 없는 외부 스크립트와 화면용 스타일시트를 렌더링 차단 자원으로 봄
+    이미지는 src(없으면 srcset의 첫 후보) 하나만 셈
+    """
+    assets = OrderedDict()
+
+    def add(href, kind, blocking=False):
+        if not href or not href.strip():
+            return
+        url = urldefrag(urljoin(base_url, href.strip()))[0]
+        if urlparse(url).scheme not in CONNECTION_ROUND_TRIPS:
+            return
+        asset = assets.get(url)
+        if asset is None:
+            assets[url] = {'url': url, 'kind': kind, 'render_blocking': blocking}
+        elif blocking:
+            asset['render_blocking'] = True
+
+    for link in facts.resource_links:
+        rel = link['rel']
+        if 'stylesheet' in rel:
+            media = (link['media'] or '').strip().lower()
+            add(link['href'], 'stylesheet', blocking='alternate' not in rel and media in BLOCKING_MEDIA)
+        elif 'modulepreload' in rel:
+            add(link['href'], 'script')
+        elif 'preload' in rel:
+            add(link['href'], PRELOAD_KINDS.get((link['as'] or '').lower(), 'other'))
+        elif ICON_RELS.intersection(rel):
+            add(link['href'], 'icon')
+    for script in facts.scripts:
+        script_type = (script['type'] or '').strip().lower()
+        if script['src'] is not None and script_type in SCRIPT_TYPES:
+            add(script['src'], 'script',
+                blocking=not (script['async'] or script['defer'] or script_type == 'module'))
+    for image in facts.images:
+        src = image['src']
+        if not src and image['srcset']:
+            src = image['srcset'].strip().split(',')[0].split()[0]
+        add(src, 'image')
+    return list(assets.values())
+
+
+def cache_lifetime(headers):
+    """응답을 다시 확인하지 않고 쓸 수 있는 시간(초) - Cache-Control max-age, 없으면 Expires 기준
+
+    no-store/no-cache면 0, 캐시 정책 헤더가 없으면 None (브라우저 휴리스틱에 맡김)
+    """
+    cache_control = headers.get('cache-control', '').lower()
+    if 'no-store' in cache_control or 'no-cache' in cache_control:
+        return 0
+    match = MAX_AGE_PATTERN.search(cache_control)
+    if match:
+        return int(match.group(1))
+    expires = headers.get('expires')
+    if expires is None:
+        return None
+    try:
+        expires_at = parsedate_to_datetime(expires)
+    except (TypeError, ValueError):
+        # 잘못된 Expires는 이미 만료된 것으로 취급 (RFC 9111)
+        return 0
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    try:
+        now = parsedate_to_datetime(headers['date'])
+    except (KeyError, TypeError, ValueError):
+        now = datetime.now(timezone.utc)
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+    return max(0, int((expires_at - now).total_seconds()))
+
+
+def response_size(status, headers):
+    """응답 헤더로 알 수 있는 자원 전체 크기 - 206이면 Content-Range의 전체 길이, 아니면 Content-Length"""
+    if status == 206:
+        total = headers.get('content-range', '').rpartition('/')[2].strip()
+        return int(total) if total.isdigit() else None
+    length = headers.get('content-length', '').strip()
+    return int(length) if length.isdigit() else None
+
+
+def head_is_final(status, size):
+    """HEAD 응답만으로 확인을 끝낼 수 있는지 - 크기를 알려 준 정상 응답이거나 자원이 없다는 응답"""
+    return status in MISSING_STATUSES or (status < HEAD_FALLBACK_STATUS and size is not None)
+
+
+def probe_details(url, status, headers, method, size, truncated=False):
+    """자원 확인 응답을 결과 항목으로 정리 (requests/aiohttp 헤더 모두 사용 가능)
+
+    truncated: 받은 바이트를 세다가 MAX_COUNTED_BYTES에서 멈춤 - 실제 크기를 모르므로 bytes는 None
+    (unknown_size로 집계)
+    """
+    encoding = headers.get('content-encoding', '').strip().lower()
+    return {
+        'url': url,
+        'status': status,
+        'method': method,
+        'bytes': None if truncated else size,
+        'truncated': truncated,
+        'content_type': headers.get('content-type', '').split(';')[0].strip().lower(),
+        'content_encoding': encoding,
+        'cache_control': headers.get('cache-control', ''),
+        'expires': headers.get('expires'),
+        'etag': headers.get('etag'),
+        'last_modified': headers.get('last-modified'),
+        'cache_lifetime': cache_lifetime(headers)
+    }
+
+
+def unprobed_details(url):
+    """시간 예산 안에 확인하지 못한 자원의 결과 항목 - 실패가 아니라 크기를 모르는 것으로 보고 unknown_size로 집계
+
+    같은 호스트의 자원이 많으면 호스트별 속도 제한 때문에 예산 안에 다 확인하지 못할 수 있음
+    """
+    return {'url': url, 'bytes': None, 'budget_exceeded': True}
+
+
+def _is_compressible(asset):
+    return asset['kind'] in COMPRESSIBLE_KINDS or bool(COMPRESSIBLE_TYPES.match(asset.get('content_type') or ''))
+
+
+def critical_path(page_url, document_bytes, assets):
+    """렌더링 전에 받아야 하는 문서와 차단 자원의 요청 수/바이트와 기준 네트워크에서의 예상 시간(초)
+
+    문서 연결과 요청, 차단 자원 요청(동시에 한 번), 새 출처 연결(가장 오래 걸리는 출처 하나)의 왕복에
+    전송 바이트를 대역폭으로 나눈 시간을 더함
+    """
+    page_origin = origin_of(page_url)
+    blocking = [asset for asset in assets if asset['render_blocking']]
+    round_trips = CONNECTION_ROUND_TRIPS.get(urlparse(page_url).scheme, 1) + 1
+    if blocking:
+        round_trips += 1 + max((CONNECTION_ROUND_TRIPS[urlparse(asset['url']).scheme] for asset in blocking
+                                if origin_of(asset['url']) != page_origin), default=0)
+    total_bytes = document_bytes + sum(asset.get('bytes') or 0 for asset in blocking)
+    return {
+        'requests': 1 + len(blocking),
+        'bytes': total_bytes,
+        'round_trips': round_trips,
+        'estimated_time': round(round_trips * CRITICAL_PATH_RTT + total_bytes / CRITICAL_PATH_BANDWIDTH, 3),
+        'blocking_assets': [asset['url'] for asset in blocking]
+    }
+
+
+def summarize_page_weight(page_url, document_bytes, assets, assets_found=None, cached_probes=0,
+                          largest=LARGEST_ASSETS):
+    """자원별 확인 결과로 페이지 무게 결과 구성 (동기/비동기 엔진 공용)
+
+    assets: page_assets 항목에 probe_details(또는 unprobed_details, {'error'})를 합친 목록
+    assets_found: 문서에서 찾은 자원 수 (확인 개수 제한으로 일부만 확인했을 때)
+    cached_probes: 자원 캐시에서 가져온 확인 결과 수
+    """
+    by_kind = {}
+    for asset in assets:
+        kind = by_kind.setdefault(asset['kind'], {'count': 0, 'bytes': 0})
+        kind['count'] += 1
+        kind['bytes'] += asset.get('bytes') or 0
+    sized = [asset for asset in assets if asset.get('bytes') is not None]
+    unprobed = [asset for asset in assets if asset.get('budget_exceeded')]
+    ok = [asset for asset in assets if 'error' not in asset and not asset.get('budget_exceeded')
+          and asset.get('status', 0) < 400]
+    return {
+        'page_url': page_url,
+        'document_bytes': document_bytes,
+        'total_bytes': document_bytes + sum(asset['bytes'] for asset in sized),
+        'asset_count': len(assets),
+        'assets_found': len(assets) if assets_found is None else assets_found,
+        'by_kind': by_kind,
+        'largest_assets': [{'url': asset['url'], 'kind': asset['kind'], 'bytes': asset['bytes']}
+                           for asset in sorted(sized, key=lambda asset: -asset['bytes'])[:largest]],
+        'uncompressed_assets': [asset['url'] for asset in ok
+                                if _is_compressible(asset) and (asset.get('bytes') or 0) >= MIN_COMPRESSIBLE_BYTES
+                                and asset['content_encoding'] not in COMPRESSED_ENCODINGS],
+        'uncached_assets': [asset['url'] for asset in ok if not asset['cache_lifetime']],
+        'unknown_size': len(assets) - len(sized),
+        'failed_assets': len(assets) - len(ok) - len(unprobed),
+        'unprobed_assets': len(unprobed),
+        'cached_probes': cached_probes,
+        'critical_path': critical_path(page_url, document_bytes, assets),
+        'assets': assets
+    }
+
+
+class AssetCache:
+    """자원 URL별 확인 결과 캐시 (스레드 안전) - 같은 사이트의 페이지들이 공통 스크립트/스타일시트 결과를 공유
+
+    ttl: 결과 유효 시간(초)
+    max_entries: 보관할 최대 자원 수 (초과 시 가장 오래 사용하지 않은 자원부터 제거)
+
+    같은 자원을 여러 스레드가 동시에 요청하면 한 스레드만 확인하고 나머지는 그 결과를 사용
+    """
+
+    def __init__(self, ttl=3600, max_entries=10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._loading = {}
+        self._lock = threading.Lock()
+
+    def _lookup(self, url):
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        if entry[0] <= time.time():
+            del self._entries[url]
+            return None
+        self._entries.move_to_end(url)
+        return entry[1]
+
+    def get(self, url):
+        """유효한 결과가 있으면 반환, 없으면 None"""
+        with self._lock:
+            value = self._lookup(url)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def set(self, url, value):
+        with self._lock:
+            self._entries[url] = (time.time() + self.ttl, value)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, url, loader):
+        """캐시된 결과를 반환하고, 없으면 loader()로 확인해 저장 (오류 결과는 저장하지 않음)"""
+        value = self.get(url)
+        if value is not None:
+            return value
+        # URL마다 [잠금, 기다리거나 확인하는 스레드 수] - 마지막 스레드가 끝날 때 제거
+        with self._lock:
+            loading = self._loading.setdefault(url, [threading.Lock(), 0])
+            loading[1] += 1
+        try:
+            with loading[0]:
+                # 기다리는 동안 다른 스레드가 확인했으면 그 결과 사용
+                with self._lock:
+                    value = self._lookup(url)
+                if value is None:
+                    value = loader()
+                    if 'error' not in value:
+                        self.set(url, value)
+        finally:
+            with self._lock:
+                loading[1] -= 1
+                if not loading[1]:
+                    del self._loading[url]
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'ttl': self.ttl,
+                'max_entries': self.max_entries
+            }
+
+
+def check_fixture_sizes(paths=('/', '/about.html')):
+    """픽스처 페이지마다 확인한 자원 크기를 파일 크기와 비교해 {경로: (결과, 차이 목록)} 반환
+
+    같은 AssetCache를 공유하므로 두 번째 분석부터는 캐시된 결과를 사용
+    """
+    from main import URLAnalyzer
+    from fixture_server import FixtureServer, FIXTURES_DIR
+
+    cache = AssetCache()
+    analyzer = URLAnalyzer(asset_cache=cache)
+    report = {}
+    with FixtureServer() as server:
+        for path in paths + paths:
+            result = analyzer.analyze_page_weight(server.url(path))
+            mismatches = []
+            for asset in result.get('assets', []):
+                local = FIXTURES_DIR + urlparse(asset['url']).path
+                expected = os.path.getsize(local) if os.path.isfile(local) else None
+                if asset.get('bytes') != expected:
+                    mismatches.append(f"{asset['url']}: {asset.get('bytes')!r} != {expected!r}")
+            report.setdefault(path, []).append((result, mismatches))
+    return report, cache.stats()
+
+
+if __name__ == "__main__":
+    report, stats = check_fixture_sizes()
+    failed = False
+    for path, runs in report.items():
+        for run, (result, mismatches) in enumerate(runs, 1):
+            failed = failed or bool(mismatches) or 'error' in result
+            if 'error' in result:
+                print(f"❌ {path}: {result['error']}")
+                continue
+            critical = result['critical_path']
+            print(f"{'❌' if mismatches else '✅'} {path} ({run}회차): 자원 {result['asset_count']}개, "
+                  f"총 {result['total_bytes']:,}바이트, 주요 경로 {critical['requests']}개 요청 "
+                  f"{critical['estimated_time']:.2f}초 (캐시 사용 {result['cached_probes']}개)")
+            for mismatch in mismatches:
+                print(f"   {mismatch}")
+    print(f"자원 캐시: {stats['entries']}개, 적중 {stats['hits']}회, 누락 {stats['misses']}회")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,60 @@
+"""
+HTML 파서 백엔드 결과 비교 - fixtures/의 저장된 페이지를 설치된 백엔드마다 분석해
+html.parser 결과와 다른 항목을 출력 (python parser_parity.py)
+"""
+
+import sys
+
+from bs4.builder import builder_registry
+
+from main import URLAnalyzer, PageContext, DEFAULT_PARSER
+from page_weight import page_assets
+from fixture_server import FixtureServer, diff_results, fixture_pages
+
+BACKENDS = ('lxml', 'html5lib', 'html.parser')
+
+
+def analyze_with_parser(analyzer, url, response, parser):
+    """한 번 받은 응답을 지정한 파서로 파싱해 페이지 기반 분석을 모두 실행 (페이지 무게는 자원 요청 없이 자원 목록만)"""
+    page = PageContext(url, response, parser=parser)
+    return {
+        'basic_info': analyzer.get_basic_info(url, page=page),
+        'seo_analysis': analyzer.analyze_seo(url, page=page, include_probes=False),
+        'content_analysis': analyzer.analyze_content(url, page=page),
+        'technical_analysis': analyzer.analyze_technical(url, page=page),
+        'page_assets': page_assets(page.facts, url),
+        'security_analysis': analyzer.analyze_security(url, page=page),
+        'keyword_analysis': analyzer.analyze_keywords(url, page=page),
+        'social_media': analyzer.analyze_social_media(url, page=page),
+        'mobile_analysis': analyzer.analyze_mobile_compatibility(url, page=page)
+    }
+
+
+def check_parity(backends=BACKENDS):
+    """설치된 백엔드별로 html.parser 결과와의 차이를 {(페이지, 백엔드): 차이 목록}으로 반환"""
+    backends = [b for b in backends if b != DEFAULT_PARSER and builder_registry.lookup(b)]
+    analyzer = URLAnalyzer(parser=DEFAULT_PARSER)
+    report = {}
+    with FixtureServer() as server:
+        for path in fixture_pages():
+            url = server.url(path)
+            response = analyzer.session.get(url, timeout=10)
+            expected = analyze_with_parser(analyzer, url, response, DEFAULT_PARSER)
+            for backend in backends:
+                report[(path, backend)] = diff_results(
+                    expected, analyze_with_parser(analyzer, url, response, backend))
+    return report
+
+
+if __name__ == "__main__":
+    report = check_parity()
+    if not report:
+        print("비교할 추가 파서가 설치되지 않았습니다 (pip install lxml html5lib)")
+    for (path, backend), differences in report.items():
+        if differences:
+            print(f"❌ {path} [{backend}]")
+            for difference in differences:
+                print(f"   {difference}")
+        else:
+            print(f"✅ {path} [{backend}]: html.parser 결과와 일치")
+    sys.exit(1 if any(report.values()) else 0)
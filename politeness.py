@@ -0,0 +1,170 @@
+"""
+호스트별 요청 예절(politeness) 스케줄러 - 같은 호스트에 요청이 몰리지 않도록 속도를 조절
+호스트마다 토큰 버킷을 두고 robots.txt의 Crawl-delay와 429/503 응답의 Retry-After를 반영하며,
+전체 동시 요청 수에도 상한을 둠
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+# Retry-After를 반영하는 응답 상태
+THROTTLE_STATUSES = (429, 503)
+
+
+def host_of(url):
+    """URL의 호스트 키 (포트 포함, 소문자)"""
+    return urlparse(url).netloc.lower()
+
+
+def parse_retry_after(value, now=None):
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환 (해석할 수 없으면 None)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (retry_at - now).total_seconds())
+
+
+class _HostState:
+    def __init__(self):
+        self.tat = 0.0           # 다음 요청의 이론적 도착 시각 (GCRA 토큰 버킷)
+        self.not_before = 0.0    # Retry-After로 인해 이 시각 전에는 요청하지 않음
+        self.crawl_delay = None  # robots.txt Crawl-delay(초)
+        self.requests = 0
+        self.waited = 0.0
+        self.throttled = 0
+
+
+class HostScheduler:
+    """호스트별 토큰 버킷과 전체 동시성 상한을 관리 (스레드 안전)
+
+    rate: 호스트당 초당 요청 수
+    burst: 호스트당 한 번에 몰아서 보낼 수 있는 요청 수
+    max_concurrency: 모든 호스트를 합친 동시 요청 수 상한
+    max_backoff: Retry-After와 robots.txt Crawl-delay로 기다리는 최대 시간(초)
+    default_backoff: Retry-After 없이 429/503을 받았을 때 기다리는 시간(초)
+    max_hosts: 상태를 보관할 최대 호스트 수 (초과 시 오래 사용하지 않은 호스트 중 기다릴 것이 없는 호스트부터 제거)
+    """
+
+    def __init__(self, rate=1.0, burst=2, max_concurrency=16, max_backoff=300, default_backoff=5, max_hosts=10000):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_concurrency = max_concurrency
+        self.max_backoff = max_backoff
+        self.default_backoff = default_backoff
+        self.max_hosts = max_hosts
+        self.evicted = 0
+        self._hosts = OrderedDict()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+
+    def _state(self, host):
+        state = self._hosts.get(host)
+        if state is None:
+            if len(self._hosts) >= self.max_hosts:
+                self._evict_idle(len(self._hosts) - self.max_hosts + 1)
+            state = self._hosts[host] = _HostState()
+        self._hosts.move_to_end(host)
+        return state
+
+    def _evict_idle(self, count):
+        # 오래 사용하지 않은 호스트부터, 예약된 요청과 Retry-After 대기가 끝난 호스트만 제거
+        # (제거된 호스트는 처음 보는 호스트와 같으므로 바로 요청해도 속도 제한을 어기지 않음)
+        now = time.monotonic()
+        idle = []
+        for host, state in self._hosts.items():
+            if len(idle) >= count:
+                break
+            if state.tat <= now and state.not_before <= now:
+                idle.append(host)
+        for host in idle:
+            del self._hosts[host]
+        self.evicted += len(idle)
+
+    def _interval_and_tolerance(self, state):
+        # Crawl-delay가 있으면 그 간격으로 한 번에 하나씩만 요청
+        interval = 1.0 / self.rate
+        if state.crawl_delay:
+            return max(interval, state.crawl_delay), 0.0
+        return interval, interval * (self.burst - 1)
+
+    def reserve(self, host):
+        """호스트에 요청 한 번을 예약하고, 보내기 전에 기다려야 할 시간(초)을 반환"""
+        now = time.monotonic()
+        with self._lock:
+            state = self._state(host)
+            interval, tolerance = self._interval_and_tolerance(state)
+            start = max(now, state.tat - tolerance, state.not_before)
+            state.tat = max(state.tat, start) + interval
+            state.requests += 1
+            state.waited += start - now
+            return start - now
+
+    def ready_in(self, host):
+        """예약하지 않고 호스트에 지금 요청하면 기다려야 할 시간(초)"""
+        now = time.monotonic()
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                return 0.0
+            _, tolerance = self._interval_and_tolerance(state)
+            return max(0.0, state.tat - tolerance - now, state.not_before - now)
+
+    @contextmanager
+    def slot(self, host):
+        """호스트 속도 제한만큼 기다린 뒤 전체 동시성 슬롯을 잡고 요청 실행"""
+        delay = self.reserve(host)
+        if delay > 0:
+            time.sleep(delay)
+        with self._slots:
+            yield
+
+    def set_crawl_delay(self, host, delay):
+        """robots.txt의 Crawl-delay 반영 (None이면 해제, max_backoff를 넘으면 max_backoff로 제한)"""
+        if delay is not None:
+            delay = min(delay, self.max_backoff)
+        with self._lock:
+            self._state(host).crawl_delay = delay
+
+    def note_response(self, host, status_code, headers):
+        """429/503 응답이면 Retry-After(없으면 기본값)만큼 호스트 요청을 미룸"""
+        if status_code not in THROTTLE_STATUSES:
+            return
+        delay = parse_retry_after(headers.get('Retry-After'))
+        delay = min(self.default_backoff if delay is None else delay, self.max_backoff)
+        with self._lock:
+            state = self._state(host)
+            state.throttled += 1
+            state.not_before = max(state.not_before, time.monotonic() + delay)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hosts': {
+                    host: {
+                        'requests': state.requests,
+                        'waited': round(state.waited, 3),
+                        'throttled': state.throttled,
+                        'crawl_delay': state.crawl_delay
+                    }
+                    for host, state in self._hosts.items()
+                },
+                'rate': self.rate,
+                'burst': self.burst,
+                'max_concurrency': self.max_concurrency,
+                'max_hosts': self.max_hosts,
+                'evicted': self.evicted
+            }
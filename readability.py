@@ -0,0 +1,207 @@
+"""
+가독성 분석 - 본문을 한 번 훑으며 문장/단어/음절 수를 세어 Flesch 읽기 쉬움 점수와 Flesch-Kincaid 학년 계산
+textstat 없이 동작하며 단어별 음절 수는 캐시해 같은 단어를 다시 세지 않음
+한글은 글자(음절 블록) 하나를 한 음절로 세고, 한글 단어가 절반 이상인 본문은 한국어 계수로 계산
+(python readability.py - 한국어 기준 문장 확인, 영어 문서 묶음에서 textstat 결과와 비교 - textstat과 NLTK cmudict가 있을 때)
+"""
+
+import re
+import sys
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+
+# 음절 수를 기억해 둘 서로 다른 단어 수
+SYLLABLE_CACHE_SIZE = 100000
+
+# 언어별 공식 계수 - 읽기 쉬움: base - sentence * 문장당 단어 - syllable * 단어당 음절,
+# 학년: sentence * 문장당 단어 + syllable * 단어당 음절 + base
+# 한국어는 표준 공식이 없어 어절당 음절 수(영어 단어의 약 2배)와 문장당 어절 수(약 0.6배)의
+# 평균 비율로 영어 계수를 환산한 근사값
+READABILITY_COEFFICIENTS = {
+    'en': {
+        'ease': {'base': 206.835, 'sentence': 1.015, 'syllable': 84.6},
+        'grade': {'base': -15.59, 'sentence': 0.39, 'syllable': 11.8}
+    },
+    'ko': {
+        'ease': {'base': 206.835, 'sentence': 1.7, 'syllable': 42.3},
+        'grade': {'base': -15.59, 'sentence': 0.65, 'syllable': 5.9}
+    }
+}
+
+# 문장 끝 (전각 문장 부호 포함)
+SENTENCE_END_PATTERN = re.compile(r'[.!?。！？]+')
+# 공백으로 나뉜 덩어리 중 글자나 숫자가 있는 것을 단어로 셈
+WORD_PATTERN = re.compile(r'\S*\w\S*')
+# 문장으로 세는 조각의 최소 단어 수 - 이보다 짧은 조각(제목, 메뉴, 약어 뒤 조각 등)은 문장으로 세지 않음
+# 한국어는 어절 하나로도 문장이 되므로("감사합니다.") 한글이 있는 조각은 1
+MIN_SENTENCE_WORDS = {'en': 3, 'ko': 1}
+
+HANGUL_PATTERN = re.compile(r'[가-힣]')
+# 한자와 가나도 한 글자를 한 음절로 셈
+CJK_PATTERN = re.compile(r'[぀-ヿ一-鿿]')
+
+# 영어 음절 추정 규칙
+_VOWEL_GROUPS = re.compile(r'[aeiouy]+')
+# 발음하지 않는 끝 e, -ed, -es (make, jumped, makes) 와 -que/-gue
+_SILENT_ENDING = re.compile(r'(?<=[^aeiouy])(?:e|(?<=[^td])ed|(?<=[^sxzhgc])es)$|(?<=[qg])ue[sd]?$')
+# 자음 뒤 -le/-les/-led는 한 음절 (table, handled)
+_SYLLABIC_LE = re.compile(r'[^aeiouyl]l(?:e|es|ed)$')
+# 모음이 이어져도 두 음절로 읽는 경우 (radio, being, easier, quiet, fire, create)
+_EXTRA_SYLLABLE = re.compile(r'[^tscgnl]i[aou]|[eo]ing|[^aeiou]ier|[^tcs]ien|[^qg]u[ao]|[aeiou]y[aeiou]|[^aeiou]yi'
+                             r'|[^aeiou]eo|ia$|iet|ire[sd]?$|[^aeiouy]ism$|creat(?!ure)')
+# 합성어/접미사 앞의 발음하지 않는 e (statement, useful, lately)와 -ically
+_SILENT_INSIDE = re.compile(r'[aiouy][^aeiouy]e(?:ful|ment|ness|less|ly|thing|work|name|time|out)|ically')
+
+
+def _english_syllables(word):
+    """라틴 문자 단어(소문자, 악센트 제거)의 음절 수 추정"""
+    if not _VOWEL_GROUPS.search(word):
+        # 모음이 없으면 약어로 보고 글자마다 읽음 (http, css)
+        return len(word)
+    base = word
+    if len(word) > 2 and not _SYLLABIC_LE.search(word):
+        base = _SILENT_ENDING.sub('', word)
+    count = (len(_VOWEL_GROUPS.findall(base)) + len(_EXTRA_SYLLABLE.findall(word))
+             - len(_SILENT_INSIDE.findall(word)))
+    return max(1, count)
+
+
+@lru_cache(maxsize=SYLLABLE_CACHE_SIZE)
+def syllable_count(word):
+    """단어(소문자) 하나의 음절 수 - 한글/한자/가나는 글자 수, 라틴 문자는 영어 규칙으로 추정 (최소 1)"""
+    count = len(HANGUL_PATTERN.findall(word)) + len(CJK_PATTERN.findall(word))
+    latin = ''.join(ch for ch in unicodedata.normalize('NFKD', word) if 'a' <= ch <= 'z')
+    if latin:
+        count += _english_syllables(latin)
+    return max(1, count)
+
+
+def text_counts(text):
+    """문장, 단어, 음절 수와 한글 단어 수를 계산 (음절은 서로 다른 단어마다 한 번만 셈)
+
+    문장은 문장 부호로 나눈 조각 중 단어가 MIN_SENTENCE_WORDS개 이상인 것 (한글이 있으면 'ko' 기준, 본문이 있으면 최소 1)
+    """
+    text = text.lower()
+    # 단어는 문장 부호가 들어 있어도 한 덩어리로 셈 (3.5, example.com)
+    words = WORD_PATTERN.findall(text)
+    sentences = sum(1 for segment in SENTENCE_END_PATTERN.split(text)
+                    if len(WORD_PATTERN.findall(segment))
+                    >= MIN_SENTENCE_WORDS['ko' if HANGUL_PATTERN.search(segment) else 'en'])
+    counts = Counter(words)
+    syllables = hangul_words = 0
+    # 음절 수와 언어는 서로 다른 단어마다 한 번만 확인
+    for word, count in counts.items():
+        syllables += syllable_count(word) * count
+        if HANGUL_PATTERN.search(word):
+            hangul_words += count
+    return {
+        'sentences': max(1, sentences) if words else 0,
+        'words': len(words),
+        'syllables': syllables,
+        'hangul_words': hangul_words
+    }
+
+
+def readability(text, language=None):
+    """Flesch 읽기 쉬움 점수와 Flesch-Kincaid 학년
+
+    language: 'en' 또는 'ko' (None이면 한글 단어 비율로 판단)
+    반환: {'reading_ease', 'reading_grade', 'language', 'sentences', 'words', 'syllables'}
+    """
+    counts = text_counts(text)
+    if language is None:
+        language = 'ko' if counts['words'] and counts['hangul_words'] * 2 >= counts['words'] else 'en'
+    result = {
+        'reading_ease': 0,
+        'reading_grade': 0,
+        'language': language,
+        'sentences': counts['sentences'],
+        'words': counts['words'],
+        'syllables': counts['syllables']
+    }
+    if not counts['words']:
+        return result
+    words_per_sentence = counts['words'] / counts['sentences']
+    syllables_per_word = counts['syllables'] / counts['words']
+    ease = READABILITY_COEFFICIENTS[language]['ease']
+    grade = READABILITY_COEFFICIENTS[language]['grade']
+    result['reading_ease'] = ease['base'] - ease['sentence'] * words_per_sentence - ease['syllable'] * syllables_per_word
+    result['reading_grade'] = grade['base'] + grade['sentence'] * words_per_sentence + grade['syllable'] * syllables_per_word
+    return result
+
+
+def english_corpus():
+    """textstat 비교용 영어 문서 묶음 - 표준 라이브러리 모듈 설명문 (설치 환경과 관계없이 같은 내용)"""
+    import importlib
+    documents = {}
+    for name in ('argparse', 'json', 'logging', 'subprocess', 'threading', 'unittest', 'sqlite3', 'random',
+                 'statistics', 'pathlib', 'tempfile', 'datetime', 'decimal', 'heapq', 'pickle', 'textwrap'):
+        doc = importlib.import_module(name).__doc__
+        if doc and len(doc.split()) >= 50:
+            documents[name] = doc
+    return documents
+
+
+# 한국어 기준 문장 - (본문, 문장 수, 어절 수, 음절 수), 손으로 센 값
+KOREAN_REFERENCE = [
+    ('감사합니다. 안녕히 가세요!', 2, 3, 11),
+    ('오늘은 날씨가 맑습니다. 내일은 비가 옵니다. 우산을 챙기세요.', 3, 8, 25),
+    ('정말요? 네. 좋아요.', 3, 3, 7),
+    ('HTML 문서를 분석합니다. 결과는 JSON으로 저장됩니다.', 2, 6, 23),
+]
+
+
+def check_korean_reference(references=KOREAN_REFERENCE):
+    """한국어 기준 문장의 문장/어절/음절 수를 비교해 [(본문, 기대값, 계산값)] 중 다른 것만 반환"""
+    mismatches = []
+    for text, sentences, words, syllables in references:
+        counts = text_counts(text)
+        got = (counts['sentences'], counts['words'], counts['syllables'])
+        if got != (sentences, words, syllables):
+            mismatches.append((text, (sentences, words, syllables), got))
+    return mismatches
+
+
+# textstat과 비교할 때 허용하는 차이 - 읽기 쉬움은 Flesch 등급 한 칸(10점), 학년은 1.5학년
+TEXTSTAT_TOLERANCE = {'reading_ease': 10.0, 'reading_grade': 1.5}
+
+
+def compare_with_textstat(documents, tolerance=TEXTSTAT_TOLERANCE):
+    """문서마다 textstat과 점수를 비교해 {이름: {점수 이름: (내장 점수, textstat 점수, 허용 범위 안인지)}} 반환
+
+    textstat이나 NLTK cmudict가 없으면 None (textstat은 cmudict가 없으면 다운로드를 시도하므로 미리 확인)
+    """
+    try:
+        import nltk
+        nltk.data.find('corpora/cmudict')
+        import textstat
+    except (ImportError, LookupError):
+        return None
+    result = {}
+    for name, text in documents.items():
+        ours = readability(text, language='en')
+        theirs = {'reading_ease': textstat.flesch_reading_ease(text), 'reading_grade': textstat.flesch_kincaid_grade(text)}
+        result[name] = {key: (ours[key], theirs[key], abs(ours[key] - theirs[key]) <= tolerance[key])
+                        for key in theirs}
+    return result
+
+
+if __name__ == "__main__":
+    mismatches = check_korean_reference()
+    for text, expected, got in mismatches:
+        print(f"❌ {text}: 문장/어절/음절 {got} (기대값 {expected})")
+    if not mismatches:
+        print(f"✅ 한국어 기준 문장 {len(KOREAN_REFERENCE)}개: 문장/어절/음절 수 일치")
+    failed = bool(mismatches)
+    comparison = compare_with_textstat(english_corpus())
+    if comparison is None:
+        print("❌ textstat 또는 NLTK cmudict 데이터가 없어 비교하지 못했습니다 (pip install textstat, python -m nltk.downloader cmudict)")
+        sys.exit(1)
+    for name, scores in comparison.items():
+        line = ', '.join(f"{key} {ours:.1f} / textstat {theirs:.1f}" for key, (ours, theirs, _) in scores.items())
+        ok = all(within for _, _, within in scores.values())
+        failed = failed or not ok
+        print(f"{'✅' if ok else '❌'} {name}: {line}")
+    print(f"음절 캐시: {syllable_count.cache_info().currsize}개 단어")
+    sys.exit(1 if failed else 0)
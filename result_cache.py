@@ -0,0 +1,132 @@
+"""
+분석 결과 캐시 - 같은 URL을 반복 분석할 때 저장된 결과를 재사용
+메모리 LRU 캐시를 기본으로 하고, 선택적으로 SQLite 파일에 저장해 재시작 후에도 유지
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def normalize_url(url):
+    """캐시 키용 URL 정규화 - 스킴/호스트 소문자, 기본 포트와 fragment 제거, 쿼리 정렬"""
+    parsed = urlparse(url.strip())
+    scheme = parsed.scheme.lower()
+    host = (parsed.hostname or '').lower()
+    if parsed.port and parsed.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parsed.port}"
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return urlunparse((scheme, host, parsed.path or '/', parsed.params, query, ''))
+
+
+class ResultCache:
+    """TTL과 LRU 제거를 지원하는 분석 결과 캐시 (스레드 안전)
+
+    ttl: 결과 유효 시간(초)
+    max_entries: 메모리에 보관할 최대 결과 수 (초과 시 가장 오래 사용하지 않은 결과부터 제거)
+    db_path: SQLite 파일 경로 - 지정하면 결과를 디스크에도 저장
+    """
+
+    def __init__(self, ttl=300, max_entries=1000, db_path=None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    def _key(self, url, analysis_type):
+        return f"{analysis_type}:{normalize_url(url)}"
+
+    def get(self, url, analysis_type):
+        """유효한 결과가 있으면 반환, 없으면 None"""
+        key = self._key(url, analysis_type)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return json.loads(entry[1])
+            if entry:
+                del self._entries[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, expires_at FROM results WHERE key = ?", (key,)
+                ).fetchone()
+                if row and row[1] > now:
+                    self._remember(key, row[0], row[1])
+                    self.hits += 1
+                    return json.loads(row[0])
+                if row:
+                    self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+                    self._db.commit()
+
+            self.misses += 1
+            return None
+
+    def set(self, url, analysis_type, value):
+        key = self._key(url, analysis_type)
+        serialized = json.dumps(value, ensure_ascii=False, default=str)
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._remember(key, serialized, expires_at)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, serialized, expires_at)
+                )
+                self._db.execute("DELETE FROM results WHERE expires_at <= ?", (time.time(),))
+                self._db.commit()
+
+    def _remember(self, key, serialized, expires_at):
+        self._entries[key] = (expires_at, serialized)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, url, analysis_type):
+        key = self._key(url, analysis_type)
+        with self._lock:
+            self._entries.pop(key, None)
+            if self._db is not None:
+                self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+                self._db.commit()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'ttl': self.ttl,
+                'max_entries': self.max_entries,
+                'persistent': self._db is not None
+            }
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -0,0 +1,316 @@
+"""
+분석 결과 열 저장소 - analyze_url 결과를 평평한 열(column)로 바꿔 날짜별 SQLite 파일에 저장하고,
+필요한 열만 읽어 호스트/날짜별 집계, 백분위수, 점수 하락 페이지 같은 추세를 조회
+전체 결과(JSON)는 저장하지 않으므로 수천 건을 조회해도 메모리에 모두 올리지 않음
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+
+
+def _dig(results, *path):
+    """중첩 딕셔너리에서 경로의 값 (없으면 None)"""
+    value = results
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _length(value):
+    return len(value) if value is not None else None
+
+
+def _count_true(value):
+    return sum(1 for item in value.values() if item) if isinstance(value, dict) else None
+
+
+# 저장하는 열 - (이름, SQLite 타입, 결과에서 값을 꺼내는 함수)
+COLUMNS = (
+    ('status_code', 'INTEGER', lambda r: _dig(r, 'basic_info', 'status_code')),
+    ('response_time', 'REAL', lambda r: _dig(r, 'basic_info', 'response_time')),
+    ('content_length', 'INTEGER', lambda r: _dig(r, 'basic_info', 'content_length')),
+    ('truncated', 'INTEGER', lambda r: _dig(r, 'basic_info', 'truncated')),
+    ('title_length', 'INTEGER', lambda r: _length(_dig(r, 'basic_info', 'title'))),
+    ('meta_description_length', 'INTEGER', lambda r: _length(_dig(r, 'basic_info', 'meta_description'))),
+    ('performance_score', 'REAL', lambda r: _dig(r, 'performance', 'performance_score')),
+    ('avg_response_time', 'REAL', lambda r: _dig(r, 'performance', 'avg_response_time')),
+    ('min_response_time', 'REAL', lambda r: _dig(r, 'performance', 'min_response_time')),
+    ('max_response_time', 'REAL', lambda r: _dig(r, 'performance', 'max_response_time')),
+    ('dns_p50', 'REAL', lambda r: _dig(r, 'performance', 'timing_breakdown', 'dns', 'p50')),
+    ('connect_p50', 'REAL', lambda r: _dig(r, 'performance', 'timing_breakdown', 'connect', 'p50')),
+    ('tls_p50', 'REAL', lambda r: _dig(r, 'performance', 'timing_breakdown', 'tls', 'p50')),
+    ('ttfb_p50', 'REAL', lambda r: _dig(r, 'performance', 'timing_breakdown', 'ttfb', 'p50')),
+    ('download_p50', 'REAL', lambda r: _dig(r, 'performance', 'timing_breakdown', 'download', 'p50')),
+    ('total_p95', 'REAL', lambda r: _dig(r, 'performance', 'timing_breakdown', 'total', 'p95')),
+    ('content_size', 'INTEGER', lambda r: _dig(r, 'performance', 'content_size')),
+    ('compression', 'INTEGER', lambda r: _dig(r, 'performance', 'compression')),
+    ('page_weight', 'INTEGER', lambda r: _dig(r, 'page_weight', 'total_bytes')),
+    ('asset_count', 'INTEGER', lambda r: _dig(r, 'page_weight', 'asset_count')),
+    ('critical_path_time', 'REAL', lambda r: _dig(r, 'page_weight', 'critical_path', 'estimated_time')),
+    ('meta_tag_count', 'INTEGER', lambda r: _length(_dig(r, 'seo_analysis', 'meta_tags'))),
+    ('h1_count', 'INTEGER', lambda r: _length(_dig(r, 'seo_analysis', 'headings', 'h1'))),
+    ('internal_links', 'INTEGER', lambda r: _dig(r, 'seo_analysis', 'links', 'internal_count')),
+    ('external_links', 'INTEGER', lambda r: _dig(r, 'seo_analysis', 'links', 'external_count')),
+    ('total_images', 'INTEGER', lambda r: _dig(r, 'seo_analysis', 'images', 'total_images')),
+    ('images_without_alt', 'INTEGER', lambda r: _dig(r, 'seo_analysis', 'images', 'images_without_alt')),
+    ('robots_txt', 'INTEGER', lambda r: _dig(r, 'seo_analysis', 'robots_txt')),
+    ('sitemap', 'INTEGER', lambda r: _dig(r, 'seo_analysis', 'sitemap')),
+    ('word_count', 'INTEGER', lambda r: _dig(r, 'content_analysis', 'word_count')),
+    ('paragraph_count', 'INTEGER', lambda r: _dig(r, 'content_analysis', 'paragraph_count')),
+    ('reading_ease', 'REAL', lambda r: _dig(r, 'content_analysis', 'reading_ease')),
+    ('https', 'INTEGER', lambda r: _dig(r, 'security_analysis', 'https')),
+    ('security_headers', 'INTEGER', lambda r: _count_true(_dig(r, 'security_analysis', 'security_headers'))),
+    ('mixed_content', 'INTEGER', lambda r: _dig(r, 'security_analysis', 'mixed_content')),
+    ('mobile_score', 'REAL', lambda r: _dig(r, 'mobile_analysis', 'mobile_friendly_score')),
+    ('viewport_meta', 'INTEGER', lambda r: _dig(r, 'mobile_analysis', 'viewport_meta')),
+    ('viewport_content', 'TEXT', lambda r: _dig(r, 'mobile_analysis', 'viewport_content')),
+    ('media_queries', 'INTEGER', lambda r: _dig(r, 'mobile_analysis', 'media_queries_count')),
+    ('total_time', 'REAL', lambda r: _dig(r, 'timings', 'total'))
+)
+
+# 모든 행에 있는 식별 열
+KEY_COLUMNS = ('host', 'analyzed_at', 'url', 'date')
+COLUMN_NAMES = KEY_COLUMNS + tuple(name for name, _, _ in COLUMNS)
+GROUP_COLUMNS = ('host', 'date', 'url')
+# 집계/백분위수/하락 조회에 쓸 수 있는 숫자 지표 열
+METRIC_COLUMNS = tuple(name for name, sql_type, _ in COLUMNS if sql_type in ('INTEGER', 'REAL'))
+
+_PARTITION_FILE = re.compile(r'^date=(\d{4}-\d{2}-\d{2})\.db$')
+
+
+def flatten_results(results):
+    """analyze_url 결과를 저장용 행(열 이름 → 값)으로 변환 (없는 값은 None)"""
+    timestamp = results.get('timestamp')
+    analyzed_at = datetime.fromisoformat(timestamp) if timestamp else datetime.now()
+    row = {
+        'host': urlparse(results['url']).netloc.lower(),
+        'analyzed_at': analyzed_at.timestamp(),
+        'url': results['url'],
+        'date': analyzed_at.strftime('%Y-%m-%d')
+    }
+    for name, _, extract in COLUMNS:
+        value = extract(results)
+        row[name] = int(value) if isinstance(value, bool) else value
+    return row
+
+
+def percentile(ordered, point):
+    """정렬된 값의 선형 보간 백분위수 (URLAnalyzer._percentiles와 같은 방식)"""
+    rank = (len(ordered) - 1) * point / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def _check_column(name, allowed=COLUMN_NAMES):
+    # 열 이름은 SQL에 직접 들어가므로 정해진 이름만 허용
+    if name not in allowed:
+        raise ValueError(f"알 수 없는 열입니다: {name}")
+    return name
+
+
+def _check_metric(name):
+    # 문자열 열(viewport_content 등)은 평균/백분위수를 낼 수 없으므로 숫자 열만 허용
+    if name not in METRIC_COLUMNS:
+        raise ValueError(f"숫자 지표 열이 아닙니다: {name}")
+    return name
+
+
+class ResultStore:
+    """날짜별로 나눈 SQLite 열 저장소 (스레드 안전)
+
+    root: 저장 디렉터리 - 날짜마다 date=YYYY-MM-DD.db 파일 하나 (조회 기간 밖의 파일은 열지 않음)
+    각 파일 안의 행은 (host, analyzed_at, url) 순서로 저장되어 호스트 조건 조회는 해당 범위만 읽음
+    """
+
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._connections = {}
+        self._lock = threading.Lock()
+
+    def _path(self, date):
+        return os.path.join(self.root, f"date={date}.db")
+
+    def _connection(self, date):
+        db = self._connections.get(date)
+        if db is None:
+            db = sqlite3.connect(self._path(date), check_same_thread=False)
+            columns = ', '.join(f"{name} {sql_type}" for name, sql_type, _ in COLUMNS)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS analyses ("
+                "host TEXT NOT NULL, analyzed_at REAL NOT NULL, url TEXT NOT NULL, date TEXT NOT NULL, "
+                f"{columns}, PRIMARY KEY (host, analyzed_at, url)) WITHOUT ROWID"
+            )
+            # 이전 버전에서 만든 파티션에는 새로 추가된 열을 붙임 (기존 행은 NULL)
+            existing = {row[1] for row in db.execute("PRAGMA table_info(analyses)")}
+            for name, sql_type, _ in COLUMNS:
+                if name not in existing:
+                    db.execute(f"ALTER TABLE analyses ADD COLUMN {name} {sql_type}")
+            db.commit()
+            self._connections[date] = db
+        return db
+
+    @contextmanager
+    def _reader(self, date):
+        with self._lock:
+            self._connection(date)  # 열 추가가 필요한 파티션이면 먼저 반영
+        db = sqlite3.connect(f"file:{self._path(date)}?mode=ro", uri=True)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def add(self, results):
+        """분석 결과 하나 저장 (오류로 끝난 분석은 저장하지 않고 False 반환)"""
+        return self.add_many([results]) == 1
+
+    def add_many(self, results_list):
+        """분석 결과 여러 개를 날짜별로 묶어 한 번에 저장하고 저장한 개수 반환"""
+        by_date = {}
+        for results in results_list:
+            if 'error' in results or 'error' in results.get('basic_info', {}):
+                continue
+            row = flatten_results(results)
+            by_date.setdefault(row['date'], []).append(tuple(row[name] for name in COLUMN_NAMES))
+
+        placeholders = ', '.join('?' for _ in COLUMN_NAMES)
+        with self._lock:
+            for date, rows in by_date.items():
+                db = self._connection(date)
+                db.executemany(
+                    f"INSERT OR REPLACE INTO analyses ({', '.join(COLUMN_NAMES)}) VALUES ({placeholders})", rows
+                )
+                db.commit()
+        return sum(len(rows) for rows in by_date.values())
+
+    def partitions(self, since=None, until=None):
+        """기간 안의 날짜 파티션 목록 (오래된 순)"""
+        dates = []
+        for filename in os.listdir(self.root):
+            match = _PARTITION_FILE.match(filename)
+            if match and (since is None or match.group(1) >= since) and (until is None or match.group(1) <= until):
+                dates.append(match.group(1))
+        return sorted(dates)
+
+    def _window(self, days, since, until):
+        """days(최근 며칠) 또는 since/until(YYYY-MM-DD)을 날짜 범위로 변환"""
+        if days is not None and since is None:
+            since = (datetime.now() - timedelta(days=days - 1)).strftime('%Y-%m-%d')
+        return since, until
+
+    def rows(self, columns=None, hosts=None, days=None, since=None, until=None):
+        """조건에 맞는 행을 오래된 날짜 파티션부터 필요한 열만 하나씩 반환하는 제너레이터"""
+        columns = [_check_column(name) for name in (columns or COLUMN_NAMES)]
+        since, until = self._window(days, since, until)
+        query = f"SELECT {', '.join(columns)} FROM analyses"
+        params = []
+        if hosts:
+            hosts = [host.lower() for host in hosts]
+            query += f" WHERE host IN ({', '.join('?' for _ in hosts)})"
+            params = hosts
+        query += " ORDER BY analyzed_at"
+
+        for date in self.partitions(since, until):
+            # 읽기는 파티션마다 별도 읽기 전용 연결의 커서로 조금씩 가져옴 (저장과 동시에 가능)
+            with self._reader(date) as db:
+                for values in db.execute(query, params):
+                    yield dict(zip(columns, values))
+
+    def summarize(self, metric, by='host', hosts=None, days=None, since=None, until=None):
+        """그룹별 개수/평균/최소/최대 - 파티션마다 SQL로 부분 집계한 뒤 합침"""
+        metric, by = _check_metric(metric), _check_column(by, GROUP_COLUMNS)
+        since, until = self._window(days, since, until)
+        query = (f"SELECT {by}, COUNT({metric}), SUM({metric}), MIN({metric}), MAX({metric}) "
+                 f"FROM analyses WHERE {metric} IS NOT NULL")
+        params = []
+        if hosts:
+            hosts = [host.lower() for host in hosts]
+            query += f" AND host IN ({', '.join('?' for _ in hosts)})"
+            params = hosts
+        query += f" GROUP BY {by}"
+
+        groups = {}
+        for date in self.partitions(since, until):
+            with self._reader(date) as db:
+                fetched = db.execute(query, params).fetchall()
+            for key, count, total, low, high in fetched:
+                group = groups.setdefault(key, {'count': 0, 'sum': 0.0, 'min': low, 'max': high})
+                group['count'] += count
+                group['sum'] += total
+                group['min'] = min(group['min'], low)
+                group['max'] = max(group['max'], high)
+        return {
+            key: {'count': group['count'], 'avg': group['sum'] / group['count'],
+                  'min': group['min'], 'max': group['max']}
+            for key, group in sorted(groups.items())
+        }
+
+    def percentiles(self, metric, by='host', points=(50, 95), hosts=None, days=None, since=None, until=None):
+        """그룹별 백분위수 (예: 최근 30일 호스트별 avg_response_time p95) - 그룹 열과 지표 열만 읽음"""
+        metric, by = _check_metric(metric), _check_column(by, GROUP_COLUMNS)
+        if not points or not all(0 <= point <= 100 for point in points):
+            raise ValueError("백분위수는 0에서 100 사이여야 합니다")
+        values = {}
+        for row in self.rows([by, metric], hosts=hosts, days=days, since=since, until=until):
+            if row[metric] is not None:
+                values.setdefault(row[by], []).append(row[metric])
+        result = {}
+        for key, group_values in sorted(values.items()):
+            group_values.sort()
+            result[key] = {'count': len(group_values)}
+            for point in points:
+                result[key][f'p{point}'] = percentile(group_values, point)
+        return result
+
+    def score_drops(self, metric='performance_score', min_drop=0.0, baseline='previous', hosts=None,
+                    days=None, since=None, until=None, limit=100):
+        """기간 안에서 지표가 떨어진 페이지 (많이 떨어진 순)
+
+        baseline: 'previous'면 직전 분석과, 'first'면 기간 안의 첫 분석과 최근 분석을 비교
+        """
+        metric = _check_metric(metric)
+        if baseline not in ('previous', 'first'):
+            raise ValueError("baseline은 'previous' 또는 'first'여야 합니다")
+        history = {}  # URL → [기준 (시각, 값), 최근 (시각, 값)]
+        for row in self.rows(['url', 'host', 'analyzed_at', metric], hosts=hosts, days=days,
+                             since=since, until=until):
+            if row[metric] is None:
+                continue
+            point = (row['analyzed_at'], row[metric])
+            entry = history.get(row['url'])
+            if entry is None:
+                history[row['url']] = [row['host'], None, point]
+            else:
+                if baseline == 'previous' or entry[1] is None:
+                    entry[1] = entry[2]
+                entry[2] = point
+
+        drops = []
+        for url, (host, before, after) in history.items():
+            if before is None or before[1] - after[1] <= min_drop:
+                continue
+            drops.append({
+                'url': url,
+                'host': host,
+                'before': before[1],
+                'after': after[1],
+                'drop': before[1] - after[1],
+                'before_at': datetime.fromtimestamp(before[0]).isoformat(),
+                'after_at': datetime.fromtimestamp(after[0]).isoformat()
+            })
+        drops.sort(key=lambda item: item['drop'], reverse=True)
+        return drops[:limit]
+
+    def close(self):
+        with self._lock:
+            for db in self._connections.values():
+                db.close()
+            self._connections.clear()
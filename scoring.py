@@ -0,0 +1,151 @@
+"""
+점수 일괄 계산 - 성능/모바일/SEO/보안 점수를 NumPy 배열 연산으로 한 번에 계산
+가중치를 바꾼 뒤 저장된 이력(result_store)을 다시 채점할 때 사용하며, 결과는 URLAnalyzer의 점수 계산과 같음
+(python scoring.py - 일괄 계산과 URLAnalyzer 계산 결과 비교)
+
+입력 열 이름은 result_store의 열과 같음:
+    avg_response_time, content_size, ttfb_p50 (없으면 NaN) → performance_score
+    viewport_content, media_queries → mobile_score
+    meta_tag_count → seo_score
+    https → security_score
+"""
+
+import sys
+
+from main import URLAnalyzer, merge_score_weights
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("NumPy가 설치되지 않아 점수 일괄 계산을 사용할 수 없습니다.")
+
+# 점수별로 필요한 입력 열
+SCORE_INPUTS = {
+    'performance_score': ('avg_response_time', 'content_size', 'ttfb_p50'),
+    'mobile_score': ('viewport_content', 'media_queries'),
+    'seo_score': ('meta_tag_count',),
+    'security_score': ('https',)
+}
+
+
+def _floats(values):
+    # None은 NaN이 됨 (ttfb가 없는 행, 값이 없는 열)
+    return np.asarray(values, dtype=np.float64)
+
+
+def performance_scores(avg_response_time, content_size, ttfb=None, weights=None):
+    """URLAnalyzer._calculate_performance_score와 같은 식 (ttfb가 NaN인 행은 첫 바이트 시간 제외)"""
+    weights = merge_score_weights(weights)['performance']
+    avg_time = _floats(avg_response_time)
+    size = _floats(content_size)
+    size_score = np.maximum(0, 100 - (size / 1024 / 1024) * weights['size_penalty_per_mb'])
+    time_score = np.maximum(0, 100 - avg_time * weights['time_penalty_per_second'])
+    if ttfb is not None:
+        ttfb = _floats(ttfb)
+        with_ttfb = (time_score + np.maximum(0, 100 - ttfb * weights['ttfb_penalty_per_second'])) / 2
+        time_score = np.where(np.isnan(ttfb), time_score, with_ttfb)
+    return (size_score + time_score) / 2
+
+
+def mobile_scores(viewport_content, media_queries, weights=None):
+    """URLAnalyzer._calculate_mobile_score와 같은 식"""
+    weights = merge_score_weights(weights)['mobile']
+    content = np.array(['' if value is None else value for value in viewport_content], dtype=str)
+    has_viewport = np.char.str_len(content) > 0
+    device_width = has_viewport & (np.char.find(content, 'width=device-width') >= 0)
+    media = np.nan_to_num(_floats(media_queries)) > 0
+    score = (np.where(has_viewport, weights['viewport'], 0)
+             + np.where(device_width, weights['device_width'], 0)
+             + np.where(media, weights['media_queries'], 0))
+    return np.minimum(score, 100)
+
+
+def seo_scores(meta_tag_count, weights=None):
+    """create_dashboard_data의 SEO 점수와 같은 식"""
+    return np.nan_to_num(_floats(meta_tag_count)) * merge_score_weights(weights)['seo']['meta_tag']
+
+
+def security_scores(https, weights=None):
+    """create_dashboard_data의 보안 점수와 같은 식"""
+    weights = merge_score_weights(weights)['security']
+    secure = np.nan_to_num(_floats(https)) != 0
+    return np.where(secure, weights['https'], weights['http'])
+
+
+def score_batch(metrics, weights=None, scores=None):
+    """원시 지표(열 이름 → 배열/목록, 또는 pandas DataFrame)로 점수를 한 번에 계산
+
+    scores: 계산할 점수 이름 (None이면 입력 열이 모두 있는 점수 전부)
+    반환: 점수 이름 → NumPy 배열 (DataFrame을 넣으면 같은 인덱스의 DataFrame)
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("점수 일괄 계산을 사용하려면 NumPy를 설치해주세요 (pip install numpy)")
+    columns = set(metrics.columns) if hasattr(metrics, 'columns') else set(metrics)
+    if scores is None:
+        scores = [name for name, inputs in SCORE_INPUTS.items()
+                  if set(inputs) <= columns or (name == 'performance_score' and set(inputs[:2]) <= columns)]
+
+    def column(name):
+        values = metrics[name]
+        return values.to_numpy() if hasattr(values, 'to_numpy') else values
+
+    result = {}
+    for name in scores:
+        if name == 'performance_score':
+            result[name] = performance_scores(column('avg_response_time'), column('content_size'),
+                                              column('ttfb_p50') if 'ttfb_p50' in columns else None, weights)
+        elif name == 'mobile_score':
+            result[name] = mobile_scores(column('viewport_content'), column('media_queries'), weights)
+        elif name == 'seo_score':
+            result[name] = seo_scores(column('meta_tag_count'), weights)
+        elif name == 'security_score':
+            result[name] = security_scores(column('https'), weights)
+        else:
+            raise ValueError(f"알 수 없는 점수입니다: {name}")
+
+    if hasattr(metrics, 'columns'):
+        return type(metrics)(result, index=metrics.index)
+    return result
+
+
+def check_parity(count=10000, weights=None, seed=0):
+    """무작위 지표로 일괄 계산과 URLAnalyzer 계산을 비교해 점수별 불일치 행 수 반환"""
+    rng = np.random.default_rng(seed)
+    viewports = np.array(['', 'width=device-width, initial-scale=1', 'width=1024', 'initial-scale=1'])
+    metrics = {
+        'avg_response_time': rng.exponential(1.5, count).tolist(),
+        'content_size': rng.integers(0, 20 * 1024 * 1024, count).tolist(),
+        'ttfb_p50': [None if missing else value for missing, value in
+                     zip(rng.random(count) < 0.1, rng.exponential(0.5, count).tolist())],
+        'viewport_content': viewports[rng.integers(0, len(viewports), count)].tolist(),
+        'media_queries': rng.integers(0, 3, count).tolist(),
+        'meta_tag_count': rng.integers(0, 15, count).tolist(),
+        'https': (rng.random(count) < 0.7).tolist()
+    }
+    batch = score_batch(metrics, weights)
+
+    analyzer = URLAnalyzer(score_weights=weights)
+    expected = {name: [] for name in SCORE_INPUTS}
+    for i in range(count):
+        expected['performance_score'].append(analyzer._calculate_performance_score(
+            [metrics['avg_response_time'][i]], metrics['content_size'][i], ttfb=metrics['ttfb_p50'][i]))
+        expected['mobile_score'].append(analyzer._calculate_mobile_score(
+            metrics['viewport_content'][i], metrics['media_queries'][i]))
+        expected['seo_score'].append(analyzer._calculate_seo_score(metrics['meta_tag_count'][i]))
+        expected['security_score'].append(analyzer._calculate_security_score(metrics['https'][i]))
+
+    return {name: int(np.sum(batch[name] != np.array(values, dtype=np.float64)))
+            for name, values in expected.items()}
+
+
+if __name__ == "__main__":
+    failed = False
+    for label, weights in (('기본 가중치', None),
+                           ('변경한 가중치', {'performance': {'time_penalty_per_second': 35},
+                                        'mobile': {'viewport': 50}, 'security': {'http': 30}})):
+        for name, mismatches in check_parity(weights=weights).items():
+            failed = failed or mismatches > 0
+            print(f"{'❌' if mismatches else '✅'} {label} {name}: 불일치 {mismatches}건")
+    sys.exit(1 if failed else 0)
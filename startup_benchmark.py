@@ -0,0 +1,76 @@
+"""
+시작 시간 측정 - 새 프로세스에서 `import main`과 `URLAnalyzer()` 생성 시간을 재고 예산과 비교
+(python startup_benchmark.py [--runs 5] [--import-budget 0.5] [--init-budget 0.1])
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 시작 시간 예산(초) - 중앙값이 넘으면 실패
+IMPORT_BUDGET = 0.5
+INIT_BUDGET = 0.1
+
+# 측정은 매번 새 인터프리터에서 실행해 모듈 캐시의 영향을 받지 않게 함
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+main.URLAnalyzer()
+constructed = time.perf_counter()
+heavy = sorted(m for m in ('matplotlib', 'seaborn', 'pandas', 'nltk', 'textstat') if m in sys.modules)
+print(json.dumps({'import': imported - started, 'init': constructed - imported, 'heavy_modules': heavy}))
+"""
+
+
+def measure_once():
+    """새 프로세스에서 한 번 측정해 {'import', 'init', 'heavy_modules'} 반환"""
+    output = subprocess.run([sys.executable, '-c', _PROBE], cwd=PACKAGE_DIR, capture_output=True,
+                            text=True, check=True).stdout
+    # main이 출력하는 안내 메시지는 건너뛰고 마지막 줄의 결과만 사용
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run_benchmark(runs=5):
+    samples = [measure_once() for _ in range(runs)]
+    imports = sorted(sample['import'] for sample in samples)
+    inits = sorted(sample['init'] for sample in samples)
+    return {
+        'runs': runs,
+        'import_median': imports[len(imports) // 2],
+        'import_max': imports[-1],
+        'init_median': inits[len(inits) // 2],
+        'init_max': inits[-1],
+        'heavy_modules': samples[-1]['heavy_modules']
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="main.py 시작 시간 측정")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--import-budget', type=float, default=IMPORT_BUDGET)
+    parser.add_argument('--init-budget', type=float, default=INIT_BUDGET)
+    args = parser.parse_args()
+
+    result = run_benchmark(args.runs)
+    print(f"⏱️  import main: 중앙값 {result['import_median']:.3f}초 (최대 {result['import_max']:.3f}초)")
+    print(f"⏱️  URLAnalyzer(): 중앙값 {result['init_median']:.3f}초 (최대 {result['init_max']:.3f}초)")
+
+    failures = []
+    if result['import_median'] > args.import_budget:
+        failures.append(f"import 시간이 예산({args.import_budget}초)을 넘었습니다")
+    if result['init_median'] > args.init_budget:
+        failures.append(f"생성 시간이 예산({args.init_budget}초)을 넘었습니다")
+    if result['heavy_modules']:
+        failures.append(f"시작 시 불필요한 모듈을 불러왔습니다: {', '.join(result['heavy_modules'])}")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ 시작 시간 예산 이내")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,16 @@
+"""동기/비동기 엔진이 로컬 픽스처 서버에서 같은 결과를 내는지 확인 (python async_analyzer.py와 같은 검사)"""
+import pytest
+
+from async_analyzer import compare_engines
+from fixture_server import FixtureServer
+
+
+@pytest.fixture(scope='module')
+def server():
+    with FixtureServer() as server:
+        yield server
+
+
+@pytest.mark.parametrize('path', ['/', '/about.html', '/missing.html'])
+def test_engines_match(server, path):
+    assert compare_engines(server.url(path)) == []
@@ -0,0 +1,8 @@
+"""오토마톤 기술 지문 탐지가 패턴을 하나씩 검사하는 방식과 같은 결과를 내는지 확인"""
+from fingerprints import compare_engines
+
+
+def test_automaton_matches_pattern_scan():
+    mismatches = [factor for factor, result in compare_engines(factors=(1, 4), runs=1).items()
+                  if not result['match']]
+    assert not mismatches
@@ -0,0 +1,21 @@
+"""페이지 무게 분석이 확인한 자원 크기를 픽스처 파일 크기와 비교하고 자원 캐시 사용을 확인"""
+from page_weight import check_fixture_sizes, summarize_page_weight, unprobed_details
+
+
+def test_fixture_sizes_and_cache():
+    report, stats = check_fixture_sizes()
+    for path, runs in report.items():
+        for result, mismatches in runs:
+            assert 'error' not in result, f"{path}: {result.get('error')}"
+            assert mismatches == [], path
+        # 두 번째 분석은 모든 자원을 캐시에서 가져옴
+        assert runs[1][0]['cached_probes'] == runs[1][0]['asset_count'], path
+    assert stats['hits'] > 0
+
+
+def test_unprobed_assets_are_unknown_size_not_failures():
+    assets = [dict({'kind': 'script', 'render_blocking': True}, **unprobed_details('http://example.com/app.js'))]
+    result = summarize_page_weight('http://example.com/', 1000, assets)
+    assert result['unknown_size'] == 1
+    assert result['unprobed_assets'] == 1
+    assert result['failed_assets'] == 0
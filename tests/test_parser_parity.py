@@ -0,0 +1,10 @@
+"""파서 백엔드별 분석 결과가 html.parser와 같은지 확인 (python parser_parity.py와 같은 검사)"""
+from parser_parity import check_parity
+
+
+def test_backends_match_html_parser():
+    report = check_parity()
+    # lxml은 requirements.txt에 있으므로 비교할 백엔드가 하나도 없으면 설치 문제
+    assert report, "비교할 추가 파서가 설치되지 않았습니다 (pip install lxml html5lib)"
+    differences = {f'{path} [{backend}]': found for (path, backend), found in report.items() if found}
+    assert not differences
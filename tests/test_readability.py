@@ -0,0 +1,16 @@
+"""가독성 점수 확인 - 한국어 기준 문장의 문장/어절/음절 수와 영어 문서의 textstat 비교"""
+from readability import check_korean_reference, compare_with_textstat, english_corpus
+
+
+def test_korean_reference_counts():
+    assert check_korean_reference() == []
+
+
+def test_english_scores_match_textstat():
+    comparison = compare_with_textstat(english_corpus())
+    # 건너뛰지 않고 실패 - 비교 기준이 없으면 점수가 맞는지 알 수 없음
+    assert comparison is not None, \
+        "textstat 또는 NLTK cmudict 데이터가 없습니다 (pip install textstat, python -m nltk.downloader cmudict)"
+    outside = {name: {key: (ours, theirs) for key, (ours, theirs, within) in scores.items() if not within}
+               for name, scores in comparison.items()}
+    assert not {name: scores for name, scores in outside.items() if scores}
@@ -0,0 +1,13 @@
+"""일괄 점수 계산이 URLAnalyzer 계산과 같은지 확인 (기본 가중치와 변경한 가중치)"""
+import pytest
+
+from scoring import check_parity
+
+
+@pytest.mark.parametrize('weights', [
+    None,
+    {'performance': {'time_penalty_per_second': 35}, 'mobile': {'viewport': 50}, 'security': {'http': 30}},
+])
+def test_batch_scores_match_analyzer(weights):
+    mismatches = {name: count for name, count in check_parity(count=2000, weights=weights).items() if count}
+    assert not mismatches
@@ -0,0 +1,7 @@
+"""단어 통계 엔진이 이전 방식(분석기마다 따로 토큰화)과 같은 결과를 내는지 확인"""
+from text_analytics import compare_engines
+
+
+def test_engine_matches_reference():
+    mismatches = [name for name, result in compare_engines(runs=1).items() if not result['match']]
+    assert not mismatches
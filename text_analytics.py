@@ -0,0 +1,148 @@
+"""
+본문 텍스트 통계 - analyze_content와 analyze_keywords가 공유하는 단어 집계
+본문을 한 번만 소문자로 바꿔 미리 컴파일한 정규식으로 토큰화하고, 단어 빈도는 Counter 하나로 모아
+불용어 필터, 상위 단어, 키워드 밀도, 제목 키워드를 모두 그 집계에서 계산
+(python text_analytics.py - 이전 방식(분석기마다 따로 토큰화)과 결과와 시간 비교)
+"""
+
+import re
+import sys
+import time
+from collections import Counter
+
+# 단어 토큰 (\b\w+\b와 같은 결과)
+TOKEN_PATTERN = re.compile(r'\w+')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# 키워드로 보는 최소 글자 수
+MIN_KEYWORD_LENGTH = 3
+
+
+def tokenize(text):
+    """소문자 단어 목록"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class TextStats:
+    """한 페이지의 본문과 제목/설명/제목 태그 텍스트를 한 번 토큰화해 모은 단어 통계
+
+    body_counts: 본문 단어 빈도 (처음 나온 순서)
+    counts: 제목, 설명, 제목 태그, 본문 순으로 합친 단어 빈도 (처음 나온 순서)
+    불용어는 분석기마다 바꿀 수 있으므로 집계에는 넣지 않고 필터할 때 적용
+    """
+
+    def __init__(self, body, title='', description='', headings=''):
+        # 공백을 정리한 본문 (글자 수와 가독성 분석용)
+        self.text = WHITESPACE_PATTERN.sub(' ', body.strip())
+        body_words = tokenize(body)
+        self.body_counts = Counter(body_words)
+        self.title_words = tokenize(title)
+        lead_words = self.title_words + tokenize(description) + tokenize(headings)
+        self.word_total = len(lead_words) + len(body_words)
+        self.counts = Counter(lead_words)
+        self.counts.update(self.body_counts)
+        self.has_keyword_text = bool(self.text or title.strip() or description.strip() or headings.strip())
+        # 불용어와 관계없는 조건(길이, 문자만)은 서로 다른 단어마다 한 번만 확인
+        self._candidates = {word for word in self.counts if len(word) >= MIN_KEYWORD_LENGTH and word.isalpha()}
+
+    @classmethod
+    def from_facts(cls, facts):
+        """PageFacts의 본문 값(visible_*)으로 생성"""
+        return cls(facts.visible_text,
+                   title=facts.visible_title.strip() if facts.visible_title else '',
+                   description=facts.meta_content('description', visible_only=True),
+                   headings=' '.join(facts.visible_headings))
+
+    def keywords(self, stop_words, body_only=False):
+        """불용어와 짧은 단어, 문자가 아닌 토큰을 뺀 단어 빈도 (처음 나온 순서)"""
+        counts = self.body_counts if body_only else self.counts
+        candidates = self._candidates
+        return Counter({word: count for word, count in counts.items()
+                        if word in candidates and word not in stop_words})
+
+    def title_keywords(self, stop_words):
+        """제목의 단어 빈도 (불용어와 짧은 단어 제외)"""
+        keywords = {}
+        for word in self.title_words:
+            if word not in stop_words and len(word) >= MIN_KEYWORD_LENGTH:
+                keywords[word] = keywords.get(word, 0) + 1
+        return keywords
+
+    def keyword_density(self, keywords, limit=20):
+        """키워드(처음 나온 순서로 limit개)가 전체 단어에서 차지하는 비율(%)"""
+        if not self.word_total:
+            return {}
+        return {word: count / self.word_total * 100 for word, count in list(keywords.items())[:limit]}
+
+
+def _reference_analysis(body, title, description, headings, stop_words):
+    """이전 방식 - 분석기마다 텍스트를 정리하고 따로 토큰화해 집계 (비교용)"""
+    text = re.sub(r'\s+', ' ', body.strip())
+    words = re.findall(r'\b\w+\b', text.lower())
+    filtered_words = [word.lower() for word in words
+                      if len(word) > 2 and word.isalpha() and word.lower() not in stop_words]
+    content = {'word_count': len(filtered_words), 'character_count': len(text),
+               'most_common_words': dict(Counter(filtered_words).most_common(20))}
+
+    all_text = re.sub(r'\s+', ' ', f"{title} {description} {headings} {body}".lower().strip())
+    words = re.findall(r'\b\w+\b', all_text)
+    filtered_freq = {word: freq for word, freq in Counter(words).items()
+                     if len(word) > 2 and word not in stop_words and word.isalpha()}
+    title_keywords = {}
+    for word in re.findall(r'\b\w+\b', title.lower()):
+        if word not in stop_words and len(word) > 2:
+            title_keywords[word] = title_keywords.get(word, 0) + 1
+    keywords = {'total_words': len(words), 'unique_words': len(set(words)),
+                'keyword_density': {word: freq / len(words) * 100 for word, freq in list(filtered_freq.items())[:20]},
+                'top_keywords': dict(Counter(filtered_freq).most_common(20)), 'title_keywords': title_keywords}
+    return content, keywords
+
+
+def _engine_analysis(body, title, description, headings, stop_words):
+    stats = TextStats(body, title, description, headings)
+    body_keywords = stats.keywords(stop_words, body_only=True)
+    content = {'word_count': sum(body_keywords.values()), 'character_count': len(stats.text),
+               'most_common_words': dict(body_keywords.most_common(20))}
+    keywords = stats.keywords(stop_words)
+    keywords = {'total_words': stats.word_total, 'unique_words': len(stats.counts),
+                'keyword_density': stats.keyword_density(keywords),
+                'top_keywords': dict(keywords.most_common(20)), 'title_keywords': stats.title_keywords(stop_words)}
+    return content, keywords
+
+
+def compare_engines(runs=5):
+    """벤치마크 페이지 묶음으로 이전 방식과 결과를 비교하고 페이지별 소요 시간(초, 최솟값) 반환"""
+    import tempfile
+    from benchmark import build_corpus
+    from main import URLAnalyzer, PageFacts, DEFAULT_PARSER
+    from bs4 import BeautifulSoup
+
+    stop_words = URLAnalyzer().stop_words
+    report = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, path in build_corpus(directory).items():
+            with open(directory + path, encoding='utf-8') as f:
+                facts = PageFacts(BeautifulSoup(f.read(), DEFAULT_PARSER))
+            args = (facts.visible_text, facts.visible_title.strip() if facts.visible_title else '',
+                    facts.meta_content('description', visible_only=True), ' '.join(facts.visible_headings), stop_words)
+            timings = {}
+            outputs = {}
+            for label, analysis in (('reference', _reference_analysis), ('engine', _engine_analysis)):
+                samples = []
+                for _ in range(runs):
+                    started = time.perf_counter()
+                    outputs[label] = analysis(*args)
+                    samples.append(time.perf_counter() - started)
+                timings[label] = min(samples)
+            report[name] = dict(timings, match=outputs['reference'] == outputs['engine'])
+    return report
+
+
+if __name__ == "__main__":
+    failed = False
+    for name, result in compare_engines().items():
+        failed = failed or not result['match']
+        speedup = result['reference'] / result['engine'] if result['engine'] else 0
+        print(f"{'✅' if result['match'] else '❌'} {name}: 이전 방식 {result['reference'] * 1000:.1f}ms → "
+              f"{result['engine'] * 1000:.1f}ms ({speedup:.1f}배)")
+    sys.exit(1 if failed else 0)